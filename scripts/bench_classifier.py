@@ -0,0 +1,93 @@
+#!/usr/bin/env python3
+"""
+Benchmark the precompiled KeywordClassifier against the reference
+determine_pos / determine_semantic_category functions.
+
+Every entry is classified both ways; the run fails if any result differs.
+
+Usage:
+    python scripts/bench_classifier.py                      # fetch the OpenScriptures dictionary
+    python scripts/bench_classifier.py --source dict.js     # local copy of the dictionary
+    python scripts/bench_classifier.py --vocabulary src/data/vocabulary.json
+"""
+
+import argparse
+import json
+import os
+import sys
+import time
+import urllib.request
+
+from build_io import load_script
+from classifier import FEMININE_KEYWORDS, KeywordClassifier
+from strongs_stream import iter_strongs_dictionary
+
+def load_entries(args: argparse.Namespace, vocab) -> list[tuple[str, str, str]]:
+    """(strongs_def, derivation, definition) triples for every entry."""
+    if args.vocabulary:
+        with open(args.vocabulary, encoding='utf-8') as f:
+            words = json.load(f)["words"]
+        # The combined definition is all that survives in the app format
+        return [(w["definition"], "", w["definition"]) for w in words]
+
+    source = args.source or vocab.OPENSCRIPTURES_URL
+    if os.path.exists(source):
+        stream = open(source, 'rb')
+    else:
+        stream = urllib.request.urlopen(source)
+    triples = []
+    with stream:
+        for _, entry in iter_strongs_dictionary(stream):
+            strongs_def = entry.get('strongs_def', '')
+            kjv_def = entry.get('kjv_def', '')
+            derivation = entry.get('derivation', '')
+            definition = f"{strongs_def}. {kjv_def}".strip('. ') or derivation
+            triples.append((strongs_def, derivation, definition))
+    return triples
+
+def reference(vocab, strongs_def: str, derivation: str, definition: str) -> tuple[str, str, str]:
+    pos = vocab.determine_pos(strongs_def, derivation)
+    category = vocab.determine_semantic_category(definition, "")
+    gender = "feminine" if any(w in definition.lower() for w in FEMININE_KEYWORDS) else "masculine"
+    return pos, category, gender
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--source", help="Path or URL of strongs-hebrew-dictionary.js")
+    parser.add_argument("--vocabulary", help="Use definitions from a vocabulary.json instead")
+    parser.add_argument("--repeat", type=int, default=5, help="Timed passes per implementation")
+    args = parser.parse_args()
+
+    vocab = load_script("fetch-vocabulary")
+    entries = load_entries(args, vocab)
+    print(f"Classifying {len(entries)} entries, best of {args.repeat} passes")
+
+    start = time.perf_counter()
+    classifier = KeywordClassifier()
+    build_ms = (time.perf_counter() - start) * 1000
+
+    mismatches = 0
+    for triple in entries:
+        if tuple(classifier.classify(*triple)) != reference(vocab, *triple):
+            mismatches += 1
+
+    def best_of(fn) -> float:
+        best = float('inf')
+        for _ in range(args.repeat):
+            start = time.perf_counter()
+            for triple in entries:
+                fn(*triple)
+            best = min(best, time.perf_counter() - start)
+        return best
+
+    ref_s = best_of(lambda *t: reference(vocab, *t))
+    new_s = best_of(classifier.classify)
+
+    print(f"  Reference functions: {ref_s * 1000:8.1f} ms")
+    print(f"  KeywordClassifier:   {new_s * 1000:8.1f} ms  (+{build_ms:.1f} ms one-time compile)")
+    print(f"  Speedup:             {ref_s / new_s:8.2f}x")
+    print(f"  Mismatches:          {mismatches}")
+    return 1 if mismatches else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
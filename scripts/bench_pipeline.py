@@ -0,0 +1,428 @@
+#!/usr/bin/env python3
+"""
+Benchmark the vocabulary and verse pipelines on synthetic corpora.
+
+For each size, a Strong's-style dictionary and a set of bolls.life-style
+chapter payloads are generated (deterministically, from --seed) and served
+from a local HTTP file server. These stages are then measured:
+    parse           fetch_openscriptures_data() streaming from the server
+    transform       transform_to_app_format() over all entries, including the sort
+    transformEntry  transform_entry() per entry
+    extractGloss    extract_gloss() per definition
+    classifier      KeywordClassifier.classify() per entry
+    classifierRef   determine_pos() + determine_semantic_category() per entry
+    serialize       json.dumps of the vocabulary output
+    searchIndex     build_search_index() over the transformed words
+    searchQuery     SearchIndex.search() per query (Hebrew, transliteration
+                    and English prefixes of 1-4 characters)
+    chapterFetch    prefetch_chapters() for every chapter, latency per request
+    verseBuild      build_verse_entries() over every verse
+
+Each stage records throughput (items/s), latency percentiles (per item, or
+per request for chapterFetch, or per run for whole-corpus stages) and the
+peak memory it allocated on top of what was already live.
+
+Usage:
+    python scripts/bench_pipeline.py                           # 10k, 100k and 1M entries
+    python scripts/bench_pipeline.py --sizes 10k --save base.json
+    python scripts/bench_pipeline.py --sizes 10k --compare base.json
+
+With --compare the run exits non-zero if any stage's throughput dropped, or
+its peak memory grew, by more than --threshold relative to the baseline.
+"""
+
+import argparse
+import contextlib
+import functools
+import io
+import json
+import os
+import platform
+import random
+import sys
+import threading
+import time
+import tracemalloc
+from http.server import SimpleHTTPRequestHandler, ThreadingHTTPServer
+from typing import Callable, Iterable, Iterator
+
+from build_io import REPO_ROOT, load_script, write_atomic
+from classifier import KeywordClassifier
+from pipeline_profile import LatencyHistogram, Profiler
+from search_index import SearchIndex, build_search_index, fold_latin
+
+CORPUS_DIR = os.path.join(REPO_ROOT, ".cache", "bench")
+
+BENCH_VERSION = 1
+# Bump when the generated corpora change shape, so cached copies are rebuilt
+CORPUS_VERSION = 2
+DEFAULT_SIZES = (10_000, 100_000, 1_000_000)
+VERSES_PER_CHAPTER = 30
+
+DEFINITIONS = [
+    "to create, shape, form", "father, chief, ancestor", "a woman, wife, female",
+    "upon, over, above", "and, also, even", "he, she, it", "behold!, lo", "slowly, gently",
+    "the holy mountain", "a large city, town", "to go, walk, come", "good, pleasant, agreeable",
+    "a sacrifice, offering", "the heart, mind, understanding", "water, waters", "a king, ruler",
+    "to be, become, come to pass", "a son, grandson, child", "the house, household, family",
+]
+KJV_EXTRAS = ["(fore-) father(-less)", "{and} immediate", "[idiom] greatly", "x surely", "many, much"]
+DERIVATIONS = ["a primitive root", "a primitive word", "from H{n}", "(Aramaic) corresponding to H{n}", ""]
+HEBREW_LETTERS = "אבגדהוזחטיכלמנסעפצקרשת"
+VOWELS = "ְִֵֶַָֹֻּ"
+TRANSLIT_LETTERS = "ʼbgdhwzchtykl mnsʻptsqrshtâêîôû"
+
+def parse_size(text: str) -> int:
+    """"10k" -> 10000, "1M" -> 1000000."""
+    multiplier = {"k": 1_000, "m": 1_000_000}.get(text[-1:].lower(), 1)
+    return int(float(text[:-1] if multiplier > 1 else text) * multiplier)
+
+def format_size(count: int) -> str:
+    for suffix, unit in (("M", 1_000_000), ("k", 1_000)):
+        if count >= unit and count % unit == 0:
+            return f"{count // unit}{suffix}"
+    return str(count)
+
+# ----------------------------------------------------------------------------
+# Synthetic corpora
+# ----------------------------------------------------------------------------
+
+def synthetic_entries(count: int, seed: int = 0) -> Iterator[tuple[str, dict]]:
+    """`count` Strong's-style `(strongs_num, entry)` pairs, the same for a given seed."""
+    rng = random.Random(seed)
+    for n in range(1, count + 1):
+        letters = rng.choices(HEBREW_LETTERS, k=rng.randint(2, 5))
+        lemma = "".join(c + rng.choice(VOWELS) for c in letters)
+        strongs_def = ", ".join(rng.sample(DEFINITIONS, rng.randint(1, 2)))
+        kjv_def = ", ".join(rng.sample(KJV_EXTRAS, rng.randint(0, 3)))
+        yield f"H{n}", {
+            "lemma": lemma,
+            "xlit": "".join(rng.choices(TRANSLIT_LETTERS, k=rng.randint(3, 8))),
+            "pron": "",
+            "derivation": rng.choice(DERIVATIONS).format(n=rng.randint(1, count)),
+            "strongs_def": strongs_def,
+            "kjv_def": kjv_def,
+        }
+
+def write_dictionary(path: str, entries: Iterable[tuple[str, dict]]) -> None:
+    """Write entries in the strongs-hebrew-dictionary.js layout, streaming."""
+    with open(path + ".tmp", 'w', encoding='utf-8') as f:
+        f.write("var strongsHebrewDictionary = {")
+        for i, (strongs_num, entry) in enumerate(entries):
+            f.write(("," if i else "") + f'\n"{strongs_num}":' + json.dumps(entry, ensure_ascii=False))
+        f.write("\n};\nmodule.exports = strongsHebrewDictionary;\n")
+    os.replace(path + ".tmp", path)
+
+def chapter_plan(verse_count: int, books: list[str]) -> list[tuple[str, int]]:
+    """(book, chapter) pairs covering `verse_count` verses, spread across `books`."""
+    chapters = -(-verse_count // VERSES_PER_CHAPTER)
+    return [(books[i % len(books)], i // len(books) + 1) for i in range(chapters)]
+
+def write_chapters(root: str, verses_mod, plan: list[tuple[str, int]], seed: int = 0) -> None:
+    """One bolls.life-style JSON payload per chapter, laid out so the file server answers chapter URLs."""
+    rng = random.Random(seed)
+    words = ["".join(rng.choices(HEBREW_LETTERS, k=rng.randint(2, 6))) for _ in range(500)]
+    for book, chapter in plan:
+        path = os.path.join(root, "get-text", "WLC", str(verses_mod.BOOK_NUMBERS[book]), str(chapter))
+        os.makedirs(path, exist_ok=True)
+        payload = [
+            {"pk": v, "verse": v, "text": " ".join(rng.choices(words, k=rng.randint(6, 18)))}
+            for v in range(1, VERSES_PER_CHAPTER + 1)
+        ]
+        with open(os.path.join(path, "index.html"), 'w', encoding='utf-8') as f:
+            json.dump(payload, f, ensure_ascii=False)
+
+def prepare_corpus(count: int, seed: int, verses_mod, corpus_dir: str | None = None) -> tuple[str, list]:
+    """Generate (or reuse) the corpus for `count` entries; returns its directory and the chapter plan."""
+    root = os.path.join(corpus_dir or CORPUS_DIR, f"{format_size(count)}-seed{seed}")
+    plan = chapter_plan(count, list(verses_mod.BOOK_NUMBERS))
+    marker = os.path.join(root, "corpus.json")
+    expected = {"version": CORPUS_VERSION, "count": count, "seed": seed}
+    try:
+        with open(marker, encoding='utf-8') as f:
+            if json.load(f) == expected:
+                return root, plan
+    except (OSError, ValueError):
+        pass
+
+    print(f"  Generating {format_size(count)} corpus in {root}...")
+    os.makedirs(root, exist_ok=True)
+    write_dictionary(os.path.join(root, "strongs-hebrew-dictionary.js"), synthetic_entries(count, seed))
+    write_chapters(root, verses_mod, plan, seed)
+    write_atomic(marker, json.dumps(expected).encode('utf-8'))
+    return root, plan
+
+class QuietHandler(SimpleHTTPRequestHandler):
+    def log_message(self, *args):
+        pass
+
+class BenchServer(ThreadingHTTPServer):
+    # The default backlog of 5 makes concurrent connects stall on SYN retries
+    request_queue_size = 128
+
+@contextlib.contextmanager
+def file_server(root: str):
+    """Serve `root` over HTTP on a free local port; yields the base URL."""
+    httpd = BenchServer(('127.0.0.1', 0), functools.partial(QuietHandler, directory=root))
+    thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+    thread.start()
+    try:
+        yield f"http://127.0.0.1:{httpd.server_address[1]}"
+    finally:
+        httpd.shutdown()
+        httpd.server_close()
+
+# ----------------------------------------------------------------------------
+# Measurement
+# ----------------------------------------------------------------------------
+
+def measure_peak(fn: Callable[[], object]) -> int:
+    """Bytes allocated by `fn` at its peak, beyond what was live before it ran."""
+    tracemalloc.start()
+    try:
+        before = tracemalloc.get_traced_memory()[0]
+        fn()
+        return tracemalloc.get_traced_memory()[1] - before
+    finally:
+        tracemalloc.stop()
+
+def run_stage(
+    run: Callable[[LatencyHistogram | None], int],
+    trace_memory: bool = True,
+    repeat: int = 1,
+) -> dict:
+    """
+    Time `run`, which performs the stage, records latencies in the histogram
+    it is given (if any) and returns the number of items processed. The
+    fastest of `repeat` runs is reported. Peak memory is taken from a
+    separate traced run without latency recording.
+    """
+    best = None
+    for _ in range(max(1, repeat)):
+        histogram = LatencyHistogram()
+        start = time.perf_counter()
+        items = run(histogram)
+        seconds = time.perf_counter() - start
+        if best is None or seconds < best[0]:
+            best = (seconds, items, histogram)
+    seconds, items, histogram = best
+    h = histogram.to_dict()
+    result = {
+        "items": items,
+        "seconds": round(seconds, 6),
+        "throughput": round(items / seconds, 1) if seconds else 0.0,
+        "p50Ms": h["p50Ms"],
+        "p90Ms": h["p90Ms"],
+        "p99Ms": h["p99Ms"],
+        "maxMs": h["maxMs"],
+    }
+    if trace_memory:
+        result["peakBytes"] = measure_peak(lambda: run(None))
+    return result
+
+def per_item(fn: Callable, items: list) -> Callable[[LatencyHistogram | None], int]:
+    """Stage runner that calls `fn(*item)` for every item, timing each call."""
+    def run(histogram: LatencyHistogram | None) -> int:
+        if histogram is None:
+            for item in items:
+                fn(*item)
+            return len(items)
+        clock = time.perf_counter
+        samples = []
+        for item in items:
+            start = clock()
+            fn(*item)
+            samples.append(clock() - start)
+        for s in samples:
+            histogram.observe(s)
+        return len(items)
+    return run
+
+def whole(fn: Callable[[], int]) -> Callable[[LatencyHistogram | None], int]:
+    """Stage runner for a single whole-corpus call; `fn` returns the item count."""
+    def run(histogram: LatencyHistogram | None) -> int:
+        start = time.perf_counter()
+        count = fn()
+        if histogram is not None:
+            histogram.observe(time.perf_counter() - start)
+        return count
+    return run
+
+def search_queries(words: list[dict], seed: int, count: int = 2000) -> list[tuple[str]]:
+    """What a user types into the search box: 1-4 character prefixes of real keys."""
+    rng = random.Random(seed)
+    queries = []
+    for word in rng.choices(words, k=count):
+        kind = rng.randrange(3)
+        text = word["hebrew"] if kind == 0 else fold_latin(word["transliteration"] if kind == 1 else word["gloss"])
+        queries.append((text[:rng.randint(1, 4)],))
+    return queries
+
+def bench_size(count: int, seed: int, trace_memory: bool, stages: set[str] | None = None, repeat: int = 1) -> dict:
+    """Run every stage against the corpus of `count` entries."""
+    vocab = load_script('fetch-vocabulary')
+    verses_mod = load_script('fetch-verses')
+    root, plan = prepare_corpus(count, seed, verses_mod)
+    results = {}
+
+    def stage(name: str, run: Callable[[LatencyHistogram | None], int]) -> None:
+        if stages and name not in stages:
+            return
+        # The pipeline's own progress lines would drown out the results
+        with contextlib.redirect_stdout(io.StringIO()):
+            results[name] = run_stage(run, trace_memory, repeat)
+        r = results[name]
+        line = f"  {name:15} {r['throughput']:12,.0f} items/s   p50 {r['p50Ms']:8.3f} ms   p99 {r['p99Ms']:8.3f} ms"
+        if "peakBytes" in r:
+            line += f"   peak {r['peakBytes'] / 1024 / 1024:8.1f} MB"
+        print(line)
+
+    entries = list(synthetic_entries(count, seed))
+    definitions = []
+    for _, entry in entries:
+        definition = f"{entry['strongs_def']}. {entry['kjv_def']}".strip('. ') or entry['derivation']
+        definitions.append((entry['strongs_def'], entry['derivation'], definition))
+
+    source_url = vocab.OPENSCRIPTURES_URL
+    with file_server(root) as base_url:
+        vocab.OPENSCRIPTURES_URL = f"{base_url}/strongs-hebrew-dictionary.js"
+
+        def parse(histogram: LatencyHistogram | None) -> int:
+            if histogram is None:
+                return sum(1 for _ in vocab.fetch_openscriptures_data())
+            n = 0
+            clock = time.perf_counter
+            start = clock()
+            for _ in vocab.fetch_openscriptures_data():
+                now = clock()
+                histogram.observe(now - start)
+                start = now
+                n += 1
+            return n
+
+        def fetch_chapters(profiler: Profiler | None = None) -> int:
+            verses_mod.CHAPTER_CACHE.clear()
+            selections = [(book, chapter, 1, 1, [], "") for book, chapter in plan]
+            return verses_mod.prefetch_chapters(
+                selections, f"{base_url}/get-text/WLC", workers=8, per_host=8, rate=0, profiler=profiler,
+            )
+
+        def chapter_fetch(histogram: LatencyHistogram | None) -> int:
+            if histogram is None:
+                return fetch_chapters()
+            profiler = Profiler("bench")
+            requested = fetch_chapters(profiler)
+            for ms in profiler.histogram("chapterFetch").samples:
+                histogram.observe(ms / 1000)
+            return requested
+
+        def serialize() -> int:
+            json.dumps({"words": words}, ensure_ascii=False, indent=2)
+            return len(words)
+
+        def verse_build() -> int:
+            if not verses_mod.CHAPTER_CACHE:
+                fetch_chapters()
+            return len(verses_mod.build_verse_entries(verse_selections))
+
+        classifier = KeywordClassifier()
+        stage("parse", parse)
+        stage("transform", whole(lambda: len(vocab.transform_to_app_format(iter(entries)))))
+        stage("transformEntry", per_item(vocab.transform_entry, entries))
+        stage("extractGloss", per_item(vocab.extract_gloss, [(d[2],) for d in definitions]))
+        stage("classifier", per_item(classifier.classify, definitions))
+        stage("classifierRef", per_item(
+            lambda s, d, definition: (vocab.determine_pos(s, d), vocab.determine_semantic_category(definition, "")),
+            definitions,
+        ))
+
+        if not stages or stages & {"serialize", "searchIndex", "searchQuery"}:
+            words = vocab.transform_to_app_format(iter(entries))
+            stage("serialize", whole(serialize))
+            stage("searchIndex", whole(lambda: len(build_search_index(words)["ids"])))
+            if not stages or "searchQuery" in stages:
+                index = SearchIndex(build_search_index(words))
+                stage("searchQuery", per_item(index.search, search_queries(words, seed)))
+                del index
+            del words
+
+        verses_mod.CHAPTER_CACHE.clear()
+        stage("chapterFetch", chapter_fetch)
+        verse_selections = [
+            (book, chapter, v, 1, [], "") for book, chapter in plan for v in range(1, VERSES_PER_CHAPTER + 1)
+        ][:count]
+        stage("verseBuild", whole(verse_build))
+        verses_mod.CHAPTER_CACHE.clear()
+        vocab.OPENSCRIPTURES_URL = source_url
+
+    return results
+
+# ----------------------------------------------------------------------------
+# Baselines
+# ----------------------------------------------------------------------------
+
+def compare(current: dict, baseline: dict, threshold: float) -> list[str]:
+    """Human-readable regressions of `current` against `baseline`."""
+    regressions = []
+    for size, stages in current["sizes"].items():
+        for name, result in stages.items():
+            base = baseline.get("sizes", {}).get(size, {}).get(name)
+            if not base:
+                continue
+            if base["throughput"] and result["throughput"] < base["throughput"] * (1 - threshold):
+                change = result["throughput"] / base["throughput"] - 1
+                regressions.append(f"{format_size(int(size))} {name}: throughput "
+                                   f"{base['throughput']:,.0f} -> {result['throughput']:,.0f} items/s ({change:+.0%})")
+            # Ignore growth below 1 MB; small stages are dominated by allocator noise
+            if "peakBytes" in result and "peakBytes" in base:
+                grown = result["peakBytes"] - base["peakBytes"]
+                if grown > max(base["peakBytes"] * threshold, 1024 * 1024):
+                    regressions.append(f"{format_size(int(size))} {name}: peak memory "
+                                       f"{base['peakBytes'] / 1024 / 1024:.1f} -> {result['peakBytes'] / 1024 / 1024:.1f} MB")
+    return regressions
+
+def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Benchmark the vocabulary and verse pipelines on synthetic corpora.")
+    parser.add_argument("--sizes", default=",".join(format_size(s) for s in DEFAULT_SIZES),
+                        help="Comma-separated corpus sizes, e.g. 10k,100k,1M")
+    parser.add_argument("--seed", type=int, default=0, help="Seed for the synthetic corpora")
+    parser.add_argument("--stages", default=None, help="Comma-separated stages to run (default: all)")
+    parser.add_argument("--repeat", type=int, default=3, help="Runs per stage; the fastest is reported")
+    parser.add_argument("--no-memory", action="store_true", help="Skip the tracemalloc pass for peak memory")
+    parser.add_argument("--save", default=None, help="Write results as JSON to this path (e.g. a new baseline)")
+    parser.add_argument("--compare", default=None, help="Baseline JSON to check for regressions")
+    parser.add_argument("--threshold", type=float, default=0.2, help="Allowed relative slowdown or memory growth")
+    return parser.parse_args(argv)
+
+def main(argv: list[str] | None = None) -> int:
+    args = parse_args(argv)
+    stages = set(args.stages.split(",")) if args.stages else None
+    report = {
+        "version": BENCH_VERSION,
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "seed": args.seed,
+        "sizes": {},
+    }
+    for size in (parse_size(s) for s in args.sizes.split(",")):
+        print(f"\n{format_size(size)} entries:")
+        report["sizes"][str(size)] = bench_size(size, args.seed, not args.no_memory, stages, args.repeat)
+
+    if args.save:
+        write_atomic(args.save, json.dumps(report, indent=2).encode('utf-8'))
+        print(f"\nWrote results to {args.save}")
+
+    if args.compare:
+        with open(args.compare, encoding='utf-8') as f:
+            baseline = json.load(f)
+        regressions = compare(report, baseline, args.threshold)
+        print(f"\nCompared with {args.compare} (threshold {args.threshold:.0%}):")
+        for line in regressions:
+            print(f"  REGRESSION {line}")
+        if not regressions:
+            print("  No regressions")
+        return 1 if regressions else 0
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,83 @@
+#!/usr/bin/env python3
+"""
+Measure the memory the transformed vocabulary holds as compact Word records
+(word_model.py) against the same words as dicts in the JSON shape.
+
+Synthetic Strong's entries (see bench_pipeline.py) are generated at
+multiples of the real vocabulary size. For each size the entries are
+transformed twice, with transform_records() and with
+transform_to_app_format(), and tracemalloc reports the memory retained by
+the result and the peak reached while building it.
+
+Usage:
+    python scripts/bench_word_model.py                      # 1x, 10x and 100x
+    python scripts/bench_word_model.py --scales 10 --base 8674
+"""
+
+import argparse
+import gc
+import json
+import sys
+import time
+import tracemalloc
+from typing import Callable
+
+import hebrew_text
+from bench_pipeline import format_size, synthetic_entries
+from build_io import VOCABULARY_PATH, load_script
+
+DEFAULT_BASE = 8674
+
+def vocabulary_size() -> int:
+    """Words in the current vocabulary.json, the 1x size."""
+    try:
+        with open(VOCABULARY_PATH, encoding='utf-8') as f:
+            return len(json.load(f)["words"])
+    except (OSError, ValueError):
+        return DEFAULT_BASE
+
+def measure(build: Callable[[], list]) -> tuple[int, int, float]:
+    """Bytes retained by build()'s result, the peak while building it, and the seconds taken."""
+    # Start from empty pronunciation caches so neither run is charged for the other's
+    for fn in (hebrew_text.normalize_hebrew, hebrew_text.to_academic_transliteration,
+               hebrew_text.to_simple_transliteration, hebrew_text.syllabify):
+        fn.cache_clear()
+    gc.collect()
+    tracemalloc.start()
+    try:
+        before = tracemalloc.get_traced_memory()[0]
+        start = time.perf_counter()
+        result = build()
+        seconds = time.perf_counter() - start
+        gc.collect()
+        current, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    del result
+    return current - before, peak - before, seconds
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--scales", default="1,10,100", help="Comma-separated multiples of the base size")
+    parser.add_argument("--base", type=int, default=None, help="Entries at 1x (default: words in vocabulary.json)")
+    parser.add_argument("--seed", type=int, default=0, help="Seed for the synthetic entries")
+    args = parser.parse_args(argv)
+
+    vocab = load_script('fetch-vocabulary')
+    base = args.base or vocabulary_size()
+    mb = lambda n: n / 1024 / 1024
+    for scale in (int(s) for s in args.scales.split(",")):
+        count = base * scale
+        entries = list(synthetic_entries(count, args.seed))
+        print(f"\n{scale}x ({format_size(count)} entries):")
+        results = {}
+        for name, transform in (("dicts", vocab.transform_to_app_format), ("records", vocab.transform_records)):
+            results[name] = retained, peak, seconds = measure(lambda: transform(iter(entries)))
+            print(f"  {name:8} retained {mb(retained):8.1f} MB ({retained / count:6.0f} B/word)   "
+                  f"peak {mb(peak):8.1f} MB   {seconds:6.1f} s")
+        print(f"  Records retain {1 - results['records'][0] / results['dicts'][0]:.0%} less")
+        del entries
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
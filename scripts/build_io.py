@@ -0,0 +1,65 @@
+"""
+Paths and file helpers shared by the data build scripts.
+"""
+
+import importlib.util
+import os
+import sys
+import tempfile
+from contextlib import contextmanager
+from types import ModuleType
+from typing import IO, Iterator
+
+SCRIPTS_DIR = os.path.dirname(os.path.abspath(__file__))
+REPO_ROOT = os.path.join(SCRIPTS_DIR, "..")
+DATA_DIR = os.path.join(REPO_ROOT, "src", "data")
+PUBLIC_DATA_DIR = os.path.join(REPO_ROOT, "public", "data")
+VOCABULARY_PATH = os.path.join(DATA_DIR, "vocabulary.json")
+VERSES_PATH = os.path.join(DATA_DIR, "ot-verses.json")
+
+@contextmanager
+def open_atomic(path: str, mode: str = 'wb', encoding: str | None = None) -> Iterator[IO]:
+    """
+    Open a temp file next to `path` for writing; it replaces `path` only if the
+    block completes, so readers never see a partial file.
+    """
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+    fd, tmp = tempfile.mkstemp(dir=os.path.dirname(os.path.abspath(path)), prefix='.tmp-')
+    try:
+        with os.fdopen(fd, mode, encoding=encoding) as f:
+            yield f
+        # mkstemp creates 0600; keep the usual permissions for build outputs
+        os.chmod(tmp, os.stat(path).st_mode & 0o777 if os.path.exists(path) else 0o644)
+        os.replace(tmp, path)
+    except BaseException:
+        if os.path.exists(tmp):
+            os.unlink(tmp)
+        raise
+
+def write_atomic(path: str, data: bytes) -> None:
+    """Write `data` to `path` via a temp file and rename, so readers never see a partial file."""
+    with open_atomic(path) as f:
+        f.write(data)
+
+def load_script(name: str, path: str | None = None) -> ModuleType:
+    """
+    Import a hyphenated script such as fetch-verses.py as a module
+    (fetch_verses), reusing it once imported. With `path` the file is loaded
+    afresh under `name`, as a watch does after an edit.
+    """
+    module_name = name.replace('-', '_')
+    if path is None:
+        if module_name in sys.modules:
+            return sys.modules[module_name]
+        path = os.path.join(SCRIPTS_DIR, f"{name}.py")
+    spec = importlib.util.spec_from_file_location(module_name, path)
+    module = importlib.util.module_from_spec(spec)
+    # Registered so worker processes can unpickle functions defined in the script
+    sys.modules[module_name] = module
+    spec.loader.exec_module(module)
+    return module
+
+def strongs_number(strongs: str) -> int:
+    """The number of a Strong's id, e.g. 430 for "H430"; 0 if it has none."""
+    digits = ''.join(c for c in strongs if c.isdigit())
+    return int(digits) if digits else 0
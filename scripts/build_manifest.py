@@ -0,0 +1,87 @@
+"""
+Per-entry build manifest for incremental vocabulary rebuilds.
+
+For every word the manifest records a hash of its OpenScriptures source
+entry, the frequency it was built with, and a hash of the word record that
+was written. Together with a fingerprint of the transform heuristics, this
+tells the next run which words can be copied from the previous
+vocabulary.json instead of being transformed again.
+"""
+
+import hashlib
+import json
+import os
+
+from build_io import write_atomic
+
+MANIFEST_VERSION = 1
+
+def digest(value) -> str:
+    """Short stable hash of a JSON-serialisable value."""
+    data = json.dumps(value, ensure_ascii=False, sort_keys=True, separators=(',', ':'))
+    return hashlib.sha256(data.encode('utf-8')).hexdigest()[:16]
+
+class BuildManifest:
+    """Tracks which words in the previous output are still valid for the current inputs."""
+
+    def __init__(self, path: str, heuristics: str, previous_words: list[dict] | None = None):
+        self.path = path
+        self.heuristics = heuristics
+        self.entries: dict[str, dict] = {}
+        self.previous: dict[str, dict] = {w["id"]: w for w in previous_words or []}
+        self.new_entries: dict[str, dict] = {}
+        self.reused = 0
+        self.rebuilt = 0
+        # Ids of words that differ from the previous output, new ones included
+        self.changed: set[str] = set()
+
+        if os.path.exists(path):
+            try:
+                with open(path, encoding='utf-8') as f:
+                    data = json.load(f)
+            except (OSError, ValueError):
+                data = {}
+            if data.get("version") == MANIFEST_VERSION and data.get("heuristics") == heuristics:
+                self.entries = data.get("entries", {})
+
+    def inputs(self, entry: dict, frequency: int) -> dict:
+        return {"source": digest(entry), "frequency": frequency}
+
+    def reuse(self, strongs_num: str, inputs: dict) -> dict | None:
+        """The previous word for `strongs_num` if none of its inputs changed."""
+        recorded = self.entries.get(strongs_num)
+        word = self.previous.get(strongs_num)
+        if not recorded or word is None:
+            return None
+        if recorded["source"] != inputs["source"] or recorded["frequency"] != inputs["frequency"]:
+            return None
+        # Guard against a hand-edited or checked-out output that no longer matches
+        if recorded["word"] != digest(word):
+            return None
+        return word
+
+    def record(self, strongs_num: str, inputs: dict, word: dict, reused: bool) -> None:
+        # A repeated id is recorded again, and the last record counts
+        same = word == self.previous.get(strongs_num)
+        if same:
+            self.changed.discard(strongs_num)
+        else:
+            self.changed.add(strongs_num)
+        # reuse() checked the recorded hash against this very word
+        word_digest = self.entries[strongs_num]["word"] if reused and same else digest(word)
+        self.new_entries[strongs_num] = {**inputs, "word": word_digest}
+        if reused:
+            self.reused += 1
+        else:
+            self.rebuilt += 1
+
+    def save(self) -> None:
+        data = {
+            "version": MANIFEST_VERSION,
+            "heuristics": self.heuristics,
+            "entries": dict(sorted(self.new_entries.items())),
+        }
+        write_atomic(self.path, json.dumps(data, indent=1).encode('utf-8'))
+
+    def report(self) -> None:
+        print(f"\nIncremental build: {self.reused} words reused, {self.rebuilt} rebuilt")
@@ -0,0 +1,104 @@
+"""
+Watch mode for the build scripts (--watch).
+
+The script builds once, keeps its expensive inputs in memory (the parsed
+OpenScriptures dictionary, downloaded chapters), then polls the files its
+configuration lives in. When one changes, the script is loaded again from
+disk so edited tables such as FREQUENCY_DATA or CURATED_VERSES take effect,
+and only the stages whose inputs changed run again. Outputs are written
+through temp files (see build_io.py), so a reader never sees half a file.
+
+Files are polled rather than watched with OS notifications so no extra
+dependency is needed; a file counts as changed when its content hash
+differs, so saving without edits does not trigger a rebuild. A rebuild that
+fails, e.g. on a half-typed edit, is reported and the watch goes on.
+"""
+
+import hashlib
+import importlib
+import os
+import time
+from types import ModuleType
+from typing import Callable, Iterable
+
+POLL_INTERVAL = 0.5
+
+class SourceWatcher:
+    """Detects content changes to a set of files by polling."""
+
+    def __init__(self, paths: Iterable[str]):
+        self.paths = [os.path.abspath(p) for p in paths]
+        self.stamps = {p: self._stamp(p) for p in self.paths}
+        self.digests = {p: self._digest(p) for p in self.paths}
+
+    @staticmethod
+    def _stamp(path: str) -> tuple[int, int] | None:
+        try:
+            st = os.stat(path)
+        except OSError:
+            return None
+        return st.st_mtime_ns, st.st_size
+
+    @staticmethod
+    def _digest(path: str) -> str | None:
+        try:
+            with open(path, 'rb') as f:
+                return hashlib.sha256(f.read()).hexdigest()
+        except OSError:
+            return None
+
+    def poll(self) -> set[str]:
+        """Paths whose content changed since the last poll."""
+        changed = set()
+        for path in self.paths:
+            stamp = self._stamp(path)
+            if stamp == self.stamps[path]:
+                continue
+            self.stamps[path] = stamp
+            digest = self._digest(path)
+            if digest != self.digests[path]:
+                self.digests[path] = digest
+                changed.add(path)
+        return changed
+
+def module_path(module: ModuleType) -> str:
+    return os.path.abspath(module.__file__)
+
+def reload_modules(changed: set[str], modules: Iterable[ModuleType]) -> bool:
+    """Re-import those of `modules` whose file changed; returns whether any was."""
+    reloaded = False
+    for module in modules:
+        if module_path(module) in changed:
+            importlib.reload(module)
+            reloaded = True
+    return reloaded
+
+def watch(
+    paths: Iterable[str],
+    rebuild: Callable[[set[str]], None],
+    interval: float = POLL_INTERVAL,
+    sleep: Callable[[float], None] = time.sleep,
+    polls: int | None = None,
+) -> None:
+    """Call rebuild(changed paths) whenever a watched file changes, until interrupted (or `polls` polls)."""
+    watcher = SourceWatcher(paths)
+    print(f"\nWatching {', '.join(os.path.basename(p) for p in watcher.paths)} for changes (Ctrl+C to stop)")
+    count = 0
+    try:
+        while polls is None or count < polls:
+            count += 1
+            sleep(interval)
+            changed = watcher.poll()
+            if not changed:
+                continue
+            print(f"\nChanged: {', '.join(os.path.basename(p) for p in sorted(changed))}")
+            start = time.perf_counter()
+            try:
+                rebuild(changed)
+            except Exception as e:
+                # Keep watching: the next save usually fixes it
+                print(f"Rebuild failed: {type(e).__name__}: {e}")
+                continue
+            print(f"Rebuilt in {time.perf_counter() - start:.2f}s")
+    except KeyboardInterrupt:
+        print("\nStopped watching")
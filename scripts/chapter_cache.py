@@ -0,0 +1,193 @@
+"""
+Persistent on-disk cache for bolls.life chapter payloads.
+
+Layout under the cache root:
+    index.json            key -> {sha256, etag, lastModified, fetchedAt, usedAt, size}
+    blobs/ab/abcdef...    raw response bodies, named by their SHA-256
+
+Entries younger than `max_age` are served without touching the network.
+Older entries are revalidated with If-None-Match / If-Modified-Since, so an
+unchanged chapter costs a 304 instead of a download. Entries unused for
+longer than `ttl` are evicted, and least-recently-used entries go next
+when the blobs exceed `max_bytes`.
+"""
+
+import hashlib
+import json
+import os
+import threading
+import time
+import urllib.error
+import urllib.request
+from typing import Any
+
+from build_io import write_atomic
+
+DEFAULT_MAX_AGE = 24 * 3600
+DEFAULT_TTL = 30 * 24 * 3600
+
+class ChapterCache:
+    """Content-addressed chapter cache keyed by "{book_num}_{chapter}"."""
+
+    def __init__(
+        self,
+        root: str,
+        max_age: float = DEFAULT_MAX_AGE,
+        ttl: float = DEFAULT_TTL,
+        max_bytes: int | None = None,
+        offline: bool = False,
+    ):
+        self.root = root
+        self.max_age = max_age
+        self.ttl = ttl
+        self.max_bytes = max_bytes
+        self.offline = offline
+        self.lock = threading.Lock()
+        self.stats = {"hit": 0, "revalidated": 0, "refreshed": 0, "miss": 0, "offline_miss": 0, "evicted": 0}
+        self.index: dict[str, dict] = {}
+        index_path = self.index_path()
+        if os.path.exists(index_path):
+            try:
+                with open(index_path, encoding='utf-8') as f:
+                    self.index = json.load(f)
+            except (OSError, ValueError):
+                self.index = {}
+
+    def index_path(self) -> str:
+        return os.path.join(self.root, 'index.json')
+
+    def blob_path(self, digest: str) -> str:
+        return os.path.join(self.root, 'blobs', digest[:2], digest)
+
+    def read_blob(self, meta: dict) -> bytes | None:
+        try:
+            with open(self.blob_path(meta['sha256']), 'rb') as f:
+                body = f.read()
+        except OSError:
+            return None
+        if hashlib.sha256(body).hexdigest() != meta['sha256']:
+            return None
+        return body
+
+    def count(self, outcome: str) -> None:
+        with self.lock:
+            self.stats[outcome] += 1
+
+    def store(self, key: str, body: bytes, etag: str | None, last_modified: str | None) -> None:
+        digest = hashlib.sha256(body).hexdigest()
+        path = self.blob_path(digest)
+        if not os.path.exists(path):
+            write_atomic(path, body)
+        now = time.time()
+        with self.lock:
+            self.index[key] = {
+                "sha256": digest,
+                "etag": etag,
+                "lastModified": last_modified,
+                "fetchedAt": now,
+                "usedAt": now,
+                "size": len(body),
+            }
+
+    def touch(self, key: str, fetched: bool = False) -> None:
+        now = time.time()
+        with self.lock:
+            meta = self.index.get(key)
+            if meta:
+                meta["usedAt"] = now
+                if fetched:
+                    meta["fetchedAt"] = now
+
+    def cached(self, key: str) -> tuple[dict | None, bytes | None]:
+        with self.lock:
+            meta = dict(self.index[key]) if key in self.index else None
+        return meta, self.read_blob(meta) if meta else None
+
+    def lookup(self, key: str) -> Any:
+        """Return the cached JSON for `key` if it can be served without a request, else None."""
+        meta, body = self.cached(key)
+        if body is None or not (self.offline or time.time() - meta["fetchedAt"] < self.max_age):
+            return None
+        self.touch(key)
+        self.count("hit")
+        return json.loads(body.decode('utf-8'))
+
+    def fetch(self, key: str, url: str, timeout: float = 30) -> Any:
+        """Return the decoded JSON for `url`, using and updating the cache."""
+        data = self.lookup(key)
+        if data is not None:
+            return data
+
+        meta, body = self.cached(key)
+        if self.offline:
+            self.count("offline_miss")
+            raise LookupError(f"chapter {key} is not cached (offline mode)")
+
+        request = urllib.request.Request(url)
+        if body is not None:
+            if meta.get("etag"):
+                request.add_header("If-None-Match", meta["etag"])
+            if meta.get("lastModified"):
+                request.add_header("If-Modified-Since", meta["lastModified"])
+
+        try:
+            with urllib.request.urlopen(request, timeout=timeout) as response:
+                new_body = response.read()
+                etag = response.headers.get("ETag")
+                last_modified = response.headers.get("Last-Modified")
+        except urllib.error.HTTPError as e:
+            if e.code == 304 and body is not None:
+                self.touch(key, fetched=True)
+                self.count("revalidated")
+                return json.loads(body.decode('utf-8'))
+            raise
+
+        data = json.loads(new_body.decode('utf-8'))
+        self.store(key, new_body, etag, last_modified)
+        self.count("refreshed" if body is not None else "miss")
+        return data
+
+    def evict(self) -> None:
+        """Drop entries past the TTL, then LRU entries over the size budget, then orphan blobs."""
+        now = time.time()
+        with self.lock:
+            for key in [k for k, m in self.index.items() if now - m["usedAt"] > self.ttl]:
+                del self.index[key]
+                self.stats["evicted"] += 1
+
+            if self.max_bytes is not None:
+                total = sum(m["size"] for m in self.index.values())
+                for key, meta in sorted(self.index.items(), key=lambda kv: kv[1]["usedAt"]):
+                    if total <= self.max_bytes:
+                        break
+                    total -= meta["size"]
+                    del self.index[key]
+                    self.stats["evicted"] += 1
+
+            live = {m["sha256"] for m in self.index.values()}
+
+        blobs_dir = os.path.join(self.root, 'blobs')
+        if os.path.isdir(blobs_dir):
+            for shard in os.listdir(blobs_dir):
+                shard_dir = os.path.join(blobs_dir, shard)
+                for name in os.listdir(shard_dir):
+                    if name not in live:
+                        os.unlink(os.path.join(shard_dir, name))
+
+    def save(self) -> None:
+        """Evict, then persist the index."""
+        self.evict()
+        with self.lock:
+            data = json.dumps(self.index, indent=2, sort_keys=True).encode('utf-8')
+        write_atomic(self.index_path(), data)
+
+    def report(self) -> None:
+        s = self.stats
+        served = s["hit"] + s["revalidated"]
+        total = served + s["refreshed"] + s["miss"] + s["offline_miss"]
+        print("\nChapter cache:")
+        print(f"  Hits: {s['hit']}  Revalidated (304): {s['revalidated']}")
+        print(f"  Refreshed: {s['refreshed']}  Misses: {s['miss']}  Offline misses: {s['offline_miss']}")
+        print(f"  Evicted: {s['evicted']}  Entries: {len(self.index)}")
+        if total:
+            print(f"  Hit rate: {served / total:.0%}")
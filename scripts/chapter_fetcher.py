@@ -0,0 +1,193 @@
+"""
+Bounded concurrent chapter downloads for the verse pipeline.
+
+Chapters are fetched on a thread pool. Each host gets its own concurrency
+limit, and a shared token bucket paces request starts in place of a fixed
+sleep between verses. With a RetryPolicy, transient failures are retried
+after a jittered exponential backoff, within a retry budget for the run.
+"""
+
+import json
+import random
+import threading
+import time
+import urllib.error
+import urllib.parse
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Iterable
+
+class TokenBucket:
+    """Thread-safe token bucket: `rate` tokens per second, up to `burst` banked."""
+
+    def __init__(self, rate: float, burst: int = 1):
+        self.rate = rate
+        self.capacity = max(1, burst)
+        self.tokens = float(self.capacity)
+        self.updated = time.monotonic()
+        self.lock = threading.Lock()
+
+    def acquire(self) -> None:
+        """Block until a token is available, then consume it."""
+        if self.rate <= 0:
+            return
+        while True:
+            with self.lock:
+                now = time.monotonic()
+                self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+                self.updated = now
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                wait = (1 - self.tokens) / self.rate
+            time.sleep(wait)
+
+class HostLimiter:
+    """Caps the number of in-flight requests per host."""
+
+    def __init__(self, per_host: int):
+        self.per_host = max(1, per_host)
+        self.semaphores: dict[str, threading.BoundedSemaphore] = {}
+        self.lock = threading.Lock()
+
+    def slot(self, url: str) -> threading.BoundedSemaphore:
+        host = urllib.parse.urlsplit(url).netloc
+        with self.lock:
+            if host not in self.semaphores:
+                self.semaphores[host] = threading.BoundedSemaphore(self.per_host)
+            return self.semaphores[host]
+
+# HTTP statuses worth retrying: timeouts, throttling and server errors
+RETRY_STATUSES = {408, 425, 429}
+
+def is_transient(error: Exception) -> bool:
+    """Whether a failed request may succeed if tried again."""
+    if isinstance(error, urllib.error.HTTPError):
+        return error.code in RETRY_STATUSES or error.code >= 500
+    # Connection failures and timeouts (URLError is an OSError), and bodies
+    # cut off mid-download; a LookupError (offline cache miss) is final
+    return isinstance(error, (OSError, ValueError))
+
+def retry_after(error: Exception) -> float | None:
+    """Seconds asked for by a Retry-After header, if the error carries one."""
+    headers = getattr(error, 'headers', None)
+    value = headers.get('Retry-After') if headers else None
+    try:
+        return max(0.0, float(value)) if value is not None else None
+    except ValueError:
+        return None
+
+def default_retry_budget(requests: int) -> int:
+    """Retries allowed across a run of `requests`: a tenth of them, at least 10."""
+    return max(10, requests // 10)
+
+class RetryPolicy:
+    """
+    Jittered exponential backoff with a retry budget shared by every request.
+
+    A request is tried up to `attempts` times. Before retry n the caller
+    sleeps a random time in [0, min(cap, base * 2**n)] ("full jitter"), or
+    longer if the server sent Retry-After. Once `budget` retries have been
+    spent in total, failures are final, so a dead host cannot turn into a
+    retry storm.
+    """
+
+    def __init__(
+        self,
+        attempts: int = 4,
+        base: float = 0.5,
+        cap: float = 30.0,
+        budget: int | None = None,
+        rng: random.Random | None = None,
+        sleep: Callable[[float], None] = time.sleep,
+    ):
+        self.attempts = max(1, attempts)
+        self.base = base
+        self.cap = cap
+        self.budget = budget
+        self.rng = rng or random.Random()
+        self.sleep = sleep
+        self.retries = 0
+        self.lock = threading.Lock()
+
+    def delay(self, attempt: int, error: Exception | None = None) -> float:
+        """Seconds to wait before retrying after failed attempt number `attempt` (0-based)."""
+        with self.lock:
+            delay = self.rng.uniform(0, min(self.cap, self.base * 2 ** attempt))
+        asked = retry_after(error) if error is not None else None
+        return min(self.cap, max(delay, asked)) if asked is not None else delay
+
+    def should_retry(self, attempt: int, error: Exception) -> bool:
+        """Whether to retry after failed attempt `attempt`; spends one unit of the budget if so."""
+        if attempt + 1 >= self.attempts or not is_transient(error):
+            return False
+        with self.lock:
+            if self.budget is not None and self.retries >= self.budget:
+                return False
+            self.retries += 1
+        return True
+
+def get_json(url: str, timeout: float = 30) -> Any:
+    """Download and decode one JSON document."""
+    with urllib.request.urlopen(url, timeout=timeout) as response:
+        return json.loads(response.read().decode('utf-8'))
+
+def fetch_all(
+    urls: dict[str, str],
+    workers: int = 8,
+    per_host: int = 4,
+    rate: float = 5.0,
+    burst: int = 4,
+    fetch: Callable[[str], Any] = get_json,
+    on_done: Callable[[str, Any, Exception | None], None] | None = None,
+    retry: RetryPolicy | None = None,
+) -> dict[str, Any]:
+    """
+    Fetch every `key -> url` pair concurrently.
+
+    Returns `key -> payload`; keys whose request raised (after any retries
+    allowed by `retry`) are reported through `on_done` and left out of the
+    result. A request waiting to be retried gives up its host slot.
+    """
+    bucket = TokenBucket(rate, burst)
+    limiter = HostLimiter(per_host)
+    results: dict[str, Any] = {}
+    results_lock = threading.Lock()
+
+    def run(key: str, url: str) -> None:
+        attempt = 0
+        while True:
+            error = None
+            payload = None
+            with limiter.slot(url):
+                bucket.acquire()
+                try:
+                    payload = fetch(url)
+                except Exception as e:
+                    error = e
+            if error is None or retry is None or not retry.should_retry(attempt, error):
+                break
+            retry.sleep(retry.delay(attempt, error))
+            attempt += 1
+        if error is None:
+            with results_lock:
+                results[key] = payload
+        if on_done:
+            on_done(key, payload, error)
+
+    with ThreadPoolExecutor(max_workers=max(1, workers)) as pool:
+        futures = [pool.submit(run, key, url) for key, url in urls.items()]
+        for future in futures:
+            future.result()
+
+    return results
+
+def unique_in_order(items: Iterable[Any]) -> list:
+    """Drop repeats while keeping first-seen order."""
+    seen = set()
+    out = []
+    for item in items:
+        if item not in seen:
+            seen.add(item)
+            out.append(item)
+    return out
@@ -0,0 +1,150 @@
+"""
+Keyword tables and a precompiled classifier for Strong's definitions.
+
+The tables here are the single source for the part-of-speech, semantic
+category and gender heuristics used by fetch-vocabulary.py. The
+`KeywordClassifier` compiles the keywords into one trie-shaped regex and
+finds all keywords present in a definition in a single scan; the ordering
+rules are then applied to that set, so results match the straightforward
+`any(kw in text ...)` checks exactly.
+"""
+
+import re
+from typing import NamedTuple
+
+# Bump when any table or rule below changes
+CLASSIFIER_VERSION = 1
+
+VERB_KEYWORDS = ["to ", "a primitive root"]
+VERB_DERIVATION_KEYWORD = "primitive root"
+ADJECTIVE_KEYWORDS = ["adjective", " great", " good", " holy", " evil"]
+ADJECTIVE_EXCLUDE_KEYWORDS = ["to be", "to make"]
+ADVERB_KEYWORD = "adverb"
+PREPOSITION_KEYWORDS = ["preposition", "upon", "from", "to", "in"]
+PREPOSITION_MAX_LENGTH = 50
+CONJUNCTION_KEYWORD = "conjunction"
+PRONOUN_KEYWORDS = ["pronoun", " i ", " he ", " she ", " you ", " they "]
+PARTICLE_KEYWORDS = ["particle", "interjection"]
+
+# Checked in order; the first category with a matching keyword wins
+SEMANTIC_CATEGORIES = {
+    "theological": ["god", "lord", "holy", "worship", "pray", "sacred", "divine", "covenant", "salvation"],
+    "creation": ["heaven", "earth", "sea", "land", "mountain", "water", "sun", "moon", "star", "tree", "animal"],
+    "human": ["man", "woman", "son", "daughter", "father", "mother", "brother", "child", "people", "nation"],
+    "body": ["hand", "eye", "heart", "face", "mouth", "head", "foot", "blood", "bone", "flesh"],
+    "action": ["walk", "go", "come", "give", "take", "make", "do", "say", "speak", "hear", "see"],
+    "emotion": ["love", "hate", "fear", "joy", "anger", "sorrow", "peace"],
+    "legal": ["law", "judge", "command", "righteous", "wicked", "sin", "guilt"],
+    "warfare": ["sword", "war", "battle", "fight", "enemy", "army", "victory"],
+    "royalty": ["king", "prince", "throne", "reign", "rule", "kingdom"],
+    "worship": ["priest", "sacrifice", "altar", "temple", "offering", "tabernacle"],
+    "time": ["day", "night", "year", "month", "morning", "evening", "eternity"],
+    "quantity": ["all", "many", "few", "great", "small", "number"],
+    "abstract": ["truth", "wisdom", "knowledge", "glory", "power", "righteousness"],
+    "domestic": ["house", "bread", "food", "wine", "oil", "garment", "gold", "silver"],
+}
+
+FEMININE_KEYWORDS = ["feminine", "woman", "wife", "daughter", "mother"]
+
+class Classification(NamedTuple):
+    pos: str
+    category: str
+    gender: str
+
+def trie_pattern(keywords: list[str]) -> str:
+    """Regex source matching the longest of `keywords` at a position, branching per character."""
+    trie: dict = {}
+    for keyword in keywords:
+        node = trie
+        for char in keyword:
+            node = node.setdefault(char, {})
+        node[''] = {}
+
+    def build(node: dict) -> str:
+        branches = [re.escape(char) + build(child) for char, child in sorted(node.items()) if char]
+        if not branches:
+            return ''
+        body = branches[0] if len(branches) == 1 else '(?:' + '|'.join(branches) + ')'
+        # Greedy optional group: prefer the longer keyword, fall back to this one
+        return f'(?:{body})?' if '' in node else body
+
+    return build(trie)
+
+class KeywordMatcher:
+    """Finds every keyword occurring as a substring of a text in one regex scan."""
+
+    def __init__(self, keywords: list[str]):
+        unique = sorted(set(keywords))
+        # Zero-width lookahead so overlapping keywords are all reported
+        self.pattern = re.compile(f'(?=({trie_pattern(unique)}))')
+        # The longest keyword at a position implies every keyword that is its prefix
+        self.prefixes = {k: frozenset(p for p in unique if k.startswith(p)) for k in unique}
+
+    def find(self, text: str) -> set[str]:
+        found = set()
+        for keyword in set(self.pattern.findall(text)):
+            found |= self.prefixes[keyword]
+        return found
+
+class KeywordClassifier:
+    """Part of speech, semantic category and gender hint from one scan per text."""
+
+    def __init__(self):
+        self.pos_matcher = KeywordMatcher(
+            VERB_KEYWORDS + ADJECTIVE_KEYWORDS + ADJECTIVE_EXCLUDE_KEYWORDS + [ADVERB_KEYWORD]
+            + PREPOSITION_KEYWORDS + [CONJUNCTION_KEYWORD] + PRONOUN_KEYWORDS + PARTICLE_KEYWORDS
+        )
+        self.definition_matcher = KeywordMatcher(
+            [kw for keywords in SEMANTIC_CATEGORIES.values() for kw in keywords] + FEMININE_KEYWORDS
+        )
+        self.categories = [(name, frozenset(keywords)) for name, keywords in SEMANTIC_CATEGORIES.items()]
+        self.feminine = frozenset(FEMININE_KEYWORDS)
+        self.verb = frozenset(VERB_KEYWORDS)
+        self.adjective = frozenset(ADJECTIVE_KEYWORDS)
+        self.adjective_exclude = frozenset(ADJECTIVE_EXCLUDE_KEYWORDS)
+        self.preposition = frozenset(PREPOSITION_KEYWORDS)
+        self.pronoun = frozenset(PRONOUN_KEYWORDS)
+        self.particle = frozenset(PARTICLE_KEYWORDS)
+
+    def pos(self, strongs_def: str, derivation: str) -> str:
+        def_lower = strongs_def.lower()
+        found = self.pos_matcher.find(def_lower)
+
+        if found & self.verb:
+            return "verb"
+        if derivation and VERB_DERIVATION_KEYWORD in derivation.lower():
+            return "verb"
+        if found & self.adjective and not found & self.adjective_exclude:
+            return "adjective"
+        if ADVERB_KEYWORD in found:
+            return "adverb"
+        if found & self.preposition and len(def_lower) < PREPOSITION_MAX_LENGTH:
+            return "preposition"
+        if CONJUNCTION_KEYWORD in found:
+            return "conjunction"
+        if found & self.pronoun:
+            return "pronoun"
+        if found & self.particle:
+            return "particle"
+        return "noun"
+
+    def classify(self, strongs_def: str, derivation: str, definition: str) -> Classification:
+        found = self.definition_matcher.find(definition.lower())
+
+        category = "general"
+        for name, keywords in self.categories:
+            if found & keywords:
+                category = name
+                break
+
+        gender = "feminine" if found & self.feminine else "masculine"
+        return Classification(self.pos(strongs_def, derivation), category, gender)
+
+_classifier: KeywordClassifier | None = None
+
+def get_classifier() -> KeywordClassifier:
+    """The process-wide classifier, compiled on first use."""
+    global _classifier
+    if _classifier is None:
+        _classifier = KeywordClassifier()
+    return _classifier
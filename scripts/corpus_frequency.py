@@ -0,0 +1,83 @@
+#!/usr/bin/env python3
+"""
+Lemma frequencies counted from a Strong's-tagged Hebrew corpus.
+
+Reads an OSIS edition whose words carry morphhb-style lemma attributes
+(`lemma="c/d/1254 a"` -> H1254; prefix morphemes are not counted) and
+counts how often each Strong's number occurs in the text. Readings inside
+variant notes are skipped, so each word is counted once.
+
+Books are counted on a process pool and the Counters merged, so the whole
+OT (~300k words) takes a few seconds. Per-book files are one task each; a
+file holding several books is split at its book `<div>`s (see
+osis_corpus.book_spans), so a single-file edition is counted in parallel
+too.
+
+Run standalone to print the most frequent lemmas:
+    python scripts/corpus_frequency.py path/to/wlc [--jobs N] [--output counts.json]
+"""
+
+import argparse
+import json
+import os
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+
+from build_io import write_atomic
+from osis_corpus import book_spans, iter_osis_file, iter_osis_span, lemma_strongs, source_files
+
+def count_file(path: str, span: tuple[int, int] | None = None) -> Counter:
+    """Strong's number -> occurrences in one OSIS file, or in the book at `span` of it."""
+    ids = []
+    for verse in iter_osis_file(path) if span is None else iter_osis_span(path, *span):
+        for word in verse.words:
+            ids += lemma_strongs(word.lemma)
+    return Counter(ids)
+
+def count_tasks(files: list[str]) -> list[tuple[str, tuple[int, int] | None]]:
+    """(path, book span) tasks: a file with several books is one task per book."""
+    tasks = []
+    for path in files:
+        spans = book_spans(path)
+        tasks += [(path, span) for span in spans] if len(spans) > 1 else [(path, None)]
+    return tasks
+
+def count_corpus(source: str, jobs: int | None = None) -> Counter:
+    """
+    Strong's number -> occurrences across an OSIS file or directory.
+
+    Books are counted in parallel with `jobs` worker processes (default:
+    one per CPU); counts are merged as each book finishes.
+    """
+    files = source_files(source)
+    jobs = jobs or os.cpu_count() or 1
+    total = Counter()
+    if jobs <= 1:
+        for path in files:
+            total.update(count_file(path))
+        return total
+    tasks = count_tasks(files)
+    with ProcessPoolExecutor(max_workers=min(jobs, len(tasks))) as pool:
+        for counts in pool.map(count_file, *zip(*tasks)):
+            total.update(counts)
+    return total
+
+def main():
+    parser = argparse.ArgumentParser(description="Count lemma frequencies in a Strong's-tagged OSIS corpus.")
+    parser.add_argument("source", help="OSIS file or directory of per-book files")
+    parser.add_argument("--jobs", type=int, default=None, help="Worker processes (default: one per CPU)")
+    parser.add_argument("--output", default=None, help="Write the counts as JSON to this path")
+    parser.add_argument("--top", type=int, default=20, help="How many of the most frequent lemmas to print")
+    args = parser.parse_args()
+
+    counts = count_corpus(args.source, args.jobs)
+    print(f"Counted {sum(counts.values())} words, {len(counts)} distinct lemmas")
+    for strongs, count in counts.most_common(args.top):
+        print(f"  {strongs}: {count}")
+    if args.output:
+        data = dict(sorted(counts.items(), key=lambda kv: int(kv[0][1:])))
+        write_atomic(args.output, json.dumps(data, indent=1).encode('utf-8'))
+        print(f"Wrote counts to {args.output}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,141 @@
+#!/usr/bin/env python3
+"""
+Join the TDOT and Vine's dictionaries onto the vocabulary by Strong's number.
+
+Both dictionaries are read once and indexed by their `strongs` key, and
+the vocabulary build looks each word up in that index as it is merged (a
+hash join): words with articles carry their sources, e.g.
+"articles": ["tdot", "vine"].
+
+The article bodies are written as chunks so a page can fetch the one it
+shows instead of importing a whole dictionary:
+
+    {source}-N.ndjson   one minified article per line, in Strong's order,
+                        up to about CHUNK_BYTES per chunk
+    manifest.json       {version, sources: {source: {chunks: [file, ...],
+                         entries: {id: [chunk, offset, length], ...}}},
+                         byStrongs: {strongs: {source: [id, ...]}}}
+
+`offset` and `length` are byte positions in the chunk, so a client can
+fetch an article with an HTTP Range request or slice it from the chunk.
+
+Run standalone to write the chunks for the dictionaries in src/data:
+    python scripts/dictionary_articles.py [output dir]
+"""
+
+import json
+import os
+import sys
+
+from build_io import DATA_DIR, PUBLIC_DATA_DIR, write_atomic
+
+DICTIONARIES = {
+    "tdot": os.path.join(DATA_DIR, "tdot-dictionary.json"),
+    "vine": os.path.join(DATA_DIR, "vine-dictionary.json"),
+}
+ARTICLES_DIR = os.path.join(PUBLIC_DATA_DIR, "articles")
+
+ARTICLES_VERSION = 1
+CHUNK_BYTES = 32 * 1024
+
+def minified(value) -> bytes:
+    return json.dumps(value, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+
+def strongs_key(strongs: str) -> tuple[str, int]:
+    return strongs[:1], int(strongs[1:]) if strongs[1:].isdigit() else 0
+
+def load_dictionaries(paths: dict[str, str] = DICTIONARIES) -> dict[str, list[dict]]:
+    """Entries of each dictionary, by source name."""
+    dictionaries = {}
+    for source, path in paths.items():
+        with open(path, encoding='utf-8') as f:
+            dictionaries[source] = json.load(f)["entries"]
+    return dictionaries
+
+def unique_entries(entries: list[dict]) -> list[dict]:
+    """Entries with the first of any repeated id, which is the one the [id] pages find."""
+    seen = set()
+    unique = []
+    for entry in entries:
+        if entry["id"] not in seen:
+            seen.add(entry["id"])
+            unique.append(entry)
+    return unique
+
+def index_articles(dictionaries: dict[str, list[dict]]) -> dict[str, dict[str, list[str]]]:
+    """{strongs: {source: [entry id, ...]}} over every dictionary, in one pass."""
+    index: dict[str, dict[str, list[str]]] = {}
+    for source, entries in dictionaries.items():
+        for entry in unique_entries(entries):
+            if entry.get("strongs"):
+                index.setdefault(entry["strongs"], {}).setdefault(source, []).append(entry["id"])
+    return index
+
+def article_sources(index: dict[str, dict[str, list[str]]], sources) -> dict[str, tuple[str, ...]]:
+    """{strongs: (source, ...)} in `sources` order, the `articles` of each word that has any."""
+    interned: dict[tuple[str, ...], tuple[str, ...]] = {}
+    result = {}
+    for strongs, found in index.items():
+        articles = tuple(source for source in sources if source in found)
+        result[strongs] = interned.setdefault(articles, articles)
+    return result
+
+def chunk_entries(source: str, entries: list[dict], chunk_bytes: int = CHUNK_BYTES):
+    """Yield (file name, data, {id: [chunk, offset, length]}) for each chunk of a dictionary."""
+    ordered = sorted(unique_entries(entries), key=lambda e: (strongs_key(e.get("strongs") or ""), e["id"]))
+    data = bytearray()
+    offsets: dict[str, list[int]] = {}
+    number = 0
+    for entry in ordered:
+        record = minified(entry)
+        if data and len(data) + len(record) > chunk_bytes:
+            yield f"{source}-{number}.ndjson", bytes(data), offsets
+            data, offsets, number = bytearray(), {}, number + 1
+        offsets[entry["id"]] = [number, len(data), len(record)]
+        data += record + b'\n'
+    if data:
+        yield f"{source}-{number}.ndjson", bytes(data), offsets
+
+def write_articles(dictionaries: dict[str, list[dict]], out_dir: str = ARTICLES_DIR,
+                   chunk_bytes: int = CHUNK_BYTES) -> dict:
+    """Write every dictionary's chunks and manifest.json; returns the manifest."""
+    sources = {}
+    for source, entries in dictionaries.items():
+        chunks, offsets = [], {}
+        for name, data, chunk_offsets in chunk_entries(source, entries, chunk_bytes):
+            write_atomic(os.path.join(out_dir, name), data)
+            chunks.append(name)
+            offsets.update(chunk_offsets)
+        sources[source] = {"chunks": chunks, "entries": offsets}
+
+    index = index_articles(dictionaries)
+    manifest = {
+        "version": ARTICLES_VERSION,
+        "sources": sources,
+        "byStrongs": {strongs: index[strongs] for strongs in sorted(index, key=strongs_key)},
+    }
+    write_atomic(os.path.join(out_dir, "manifest.json"), minified(manifest))
+
+    # Drop chunks left over from a larger build
+    current = {name for s in sources.values() for name in s["chunks"]}
+    for name in os.listdir(out_dir):
+        if name.endswith(".ndjson") and name not in current:
+            os.unlink(os.path.join(out_dir, name))
+
+    return manifest
+
+def chunk_size(out_dir: str, manifest: dict) -> int:
+    """Total bytes of the chunks a manifest lists."""
+    return sum(os.path.getsize(os.path.join(out_dir, name))
+               for s in manifest["sources"].values() for name in s["chunks"])
+
+def main():
+    out_dir = sys.argv[1] if len(sys.argv) > 1 else ARTICLES_DIR
+    dictionaries = load_dictionaries()
+    manifest = write_articles(dictionaries, out_dir)
+    for source, info in manifest["sources"].items():
+        print(f"{source}: {len(info['entries'])} articles in {len(info['chunks'])} chunks")
+    print(f"Wrote {chunk_size(out_dir, manifest) / 1024:.0f} KB of articles to {out_dir}")
+
+if __name__ == "__main__":
+    main()
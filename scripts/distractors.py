@@ -0,0 +1,121 @@
+#!/usr/bin/env python3
+"""
+Precompute quiz distractor pools for every word.
+
+A distractor is another word whose gloss is offered as a wrong answer. For
+each word, candidates are ranked by:
+
+    part of speech   the same as the word's first, then any other
+    tier             the word's own tier, then +/-1, +/-2, ...
+    frequency        closest to the word's frequency
+
+and skipped when the answer would be ambiguous: a gloss that shares a
+(stemmed) content token with the word's gloss (see key_terms.term_tokens),
+or that repeats a gloss already in the pool. The first POOL_SIZE survivors
+form the pool, so a quiz draws its wrong answers from a short list instead
+of filtering the whole vocabulary for every question.
+
+Candidates come from (part of speech, tier) groups sorted by frequency, and
+each group is walked outwards from the word's frequency, so building a pool
+only looks at the candidates it needs.
+
+The artifact stores an `ids` array and, per word, positions into it:
+    {"version": 1, "poolSize": 8, "ids": [...], "pools": [[3, 17, ...], ...]}
+
+Run standalone to build pools for an existing vocabulary.json:
+    python scripts/distractors.py [vocabulary.json] [distractors.json]
+"""
+
+import bisect
+import heapq
+import json
+import os
+import sys
+from collections import defaultdict
+from typing import Iterator
+
+from build_io import PUBLIC_DATA_DIR, VOCABULARY_PATH, write_atomic
+from key_terms import term_tokens
+
+DISTRACTORS_PATH = os.path.join(PUBLIC_DATA_DIR, "distractors.json")
+
+DISTRACTORS_VERSION = 1
+POOL_SIZE = 8
+
+def outwards(group: list[tuple[int, int]], frequency: int) -> Iterator[tuple[int, int]]:
+    """(frequency distance, position) for a frequency-sorted group, nearest first."""
+    hi = bisect.bisect_left(group, (frequency, -1))
+    lo = hi - 1
+    while lo >= 0 or hi < len(group):
+        down = frequency - group[lo][0] if lo >= 0 else None
+        up = group[hi][0] - frequency if hi < len(group) else None
+        if up is None or (down is not None and down <= up):
+            yield down, group[lo][1]
+            lo -= 1
+        else:
+            yield up, group[hi][1]
+            hi += 1
+
+def build_pools(words: list[dict], size: int = POOL_SIZE) -> list[list[int]]:
+    """Ranked distractor positions for every word."""
+    glosses = [w["gloss"].strip().lower() for w in words]
+    tokens = [set(term_tokens(w["gloss"])) for w in words]
+    groups: dict[tuple[str, int], list[tuple[int, int]]] = defaultdict(list)
+    for pos, word in enumerate(words):
+        if glosses[pos]:
+            groups[(word["partOfSpeech"], word["tier"])].append((word["frequency"], pos))
+    for group in groups.values():
+        group.sort()
+    tiers = {tier for _, tier in groups}
+    parts = {part for part, _ in groups}
+
+    def candidates(word) -> Iterator[int]:
+        """Positions in ranking order: same POS, then tier distance, then frequency."""
+        for band in ({word["partOfSpeech"]}, parts - {word["partOfSpeech"]}):
+            for distance in sorted({abs(t - word["tier"]) for t in tiers}):
+                rings = [
+                    outwards(groups[(part, tier)], word["frequency"])
+                    for part in sorted(band) for tier in sorted(tiers)
+                    if abs(tier - word["tier"]) == distance and (part, tier) in groups
+                ]
+                for _, other in heapq.merge(*rings):
+                    yield other
+
+    pools = []
+    for pos, word in enumerate(words):
+        seen = {glosses[pos]}
+        pool: list[int] = []
+        for other in candidates(word):
+            if other == pos or glosses[other] in seen or tokens[other] & tokens[pos]:
+                continue
+            seen.add(glosses[other])
+            pool.append(other)
+            if len(pool) == size:
+                break
+        pools.append(pool)
+    return pools
+
+def build_distractors(words: list[dict], size: int = POOL_SIZE) -> dict:
+    return {
+        "version": DISTRACTORS_VERSION,
+        "poolSize": size,
+        "ids": [w["id"] for w in words],
+        "pools": build_pools(words, size),
+    }
+
+def write_distractors(words: list[dict], path: str = DISTRACTORS_PATH, size: int = POOL_SIZE) -> int:
+    """Build and write the distractor pools; returns the artifact size in bytes."""
+    data = json.dumps(build_distractors(words, size), separators=(',', ':')).encode('utf-8')
+    write_atomic(path, data)
+    return len(data)
+
+def main():
+    source = sys.argv[1] if len(sys.argv) > 1 else VOCABULARY_PATH
+    target = sys.argv[2] if len(sys.argv) > 2 else DISTRACTORS_PATH
+    with open(source, encoding='utf-8') as f:
+        words = json.load(f)["words"]
+    size = write_distractors(words, target)
+    print(f"Wrote distractor pools for {len(words)} words ({size / 1024:.0f} KB) to {target}")
+
+if __name__ == "__main__":
+    main()
@@ -5,16 +5,65 @@ Fetch Hebrew OT verses from online sources and transform to app format.
 Source: Bolls.life API (Westminster Leningrad Codex)
 
 Output: src/data/ot-verses.json
+
+With --osis, every verse is instead read from a local OSIS edition of the
+WLC (e.g. the morphhb wlc/ directory) and streamed to public/data/verses/,
+one JSON file per book (or one NDJSON file with --format ndjson), plus
+index.json. Curated metadata is joined on by reference.
+
+Either way, when src/data/vocabulary.json exists a word <-> verse index is
+written to public/data/word-verses.json (see verse_index.py), and each
+verse's keyTerms are resolved to ranked Strong's ids in "keyTermIds"
+(see key_terms.py).
+
+Each verse is also scored for difficulty from the frequency and tier of its
+lemmas, and the scores are written to public/data/verse-difficulty.json
+(see verse_difficulty.py). The curated `difficulty` values are left as they
+are; the run reports how often the computed level agrees with them.
+
+Chapter downloads that fail transiently are retried with jittered
+exponential backoff, within a retry budget for the run. Every downloaded
+chapter is checkpointed to a run journal (.cache/verse-fetch.journal, see
+fetch_journal.py): if chapters are still missing at the end, the run lists
+them, leaves the output untouched (unless --allow-partial) and exits with
+status 1, and the next run resumes with only the missing chapters.
+
+With --watch the script keeps the downloaded chapters in memory after the
+build and rebuilds whenever CURATED_VERSES, BOOK_NAMES or the vocabulary
+change (see build_watch.py).
 """
 
+import argparse
 import json
-import urllib.request
+import os
+import sys
 import time
-from typing import Any
+from contextlib import ExitStack
+from typing import Any, Callable
+
+import build_watch
+import key_terms
+import verse_difficulty
+import verse_index
+from build_io import PUBLIC_DATA_DIR, REPO_ROOT, VERSES_PATH, load_script, open_atomic, write_atomic
+from chapter_cache import DEFAULT_MAX_AGE, DEFAULT_TTL, ChapterCache
+from chapter_fetcher import RetryPolicy, default_retry_budget, fetch_all, get_json, unique_in_order
+from fetch_journal import RunJournal
+from osis_corpus import OsisVerse, iter_osis_verses
+from pipeline_profile import Profiler, add_arguments as add_profile_arguments
 
 # Bolls.life API base URL
 API_BASE = "https://bolls.life/get-text/WLC"
 
+OUTPUT_PATH = VERSES_PATH
+CACHE_DIR = os.path.join(REPO_ROOT, ".cache", "chapters")
+JOURNAL_PATH = os.path.join(REPO_ROOT, ".cache", "verse-fetch.journal")
+VERSES_DIR = os.path.join(PUBLIC_DATA_DIR, "verses")
+
+VERSES_INDEX_VERSION = 1
+# Difficulty for verses without a curated value
+DEFAULT_DIFFICULTY = 2
+
 # Curated verse selections with pedagogical annotations
 # Format: (book_id, chapter, verse, difficulty, key_terms, notes)
 CURATED_VERSES = [
@@ -164,13 +213,38 @@ BOOK_NAMES = {
     "num": ("Numbers", "בְּמִדְבַּר"),
     "deut": ("Deuteronomy", "דְּבָרִים"),
     "josh": ("Joshua", "יְהוֹשֻׁעַ"),
+    "judg": ("Judges", "שׁוֹפְטִים"),
+    "ruth": ("Ruth", "רוּת"),
+    "1sam": ("1 Samuel", "שְׁמוּאֵל א"),
+    "2sam": ("2 Samuel", "שְׁמוּאֵל ב"),
+    "1kgs": ("1 Kings", "מְלָכִים א"),
+    "2kgs": ("2 Kings", "מְלָכִים ב"),
+    "1chr": ("1 Chronicles", "דִּבְרֵי הַיָּמִים א"),
+    "2chr": ("2 Chronicles", "דִּבְרֵי הַיָּמִים ב"),
+    "ezra": ("Ezra", "עֶזְרָא"),
+    "neh": ("Nehemiah", "נְחֶמְיָה"),
+    "esth": ("Esther", "אֶסְתֵּר"),
+    "job": ("Job", "אִיּוֹב"),
     "ps": ("Psalms", "תְּהִלִּים"),
     "prov": ("Proverbs", "מִשְׁלֵי"),
+    "eccl": ("Ecclesiastes", "קֹהֶלֶת"),
+    "song": ("Song of Songs", "שִׁיר הַשִּׁירִים"),
     "isa": ("Isaiah", "יְשַׁעְיָהוּ"),
     "jer": ("Jeremiah", "יִרְמְיָהוּ"),
+    "lam": ("Lamentations", "אֵיכָה"),
+    "ezek": ("Ezekiel", "יְחֶזְקֵאל"),
     "dan": ("Daniel", "דָּנִיֵּאל"),
+    "hos": ("Hosea", "הוֹשֵׁעַ"),
+    "joel": ("Joel", "יוֹאֵל"),
+    "amos": ("Amos", "עָמוֹס"),
+    "obad": ("Obadiah", "עֹבַדְיָה"),
+    "jonah": ("Jonah", "יוֹנָה"),
     "mic": ("Micah", "מִיכָה"),
+    "nah": ("Nahum", "נַחוּם"),
     "hab": ("Habakkuk", "חֲבַקּוּק"),
+    "zeph": ("Zephaniah", "צְפַנְיָה"),
+    "hag": ("Haggai", "חַגַּי"),
+    "zech": ("Zechariah", "זְכַרְיָה"),
     "mal": ("Malachi", "מַלְאָכִי"),
 }
 
@@ -182,62 +256,175 @@ BOOK_NUMBERS = {
     "num": 4,
     "deut": 5,
     "josh": 6,
+    "judg": 7,
+    "ruth": 8,
+    "1sam": 9,
+    "2sam": 10,
+    "1kgs": 11,
+    "2kgs": 12,
+    "1chr": 13,
+    "2chr": 14,
+    "ezra": 15,
+    "neh": 16,
+    "esth": 17,
+    "job": 18,
     "ps": 19,
     "prov": 20,
+    "eccl": 21,
+    "song": 22,
     "isa": 23,
     "jer": 24,
+    "lam": 25,
+    "ezek": 26,
     "dan": 27,
+    "hos": 28,
+    "joel": 29,
+    "amos": 30,
+    "obad": 31,
+    "jonah": 32,
     "mic": 33,
+    "nah": 34,
     "hab": 35,
+    "zeph": 36,
+    "hag": 37,
+    "zech": 38,
     "mal": 39,
 }
 
 # Cache for fetched chapters to avoid re-fetching
 CHAPTER_CACHE = {}
-
-def fetch_verse(book: str, chapter: int, verse: int) -> str:
-    """Fetch a single verse from bolls.life API."""
-    book_num = BOOK_NUMBERS.get(book, 1)
-    cache_key = f"{book_num}_{chapter}"
-
-    # Check cache first
-    if cache_key not in CHAPTER_CACHE:
-        url = f"{API_BASE}/{book_num}/{chapter}/"
-
+# Chapters whose last fetch attempt failed: key -> error message
+FAILED_CHAPTERS = {}
+
+def chapter_key(book: str, chapter: int) -> str:
+    """Cache key for a chapter, e.g. "1_1" for Genesis 1."""
+    return f"{BOOK_NUMBERS.get(book, 1)}_{chapter}"
+
+def chapter_url(book: str, chapter: int, api_base: str = API_BASE) -> str:
+    """bolls.life URL for a whole chapter."""
+    return f"{api_base}/{BOOK_NUMBERS.get(book, 1)}/{chapter}/"
+
+def parse_chapter(data: Any) -> dict:
+    """Map verse numbers to text from a bolls.life chapter payload."""
+    if isinstance(data, list):
+        return {v.get('verse', 0): v.get('text', '') for v in data}
+    return {}
+
+def prefetch_chapters(
+    selections: list,
+    api_base: str = API_BASE,
+    workers: int = 8,
+    per_host: int = 4,
+    rate: float = 5.0,
+    disk_cache: ChapterCache | None = None,
+    profiler: Profiler | None = None,
+    retry: RetryPolicy | None = None,
+    journal: RunJournal | None = None,
+) -> int:
+    """
+    Download every distinct chapter referenced by `selections` into CHAPTER_CACHE.
+
+    Verses are grouped by (book, chapter) first, so the number of requests
+    depends on distinct chapters rather than on verses. With a `disk_cache`,
+    chapters are read from and revalidated against it. Returns the number of
+    chapters requested. With a `profiler`, each chapter request's latency
+    is recorded in the "chapterFetch" histogram.
+
+    Failed requests are retried as `retry` allows; chapters that still fail
+    are left out of CHAPTER_CACHE and listed in FAILED_CHAPTERS. Each chapter
+    downloaded is checkpointed to `journal`.
+    """
+    chapters = unique_in_order((s[0], s[1]) for s in selections)
+    pending = {
+        chapter_key(book, chapter): (book, chapter)
+        for book, chapter in chapters
+        if chapter_key(book, chapter) not in CHAPTER_CACHE
+    }
+    if disk_cache is not None:
+        for key in list(pending):
+            data = disk_cache.lookup(key)
+            if data is not None:
+                CHAPTER_CACHE[key] = parse_chapter(data)
+                del pending[key]
+            elif disk_cache.offline:
+                book, chapter = pending.pop(key)
+                disk_cache.count("offline_miss")
+                print(f"  Warning: Chapter {book} {chapter} is not cached (offline mode)")
+                FAILED_CHAPTERS[key] = "not cached (offline mode)"
+    if not pending:
+        return 0
+
+    print(f"  Fetching {len(pending)} chapters for {len(selections)} verses "
+          f"({workers} workers, {per_host} per host, {rate:g} req/s)...")
+
+    def on_done(key: str, data: Any, error: Exception | None) -> None:
+        book, chapter = pending[key]
+        if error is not None:
+            print(f"  Warning: Failed to fetch chapter {book} {chapter}: {error}")
+            FAILED_CHAPTERS[key] = str(error)
+            return
+        CHAPTER_CACHE[key] = parse_chapter(data)
+        FAILED_CHAPTERS.pop(key, None)
+        if journal is not None:
+            journal.record(key, CHAPTER_CACHE[key])
+
+    urls = {key: chapter_url(book, chapter, api_base) for key, (book, chapter) in pending.items()}
+    fetch = get_json
+    if disk_cache is not None:
+        url_keys = {url: key for key, url in urls.items()}
+        fetch = lambda url: disk_cache.fetch(url_keys[url], url)
+    if profiler is not None:
+        fetch = timed_fetch(fetch, profiler)
+    fetch_all(urls, workers=workers, per_host=per_host, rate=rate, fetch=fetch, on_done=on_done, retry=retry)
+    return len(pending)
+
+def resume_chapters(journal: RunJournal) -> int:
+    """Load the chapters an earlier, unfinished run checkpointed into CHAPTER_CACHE."""
+    chapters = journal.load()
+    CHAPTER_CACHE.update(chapters)
+    for key in chapters:
+        FAILED_CHAPTERS.pop(key, None)
+    return len(chapters)
+
+def report_failures(selections: list) -> None:
+    """Summarize the chapters that could not be fetched and the verses they hold."""
+    verses: dict[str, int] = {}
+    chapters = {}
+    for book, chapter, *_ in selections:
+        key = chapter_key(book, chapter)
+        if key in FAILED_CHAPTERS:
+            verses[key] = verses.get(key, 0) + 1
+            chapters[key] = (book, chapter)
+    print(f"\nUnrecoverable chapters ({len(chapters)}, {sum(verses.values())} verses):")
+    for key, (book, chapter) in chapters.items():
+        name = BOOK_NAMES.get(book, (book.title(),))[0]
+        print(f"  {name} {chapter} ({verses[key]} verses): {FAILED_CHAPTERS[key]}")
+
+def timed_fetch(fetch: Callable[[str], Any], profiler: Profiler) -> Callable[[str], Any]:
+    """Wrap `fetch` so every call's latency lands in the "chapterFetch" histogram."""
+    def run(url: str) -> Any:
+        start = time.perf_counter()
         try:
-            with urllib.request.urlopen(url, timeout=30) as response:
-                data = json.loads(response.read().decode('utf-8'))
-                if isinstance(data, list):
-                    # Build a dict mapping verse numbers to text
-                    CHAPTER_CACHE[cache_key] = {v.get('verse', 0): v.get('text', '') for v in data}
-                else:
-                    CHAPTER_CACHE[cache_key] = {}
-        except Exception as e:
-            print(f"  Warning: Failed to fetch chapter {book} {chapter}: {e}")
-            CHAPTER_CACHE[cache_key] = {}
-
-    # Get specific verse from cache
-    return CHAPTER_CACHE.get(cache_key, {}).get(verse, "")
+            return fetch(url)
+        finally:
+            profiler.observe("chapterFetch", time.perf_counter() - start)
+    return run
 
 def get_reference(book: str, chapter: int, verse: int) -> str:
     """Generate human-readable reference."""
     name, _ = BOOK_NAMES.get(book, (book.title(), ""))
     return f"{name} {chapter}:{verse}"
 
-def main():
-    """Main function to fetch verses and build JSON."""
-    print("Fetching Hebrew OT verses from bolls.life...")
-
+def build_verse_entries(selections: list) -> list[dict]:
+    """Verse records for `selections`, using chapters already in CHAPTER_CACHE."""
     verses = []
-    total = len(CURATED_VERSES)
-
-    for i, (book, chapter, verse, difficulty, key_terms, notes) in enumerate(CURATED_VERSES):
-        print(f"  [{i+1}/{total}] Fetching {book} {chapter}:{verse}...")
+    total = len(selections)
 
-        hebrew_text = fetch_verse(book, chapter, verse)
+    for i, (book, chapter, verse, difficulty, key_terms, notes) in enumerate(selections):
+        hebrew_text = CHAPTER_CACHE.get(chapter_key(book, chapter), {}).get(verse, "")
 
         if not hebrew_text:
-            print(f"    Skipping - no text returned")
+            print(f"  [{i+1}/{total}] Skipping {book} {chapter}:{verse} - no text returned")
             continue
 
         verse_entry = {
@@ -256,10 +443,10 @@ def main():
 
         verses.append(verse_entry)
 
-        # Be nice to the API
-        time.sleep(0.2)
+    return verses
 
-    # Build books list
+def build_books(verses: list[dict]) -> list[dict]:
+    """Books list covering every book that has verses."""
     books_used = set(v["book"] for v in verses)
     books = []
     for book_id in sorted(books_used, key=lambda x: BOOK_NUMBERS.get(x, 99)):
@@ -272,16 +459,370 @@ def main():
             "chapters": chapters
         })
 
+    return books
+
+def curated_metadata(selections: list) -> dict[tuple[str, int, int], tuple[int, list[str], str]]:
+    """(book, chapter, verse) -> (difficulty, key_terms, notes) for the curated verses."""
+    return {(b, c, v): (difficulty, key_terms, notes) for b, c, v, difficulty, key_terms, notes in selections}
+
+def osis_verse_entry(verse: OsisVerse, curated: dict) -> dict:
+    """App verse record for an OSIS verse, with curated metadata if there is any."""
+    difficulty, key_terms, notes = curated.get((verse.book, verse.chapter, verse.verse), (DEFAULT_DIFFICULTY, [], ""))
+    return {
+        "id": f"{verse.book}_{verse.chapter}_{verse.verse}",
+        "book": verse.book,
+        "chapter": verse.chapter,
+        "verse": verse.verse,
+        "reference": get_reference(verse.book, verse.chapter, verse.verse),
+        "hebrew": verse.text,
+        "transliteration": "",
+        "referenceTranslation": "",
+        "keyTerms": key_terms,
+        "difficulty": difficulty,
+        "notes": notes,
+    }
+
+class VerseWriter:
+    """
+    Streams verse records to `out_dir` and writes index.json on close.
+
+    Files are written through temp files, so an interrupted run leaves the
+    previous output in place.
+    """
+
+    format = ""
+
+    def __init__(self, out_dir: str):
+        self.out_dir = out_dir
+        self.books: dict[str, dict] = {}
+        self.total = 0
+        self.stack = ExitStack()
+
+    def __enter__(self) -> "VerseWriter":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.stack.__exit__(*exc)
+        if exc[0] is None:
+            self.write_index()
+
+    def write(self, entry: dict) -> None:
+        book = entry["book"]
+        if book not in self.books:
+            name, hebrew_name = BOOK_NAMES.get(book, (book.title(), ""))
+            self.books[book] = {"id": book, "name": name, "hebrewName": hebrew_name, "chapters": 0, "verses": 0}
+        info = self.books[book]
+        info["chapters"] = max(info["chapters"], entry["chapter"])
+        info["verses"] += 1
+        self.total += 1
+
+    def write_index(self) -> None:
+        index = {
+            "version": VERSES_INDEX_VERSION,
+            "format": self.format,
+            "totalVerses": self.total,
+            "books": list(self.books.values()),
+        }
+        write_atomic(os.path.join(self.out_dir, "index.json"), json.dumps(index, ensure_ascii=False, indent=2).encode('utf-8'))
+
+class NdjsonVerseWriter(VerseWriter):
+    """All verses in verses.ndjson, one JSON object per line."""
+
+    format = "ndjson"
+
+    def __init__(self, out_dir: str):
+        super().__init__(out_dir)
+        self.file = self.stack.enter_context(open_atomic(os.path.join(out_dir, "verses.ndjson"), 'w', 'utf-8'))
+
+    def write(self, entry: dict) -> None:
+        super().write(entry)
+        self.books[entry["book"]]["file"] = "verses.ndjson"
+        self.file.write(json.dumps(entry, ensure_ascii=False) + "\n")
+
+class BookVerseWriter(VerseWriter):
+    """One JSON array per book (gen.json, exod.json, ...), written as verses arrive."""
+
+    format = "books"
+
+    def __init__(self, out_dir: str):
+        super().__init__(out_dir)
+        self.book = None
+        self.file = None
+
+    def write(self, entry: dict) -> None:
+        book = entry["book"]
+        if book != self.book:
+            if book in self.books:
+                raise ValueError(f"verses for {book} are not contiguous in the source")
+            self.finish_book()
+            self.book = book
+            self.file = self.stack.enter_context(open_atomic(os.path.join(self.out_dir, f"{book}.json"), 'w', 'utf-8'))
+            self.file.write("[\n")
+        else:
+            self.file.write(",\n")
+        super().write(entry)
+        self.books[book]["file"] = f"{book}.json"
+        self.file.write(json.dumps(entry, ensure_ascii=False))
+
+    def finish_book(self) -> None:
+        if self.file is not None:
+            self.file.write("\n]\n")
+            # Closing the stack renames the finished file into place
+            self.stack.close()
+            self.file = None
+
+    def __exit__(self, *exc) -> None:
+        if exc[0] is None:
+            self.finish_book()
+        super().__exit__(*exc)
+
+VERSE_WRITERS = {"books": BookVerseWriter, "ndjson": NdjsonVerseWriter}
+
+def ingest_osis(
+    source: str,
+    out_dir: str = VERSES_DIR,
+    fmt: str = "books",
+    selections: list = CURATED_VERSES,
+    profiler: Profiler | None = None,
+    word_index: verse_index.VerseIndexBuilder | None = None,
+    glosses: key_terms.GlossIndex | None = None,
+    difficulty: verse_difficulty.DifficultyBuilder | None = None,
+) -> dict:
+    """
+    Stream every verse of an OSIS corpus to `out_dir`, joining curated metadata.
+
+    Only the verse being written is held in memory. Each verse is also linked
+    to the vocabulary if `word_index` and `glosses` are given (see
+    link_vocabulary) and collected for `difficulty` scoring. Returns the
+    books summary written to index.json.
+    """
+    profiler = profiler or Profiler("fetch-verses")
+    curated = curated_metadata(selections)
+    found = set()
+
+    with VERSE_WRITERS[fmt](out_dir) as writer:
+        for verse in profiler.timed_iter(iter_osis_verses(source), "parse"):
+            key = (verse.book, verse.chapter, verse.verse)
+            if key in curated:
+                found.add(key)
+            entry = osis_verse_entry(verse, curated)
+            link_vocabulary(entry, word_index, glosses)
+            if difficulty is not None:
+                difficulty.add(entry["id"], entry["hebrew"])
+            writer.write(entry)
+
+    for book, chapter, verse in curated:
+        if (book, chapter, verse) not in found:
+            print(f"  Warning: Curated verse {book} {chapter}:{verse} is not in {source}")
+    print(f"\nWrote {writer.total} verses from {len(writer.books)} books to {out_dir} "
+          f"({len(found)} of {len(curated)} curated verses matched)")
+    profiler.count("verses", writer.total)
+    return writer.books
+
+def link_vocabulary(
+    entry: dict,
+    word_index: verse_index.VerseIndexBuilder | None,
+    glosses: key_terms.GlossIndex | None,
+) -> None:
+    """Add a verse to the word index and resolve its key terms, favouring lemmas in the verse."""
+    if word_index is None:
+        return
+    found = word_index.add(entry["id"], entry["hebrew"])
+    if glosses is not None and entry["keyTerms"]:
+        entry["keyTermIds"] = glosses.resolve(entry["keyTerms"], found)
+
+def write_word_index(word_index: verse_index.VerseIndexBuilder | None, path: str | None, profiler: Profiler) -> None:
+    if word_index is None or path is None:
+        return
+    with profiler.stage("index"):
+        word_index.write(path)
+    word_index.report(path)
+
+def write_difficulty(
+    difficulty: verse_difficulty.DifficultyBuilder | None,
+    path: str,
+    selections: list,
+    profiler: Profiler,
+) -> None:
+    if difficulty is None:
+        return
+    with profiler.stage("difficulty"):
+        data = difficulty.write(path)
+    curated = {f"{b}_{c}_{v}": level for b, c, v, level, _, _ in selections}
+    verse_difficulty.report(data, path, curated)
+
+def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Fetch curated Hebrew OT verses.")
+    parser.add_argument("--output", default=OUTPUT_PATH, help="Path of the verses JSON to write")
+    parser.add_argument("--api-base", default=API_BASE, help="Chapter API base URL")
+    parser.add_argument("--workers", type=int, default=8, help="Concurrent chapter downloads")
+    parser.add_argument("--per-host", type=int, default=4, help="Max in-flight requests per host")
+    parser.add_argument("--rate", type=float, default=5.0, help="Max requests started per second (0 = unlimited)")
+    parser.add_argument("--cache-dir", default=CACHE_DIR, help="On-disk chapter cache directory")
+    parser.add_argument("--no-cache", action="store_true", help="Bypass the on-disk chapter cache")
+    parser.add_argument("--offline", action="store_true", help="Only use cached chapters; never hit the network")
+    parser.add_argument("--cache-max-age", type=float, default=DEFAULT_MAX_AGE,
+                        help="Seconds a cached chapter is used without revalidation")
+    parser.add_argument("--cache-ttl", type=float, default=DEFAULT_TTL,
+                        help="Evict cached chapters unused for this many seconds")
+    parser.add_argument("--cache-max-mb", type=float, default=None, help="Evict LRU chapters above this size")
+    parser.add_argument("--retries", type=int, default=3, help="Retries per chapter after a transient failure")
+    parser.add_argument("--backoff", type=float, default=0.5,
+                        help="Base backoff in seconds; retry n waits a random time up to base * 2**n")
+    parser.add_argument("--retry-budget", type=int, default=None,
+                        help="Max retries across the run (default: a tenth of the chapters, at least 10)")
+    parser.add_argument("--journal", default=JOURNAL_PATH, help="Checkpoint journal for resuming an unfinished run")
+    parser.add_argument("--fresh", action="store_true", help="Ignore the journal of an unfinished run and fetch everything")
+    parser.add_argument("--allow-partial", action="store_true",
+                        help="Write the output even if some chapters could not be fetched")
+    parser.add_argument("--osis", default=None, help="Ingest every verse from a local OSIS file or directory instead")
+    parser.add_argument("--format", choices=sorted(VERSE_WRITERS), default="books",
+                        help="Output layout for --osis: one JSON file per book, or one NDJSON file")
+    parser.add_argument("--out-dir", default=VERSES_DIR, help="Output directory for --osis")
+    parser.add_argument("--vocabulary", default=verse_index.VOCABULARY_PATH, help="Vocabulary to index verses and resolve key terms against")
+    parser.add_argument("--index", default=verse_index.INDEX_PATH, help="Path of the word <-> verse index")
+    parser.add_argument("--no-index", action="store_true", help="Skip writing the word <-> verse index")
+    parser.add_argument("--difficulty", default=verse_difficulty.DIFFICULTY_PATH, help="Path of the verse difficulty scores")
+    parser.add_argument("--no-difficulty", action="store_true", help="Skip scoring verse difficulty")
+    parser.add_argument("--watch", action="store_true",
+                        help="Keep running and rebuild when CURATED_VERSES, BOOK_NAMES or the vocabulary change")
+    add_profile_arguments(parser)
+    args = parser.parse_args(argv)
+    if args.watch and args.osis:
+        parser.error("--watch does not support --osis")
+    return args
+
+def main(argv: list[str] | None = None):
+    """Main function to fetch verses and build JSON."""
+    args = parse_args(argv)
+    profiler = Profiler.from_args("fetch-verses", args)
+    with profiler:
+        status = build(args, profiler)
+    profiler.report()
+    if args.report:
+        profiler.write_report(args.report)
+        print(f"Wrote run report to {args.report}")
+    if args.watch:
+        watch(args)
+    return status
+
+def watch(args: argparse.Namespace, **options) -> None:
+    """
+    Rebuild whenever this script or the vocabulary changes; `options` go to
+    build_watch.watch.
+
+    An edited script is loaded again so the new CURATED_VERSES and
+    BOOK_NAMES apply. The chapters already downloaded are handed to it, so
+    only chapters of newly added verses are fetched.
+    """
+    script = os.path.abspath(__file__)
+    module = sys.modules[__name__]
+
+    def rebuild(changed: set[str]) -> None:
+        nonlocal module
+        if script in changed:
+            fresh = load_script("fetch_verses_watch", script)
+            fresh.CHAPTER_CACHE.update(module.CHAPTER_CACHE)
+            module = fresh
+        module.build(args, Profiler("fetch-verses"))
+
+    build_watch.watch([script, args.vocabulary], rebuild, **options)
+
+def build(args: argparse.Namespace, profiler: Profiler) -> int:
+    """Fetch every curated verse and write the verses JSON; returns the exit status."""
+    # The vocabulary is loaded once and indexed both ways: Hebrew lemma forms
+    # for the word <-> verse index, English gloss tokens for the key terms
+    word_index = glosses = difficulty = None
+    with profiler.stage("load"):
+        words = verse_index.load_words(args.vocabulary)
+        if words is not None:
+            word_index = verse_index.VerseIndexBuilder(words)
+            glosses = key_terms.GlossIndex(words)
+            if not args.no_difficulty:
+                # --osis scores the whole OT, so hapaxes can be counted from its tokens
+                difficulty = verse_difficulty.DifficultyBuilder(words, word_index.matcher, corpus=bool(args.osis))
+    if words is None:
+        print(f"  Warning: No vocabulary at {args.vocabulary}; skipping the word/verse index, key term ids "
+              f"and difficulty scores")
+    index_path = None if args.no_index else args.index
+
+    if args.osis:
+        print(f"Ingesting Hebrew OT verses from {args.osis}...")
+        with profiler.stage("ingest"):
+            ingest_osis(args.osis, args.out_dir, args.format, CURATED_VERSES, profiler, word_index, glosses, difficulty)
+        write_word_index(word_index, index_path, profiler)
+        write_difficulty(difficulty, args.difficulty, CURATED_VERSES, profiler)
+        return 0
+
+    print("Fetching Hebrew OT verses from bolls.life...")
+
+    journal = RunJournal(args.journal, args.api_base)
+    if args.fresh:
+        journal.discard()
+    resumed = resume_chapters(journal)
+    if resumed:
+        print(f"  Resuming an unfinished run: {resumed} chapters already fetched ({args.journal})")
+
+    disk_cache = None
+    if not args.no_cache:
+        max_bytes = int(args.cache_max_mb * 1024 * 1024) if args.cache_max_mb is not None else None
+        disk_cache = ChapterCache(args.cache_dir, args.cache_max_age, args.cache_ttl, max_bytes, args.offline)
+
+    wanted = {chapter_key(s[0], s[1]) for s in CURATED_VERSES}
+    budget = args.retry_budget if args.retry_budget is not None else default_retry_budget(len(wanted))
+    retry = RetryPolicy(attempts=args.retries + 1, base=args.backoff, budget=budget)
+    with profiler.stage("fetch"):
+        try:
+            requested = prefetch_chapters(
+                CURATED_VERSES, args.api_base, args.workers, args.per_host, args.rate, disk_cache, profiler,
+                retry, journal,
+            )
+        finally:
+            journal.close()
+    profiler.count("chaptersRequested", requested)
+    profiler.count("chapterRetries", retry.retries)
+
+    failed = [key for key in FAILED_CHAPTERS if key in wanted]
+    profiler.count("chaptersFailed", len(failed))
+    if failed:
+        report_failures(CURATED_VERSES)
+        print(f"  Fetched chapters are checkpointed in {args.journal}; rerun to retry only these")
+        if not args.allow_partial:
+            if disk_cache is not None:
+                disk_cache.save()
+            print(f"  Left {args.output} unchanged (pass --allow-partial to write the verses that were fetched)")
+            return 1
+    else:
+        journal.discard()
+
+    with profiler.stage("transform"):
+        verses = build_verse_entries(CURATED_VERSES)
+        books = build_books(verses)
+    profiler.count("verses", len(verses))
+
+    with profiler.stage("link"):
+        for v in verses:
+            link_vocabulary(v, word_index, glosses)
+            if difficulty is not None:
+                difficulty.add(v["id"], v["hebrew"])
+
     output = {
         "books": books,
         "verses": verses
     }
 
-    output_path = "/home/jonathan/hebrew-vocab/src/data/ot-verses.json"
-    with open(output_path, 'w', encoding='utf-8') as f:
-        json.dump(output, f, ensure_ascii=False, indent=2)
+    output_path = args.output
+    with profiler.stage("serialize"):
+        data = json.dumps(output, ensure_ascii=False, indent=2)
+    with profiler.stage("write"):
+        with open_atomic(output_path, 'w', encoding='utf-8') as f:
+            f.write(data)
 
     print(f"\nWrote {len(verses)} verses to {output_path}")
+    if glosses is not None:
+        key_terms.report(verses)
+    write_word_index(word_index, index_path, profiler)
+    write_difficulty(difficulty, args.difficulty, CURATED_VERSES, profiler)
 
     # Statistics
     difficulty_counts = {}
@@ -302,5 +843,11 @@ def main():
     for b, count in sorted(book_counts.items(), key=lambda x: -x[1]):
         print(f"  {BOOK_NAMES.get(b, (b,))[0]}: {count} verses")
 
+    if disk_cache is not None:
+        with profiler.stage("write"):
+            disk_cache.save()
+        disk_cache.report()
+    return 1 if failed else 0
+
 if __name__ == "__main__":
-    main()
+    sys.exit(main())
@@ -4,21 +4,94 @@ Fetch Hebrew vocabulary from online sources and transform to app format.
 
 Sources:
 - OpenScriptures Strong's Hebrew Dictionary (primary)
-- Frequency data from corpus analysis
-
-Output: src/data/vocabulary.json
+- Frequency data from corpus analysis: counted from a local Strong's-tagged
+  OSIS corpus with --corpus (see corpus_frequency.py), otherwise the
+  curated FREQUENCY_DATA below
+
+Output:
+- src/data/vocabulary.json (each word also carries its consonantal form and
+  the pronunciation breakdown of src/lib/hebrew.ts, see hebrew_text.py)
+- src/data/vocabulary.bin (columnar binary for offline tools, see vocab_binary.py)
+- public/data/vocabulary/ (minified per-tier shards, see vocab_shards.py)
+- public/data/relations.json (precomputed word relations, see word_relations.py)
+- public/data/search-index.json (prefix and token search index, see search_index.py)
+- public/data/distractors.json (quiz distractor pools per word, see distractors.py)
+- public/data/root-families.json (words grouped by derivation links, see root_families.py)
+- public/data/articles/ (TDOT and Vine's articles in chunks with an offset
+  manifest; words with articles list them, see dictionary_articles.py)
+- public/data/vocabulary-patches/ (versioned patches from the previous build
+  plus a manifest with content hashes, see vocab_patches.py)
+
+With --watch the script keeps the parsed dictionary in memory after the
+build and rebuilds whenever FREQUENCY_DATA, the classifier tables or a
+TDOT/Vine dictionary is edited (see build_watch.py). Watch rebuilds write
+vocabulary.json, which is what the app imports, and only the outputs named
+with --watch-outputs; they do not version the vocabulary either. The next
+build without --watch writes the rest and patches from the version clients
+last got, which the watch set aside.
 """
 
+import argparse
 import json
+import os
 import re
+import shutil
+import sys
 import urllib.request
-from typing import Any
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Iterable, Iterator, Mapping
+
+import build_watch
+import classifier
+import corpus_frequency
+import dictionary_articles
+import distractors
+import root_families
+import search_index
+import vocab_binary
+import vocab_patches
+import vocab_shards
+import word_relations
+from build_io import REPO_ROOT, VOCABULARY_PATH, load_script, open_atomic
+from build_manifest import BuildManifest, digest
+from classifier import (
+    ADJECTIVE_EXCLUDE_KEYWORDS,
+    ADJECTIVE_KEYWORDS,
+    ADVERB_KEYWORD,
+    CLASSIFIER_VERSION,
+    CONJUNCTION_KEYWORD,
+    FEMININE_KEYWORDS,
+    PARTICLE_KEYWORDS,
+    PREPOSITION_KEYWORDS,
+    PREPOSITION_MAX_LENGTH,
+    PRONOUN_KEYWORDS,
+    SEMANTIC_CATEGORIES,
+    VERB_DERIVATION_KEYWORD,
+    VERB_KEYWORDS,
+    get_classifier,
+)
+from pipeline_profile import Profiler, add_arguments as add_profile_arguments
+from strongs_stream import iter_strongs_dictionary
+from word_model import Word, as_dict
 
 # URLs
 OPENSCRIPTURES_URL = "https://raw.githubusercontent.com/openscriptures/strongs/master/hebrew/strongs-hebrew-dictionary.js"
 
+OUTPUT_PATH = VOCABULARY_PATH
+MANIFEST_PATH = os.path.join(REPO_ROOT, ".cache", "vocabulary-manifest.json")
+# What the article chunks and the `articles` of words are built from
+DICTIONARY_PATHS = frozenset(os.path.abspath(p) for p in dictionary_articles.DICTIONARIES.values())
+# Outputs built from the words, named as their --no-... options
+DERIVED_OUTPUTS = ("shards", "binary", "relations", "search-index", "distractors", "families")
+
+# Bump when extract_gloss, calculate_tier, clean_transliteration,
+# transform_entry or hebrew_text change what they produce for the same input
+TRANSFORM_VERSION = 2
+
 # Frequency data from Hebrew OT corpus (based on standard BHS frequency lists)
-# This is a curated list of the most common Hebrew words with their frequencies
+# This is a curated list of the most common Hebrew words with their frequencies,
+# used when the build is not given a corpus to count
 FREQUENCY_DATA = {
     # Tier 1: freq >= 500 (most common ~100 words)
     "H3068": 6828,  # יְהוָה YHWH
@@ -258,41 +331,43 @@ FREQUENCY_DATA = {
     "H817": 46,     # אָשָׁם asham (guilt offering)
 }
 
-# Part of speech mapping based on Strong's patterns
+# Part of speech mapping based on Strong's patterns.
+# Reference implementation of the ordering rules; the build uses the
+# precompiled KeywordClassifier, which must agree with these two functions.
 def determine_pos(strongs_def: str, derivation: str) -> str:
     """Determine part of speech from Strong's definition."""
     def_lower = strongs_def.lower()
     deriv_lower = derivation.lower() if derivation else ""
 
     # Check for verb indicators
-    if any(word in def_lower for word in ["to ", "a primitive root"]):
+    if any(word in def_lower for word in VERB_KEYWORDS):
         return "verb"
-    if "primitive root" in deriv_lower:
+    if VERB_DERIVATION_KEYWORD in deriv_lower:
         return "verb"
 
     # Check for adjective indicators
-    if any(word in def_lower for word in ["adjective", " great", " good", " holy", " evil"]):
-        if not any(word in def_lower for word in ["to be", "to make"]):
+    if any(word in def_lower for word in ADJECTIVE_KEYWORDS):
+        if not any(word in def_lower for word in ADJECTIVE_EXCLUDE_KEYWORDS):
             return "adjective"
 
     # Check for adverb
-    if "adverb" in def_lower:
+    if ADVERB_KEYWORD in def_lower:
         return "adverb"
 
     # Check for preposition
-    if any(word in def_lower for word in ["preposition", "upon", "from", "to", "in"]) and len(def_lower) < 50:
+    if any(word in def_lower for word in PREPOSITION_KEYWORDS) and len(def_lower) < PREPOSITION_MAX_LENGTH:
         return "preposition"
 
     # Check for conjunction
-    if "conjunction" in def_lower:
+    if CONJUNCTION_KEYWORD in def_lower:
         return "conjunction"
 
     # Check for pronoun
-    if any(word in def_lower for word in ["pronoun", " i ", " he ", " she ", " you ", " they "]):
+    if any(word in def_lower for word in PRONOUN_KEYWORDS):
         return "pronoun"
 
     # Check for particle
-    if "particle" in def_lower or "interjection" in def_lower:
+    if any(word in def_lower for word in PARTICLE_KEYWORDS):
         return "particle"
 
     # Default to noun
@@ -302,24 +377,7 @@ def determine_semantic_category(definition: str, hebrew: str) -> str:
     """Categorize word into semantic domain."""
     def_lower = definition.lower()
 
-    categories = {
-        "theological": ["god", "lord", "holy", "worship", "pray", "sacred", "divine", "covenant", "salvation"],
-        "creation": ["heaven", "earth", "sea", "land", "mountain", "water", "sun", "moon", "star", "tree", "animal"],
-        "human": ["man", "woman", "son", "daughter", "father", "mother", "brother", "child", "people", "nation"],
-        "body": ["hand", "eye", "heart", "face", "mouth", "head", "foot", "blood", "bone", "flesh"],
-        "action": ["walk", "go", "come", "give", "take", "make", "do", "say", "speak", "hear", "see"],
-        "emotion": ["love", "hate", "fear", "joy", "anger", "sorrow", "peace"],
-        "legal": ["law", "judge", "command", "righteous", "wicked", "sin", "guilt"],
-        "warfare": ["sword", "war", "battle", "fight", "enemy", "army", "victory"],
-        "royalty": ["king", "prince", "throne", "reign", "rule", "kingdom"],
-        "worship": ["priest", "sacrifice", "altar", "temple", "offering", "tabernacle"],
-        "time": ["day", "night", "year", "month", "morning", "evening", "eternity"],
-        "quantity": ["all", "many", "few", "great", "small", "number"],
-        "abstract": ["truth", "wisdom", "knowledge", "glory", "power", "righteousness"],
-        "domestic": ["house", "bread", "food", "wine", "oil", "garment", "gold", "silver"],
-    }
-
-    for category, keywords in categories.items():
+    for category, keywords in SEMANTIC_CATEGORIES.items():
         if any(kw in def_lower for kw in keywords):
             return category
 
@@ -363,119 +421,520 @@ def clean_transliteration(xlit: str) -> str:
     clean = xlit.replace("ʼ", "'").replace("ʻ", "'")
     return clean
 
-def fetch_openscriptures_data() -> dict:
-    """Fetch and parse OpenScriptures Strong's Hebrew dictionary."""
+def fetch_openscriptures_data(profiler: Profiler | None = None) -> Iterator[tuple[str, dict]]:
+    """
+    Stream `(strongs_num, entry)` pairs from the OpenScriptures Strong's Hebrew dictionary.
+
+    With a `profiler`, network reads are timed as the "fetch" stage and
+    decoding as "parse".
+    """
     print("Fetching OpenScriptures Strong's Hebrew dictionary...")
+    profiler = profiler or Profiler("fetch-vocabulary")
 
+    count = 0
     with urllib.request.urlopen(OPENSCRIPTURES_URL) as response:
-        content = response.read().decode('utf-8')
-
-    # The file is JavaScript, need to extract the JSON object
-    # Format: var strongsHebrewDictionary = { ... };\nmodule.exports = ...
-    match = re.search(r'var\s+strongsHebrewDictionary\s*=\s*(\{.*?\});\s*(?:module\.exports|$)', content, re.DOTALL)
-    if not match:
-        raise ValueError("Could not parse OpenScriptures dictionary")
-
-    json_str = match.group(1)
-    # Fix potential JSON issues (trailing commas, etc.)
-    json_str = re.sub(r',\s*}', '}', json_str)
-    json_str = re.sub(r',\s*]', ']', json_str)
-
-    data = json.loads(json_str)
-    print(f"Parsed {len(data)} entries from OpenScriptures")
-    return data
-
-def transform_to_app_format(openscriptures_data: dict) -> list:
-    """Transform OpenScriptures data to app vocabulary format."""
-    words = []
-
-    for strongs_num, entry in openscriptures_data.items():
-        if not strongs_num.startswith('H'):
-            continue
-
-        # Get frequency from our data or default to low
-        frequency = FREQUENCY_DATA.get(strongs_num, 5)
-        tier = calculate_tier(frequency)
-
-        # Extract fields
-        hebrew = entry.get('lemma', '')
-        transliteration = clean_transliteration(entry.get('xlit', ''))
-        strongs_def = entry.get('strongs_def', '')
-        kjv_def = entry.get('kjv_def', '')
-        derivation = entry.get('derivation', '')
-
-        # Combined definition
-        definition = f"{strongs_def}. {kjv_def}".strip('. ')
-        if not definition:
-            definition = derivation
-
-        gloss = extract_gloss(strongs_def if strongs_def else kjv_def)
-        pos = determine_pos(strongs_def, derivation)
-        semantic_category = determine_semantic_category(definition, hebrew)
-
-        word_entry = {
-            "id": strongs_num,
-            "hebrew": hebrew,
-            "transliteration": transliteration,
-            "gloss": gloss,
-            "definition": definition,
-            "partOfSpeech": pos,
-            "frequency": frequency,
-            "tier": tier,
-            "strongs": strongs_num,
-            "semanticCategory": semantic_category,
-            "morphology": {}
-        }
-
-        # Add basic morphology for nouns
-        if pos == "noun":
-            # Try to detect gender from definition
-            if any(word in definition.lower() for word in ["feminine", "woman", "wife", "daughter", "mother"]):
-                word_entry["morphology"]["gender"] = "feminine"
-            else:
-                word_entry["morphology"]["gender"] = "masculine"
-
-        words.append(word_entry)
+        entries = iter_strongs_dictionary(profiler.timed_reader(response, "fetch"))
+        for strongs_num, entry in profiler.timed_iter(entries, "parse"):
+            count += 1
+            yield strongs_num, entry
+
+    print(f"Parsed {count} entries from OpenScriptures")
+
+def curated_frequency(strongs_num: str) -> int:
+    """Frequency from FREQUENCY_DATA, or a low default."""
+    return FREQUENCY_DATA.get(strongs_num, 5)
+
+def transform_record(strongs_num: str, entry: dict, frequency: int | None = None) -> Word:
+    """Transform one OpenScriptures entry to a compact vocabulary record."""
+    # Get frequency from our data or default to low
+    if frequency is None:
+        frequency = curated_frequency(strongs_num)
+    tier = calculate_tier(frequency)
+
+    # Extract fields
+    hebrew = entry.get('lemma', '')
+    transliteration = clean_transliteration(entry.get('xlit', ''))
+    strongs_def = entry.get('strongs_def', '')
+    kjv_def = entry.get('kjv_def', '')
+    derivation = entry.get('derivation', '')
+
+    # Combined definition
+    definition = f"{strongs_def}. {kjv_def}".strip('. ')
+    if not definition:
+        definition = derivation
+
+    gloss = extract_gloss(strongs_def if strongs_def else kjv_def)
+    pos, semantic_category, gender = get_classifier().classify(strongs_def, derivation, definition)
+
+    # Basic morphology for nouns, with gender detected from the definition
+    return Word(
+        strongs_num, hebrew, transliteration, gloss, definition, pos, frequency, tier, semantic_category,
+        gender if pos == "noun" else None,
+    )
+
+def transform_entry(strongs_num: str, entry: dict, frequency: int | None = None) -> dict:
+    """Transform one OpenScriptures entry to an app vocabulary word."""
+    return transform_record(strongs_num, entry, frequency).to_dict()
+
+def transform_chunk(chunk: list[tuple[int, str, dict, int]]) -> list[tuple[int, str, Word]]:
+    """Worker entry point: transform a batch of (seq, strongs_num, entry, frequency) items."""
+    return [
+        (seq, strongs_num, transform_record(strongs_num, entry, frequency))
+        for seq, strongs_num, entry, frequency in chunk
+    ]
+
+def iter_chunks(items: Iterable, size: int) -> Iterator[list]:
+    """Group items into lists of `size`."""
+    chunk = []
+    for item in items:
+        chunk.append(item)
+        if len(chunk) >= size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+def heuristics_fingerprint() -> str:
+    """Hash of everything besides the source entry and frequency that shapes a word."""
+    return digest({
+        "transform": TRANSFORM_VERSION,
+        "classifier": CLASSIFIER_VERSION,
+        "tables": [
+            VERB_KEYWORDS, VERB_DERIVATION_KEYWORD, ADJECTIVE_KEYWORDS, ADJECTIVE_EXCLUDE_KEYWORDS,
+            ADVERB_KEYWORD, PREPOSITION_KEYWORDS, PREPOSITION_MAX_LENGTH, CONJUNCTION_KEYWORD,
+            PRONOUN_KEYWORDS, PARTICLE_KEYWORDS, SEMANTIC_CATEGORIES, FEMININE_KEYWORDS,
+        ],
+    })
+
+def transform_to_app_format(
+    openscriptures_data: dict | Iterable[tuple[str, dict]],
+    jobs: int = 1,
+    chunk_size: int = 500,
+    manifest: BuildManifest | None = None,
+    profiler: Profiler | None = None,
+    frequencies: dict[str, int] | None = None,
+    articles: dict[str, tuple[str, ...]] | None = None,
+    families: root_families.FamilyBuilder | None = None,
+) -> list:
+    """Transform OpenScriptures entries to app vocabulary format; see transform_records."""
+    records = transform_records(
+        openscriptures_data, jobs, chunk_size, manifest, profiler, frequencies, articles, families,
+    )
+    return [word.to_dict() for word in records]
+
+def transform_records(
+    openscriptures_data: dict | Iterable[tuple[str, dict]],
+    jobs: int = 1,
+    chunk_size: int = 500,
+    manifest: BuildManifest | None = None,
+    profiler: Profiler | None = None,
+    frequencies: dict[str, int] | None = None,
+    articles: dict[str, tuple[str, ...]] | None = None,
+    families: root_families.FamilyBuilder | None = None,
+) -> list[Word]:
+    """
+    Transform OpenScriptures entries (a dict or a stream of pairs) to compact
+    vocabulary records (see word_model.py), sorted as in the app format.
+
+    With `jobs` > 1 the entries are transformed in chunks on a process pool.
+    With a `manifest`, words whose inputs are unchanged since the last build
+    are copied from the previous output instead of being transformed.
+    Either way the result is identical to a full serial run.
+
+    `frequencies` (Strong's number -> occurrences, e.g. from
+    corpus_frequency.count_corpus) replaces FREQUENCY_DATA; numbers that
+    never occur get 0.
+
+    `articles` (Strong's number -> dictionary sources, see
+    dictionary_articles.article_sources) sets each word's `articles`.
+    Every entry's derivation, reused or not, is added to `families`.
+    """
+    profiler = profiler or Profiler("fetch-vocabulary")
+    if isinstance(openscriptures_data, dict):
+        openscriptures_data = openscriptures_data.items()
+
+    # Keyed by id; the entry seen last wins, as json.loads would for a repeated key
+    words = {}
+    inputs = {}
+
+    def merge(seq: int, strongs_num: str, word: Word, reused: bool = False) -> None:
+        if strongs_num in words and words[strongs_num][0] > seq:
+            return
+        words[strongs_num] = (seq, word)
+        if articles is not None:
+            word.articles = articles.get(strongs_num, ())
+        if manifest is not None:
+            manifest.record(strongs_num, inputs[strongs_num], word.to_dict(), reused)
+
+    def frequency_of(strongs_num: str) -> int:
+        if frequencies is None:
+            return curated_frequency(strongs_num)
+        return frequencies.get(strongs_num, 0)
+
+    def to_build() -> Iterator[tuple[int, str, dict, int]]:
+        for seq, (strongs_num, entry) in enumerate(openscriptures_data):
+            if not strongs_num.startswith('H'):
+                continue
+            frequency = frequency_of(strongs_num)
+            if families is not None:
+                families.add(strongs_num, entry)
+            if manifest is not None:
+                entry_inputs = manifest.inputs(entry, frequency)
+                inputs[strongs_num] = entry_inputs
+                word = manifest.reuse(strongs_num, entry_inputs)
+                if word is not None:
+                    try:
+                        merge(seq, strongs_num, Word.from_dict(word), reused=True)
+                        continue
+                    except ValueError:
+                        pass
+            yield seq, strongs_num, entry, frequency
+
+    def merge_chunk(transformed: list[tuple[int, str, Word]]) -> None:
+        for seq, strongs_num, word in transformed:
+            merge(seq, strongs_num, word)
+
+    if jobs > 1:
+        with ProcessPoolExecutor(max_workers=jobs) as pool:
+            # Bounded window of in-flight chunks so the input is still streamed
+            pending = deque()
+            for chunk in iter_chunks(to_build(), chunk_size):
+                pending.append(pool.submit(transform_chunk, chunk))
+                if len(pending) >= jobs * 2:
+                    merge_chunk(pending.popleft().result())
+            while pending:
+                merge_chunk(pending.popleft().result())
+    else:
+        for chunk in iter_chunks(to_build(), chunk_size):
+            merge_chunk(transform_chunk(chunk))
 
     # Sort by tier (most common first) then by Strong's number
-    words.sort(key=lambda w: (w['tier'], int(w['id'][1:])))
+    with profiler.stage("sort"):
+        words = sorted((word for _, word in words.values()), key=lambda w: (w.tier, int(w.strongs[1:])))
 
     return words
 
-def main():
-    """Main function to fetch and transform vocabulary data."""
+def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Fetch and transform Hebrew vocabulary.")
+    parser.add_argument("--output", default=OUTPUT_PATH, help="Path of the vocabulary JSON to write")
+    parser.add_argument("--jobs", type=int, default=1, help="Worker processes for the frequency and transform stages")
+    parser.add_argument("--chunk-size", type=int, default=500, help="Entries per worker task")
+    parser.add_argument("--manifest", default=MANIFEST_PATH, help="Build manifest used for incremental rebuilds")
+    parser.add_argument("--full", action="store_true", help="Ignore the manifest and rebuild every word")
+    parser.add_argument("--shards-dir", default=vocab_shards.SHARDS_DIR, help="Directory for per-tier vocabulary shards")
+    parser.add_argument("--no-shards", action="store_true", help="Skip writing vocabulary shards")
+    parser.add_argument("--binary", default=vocab_binary.BINARY_PATH, help="Path of the columnar binary vocabulary")
+    parser.add_argument("--no-binary", action="store_true", help="Skip writing the binary vocabulary")
+    parser.add_argument("--relations", default=word_relations.RELATIONS_PATH, help="Path of the precomputed word relations")
+    parser.add_argument("--no-relations", action="store_true", help="Skip writing word relations")
+    parser.add_argument("--search-index", default=search_index.SEARCH_INDEX_PATH, help="Path of the search index")
+    parser.add_argument("--no-search-index", action="store_true", help="Skip writing the search index")
+    parser.add_argument("--distractors", default=distractors.DISTRACTORS_PATH, help="Path of the quiz distractor pools")
+    parser.add_argument("--no-distractors", action="store_true", help="Skip writing quiz distractor pools")
+    parser.add_argument("--families", default=root_families.FAMILIES_PATH, help="Path of the root families")
+    parser.add_argument("--no-families", action="store_true", help="Skip writing root families")
+    parser.add_argument("--articles-dir", default=dictionary_articles.ARTICLES_DIR,
+                        help="Directory for chunked TDOT and Vine's articles")
+    parser.add_argument("--no-articles", action="store_true",
+                        help="Skip the dictionary join: no article chunks and no `articles` on words")
+    parser.add_argument("--patches-dir", default=vocab_patches.PATCHES_DIR,
+                        help="Directory for versioned patches against the previous build")
+    parser.add_argument("--no-patches", action="store_true", help="Skip versioning the build and writing a patch")
+    parser.add_argument("--corpus", default=None,
+                        help="Strong's-tagged OSIS corpus (file or directory) to count word frequencies from")
+    parser.add_argument("--watch", action="store_true",
+                        help="Keep running and rebuild when FREQUENCY_DATA, the classifier tables or a dictionary change")
+    parser.add_argument("--watch-outputs", nargs="*", choices=DERIVED_OUTPUTS, default=[], metavar="OUTPUT",
+                        help="Outputs a watch rebuild writes besides the vocabulary "
+                             f"(any of {', '.join(DERIVED_OUTPUTS)}; by default none)")
+    add_profile_arguments(parser)
+    return parser.parse_args(argv)
+
+def write_vocabulary(
+    words: list[Mapping],
+    path: str,
+    texts: dict[str, tuple[dict, str]] | None = None,
+) -> None:
+    """
+    Write {"words": [...]} exactly as json.dumps(..., indent=2) lays it out,
+    converting one word at a time to its JSON shape.
+
+    `texts` (id -> record and its text as last written) lets a watch reuse
+    the text of every word that is the same as before; it is updated once
+    the file is written.
+    """
+    written = {}
+    with open_atomic(path, 'w', encoding='utf-8') as f:
+        if not words:
+            f.write(json.dumps({"words": []}, indent=2))
+        else:
+            f.write('{\n  "words": [\n')
+            for i, word in enumerate(words):
+                record = as_dict(word)
+                cached = texts.get(record["id"]) if texts else None
+                if cached is not None and cached[0] == record:
+                    text = cached[1]
+                else:
+                    text = json.dumps(record, ensure_ascii=False, indent=2).replace('\n', '\n    ')
+                if texts is not None:
+                    written[record["id"]] = (record, text)
+                f.write((',\n    ' if i else '    ') + text)
+            f.write('\n  ]\n}')
+    if texts is not None:
+        texts.clear()
+        texts.update(written)
+
+def load_previous_words(path: str) -> list[dict]:
+    """Words from an earlier build, or [] if there is none."""
     try:
-        # Fetch data from OpenScriptures
-        openscriptures_data = fetch_openscriptures_data()
-
-        # Transform to app format
-        words = transform_to_app_format(openscriptures_data)
-
-        print(f"\nTransformed {len(words)} words")
-
-        # Count by tier
-        tier_counts = {}
-        for word in words:
-            tier = word['tier']
-            tier_counts[tier] = tier_counts.get(tier, 0) + 1
-
-        print("\nTier distribution:")
-        for tier in sorted(tier_counts.keys()):
-            print(f"  Tier {tier}: {tier_counts[tier]} words")
+        with open(path, encoding='utf-8') as f:
+            return json.load(f).get("words", [])
+    except (OSError, ValueError):
+        return []
 
-        # Write output
-        output = {"words": words}
-        output_path = "/home/jonathan/hebrew-vocab/src/data/vocabulary.json"
-
-        with open(output_path, 'w', encoding='utf-8') as f:
-            json.dump(output, f, ensure_ascii=False, indent=2)
-
-        print(f"\nWrote vocabulary to {output_path}")
-        print(f"Total words: {len(words)}")
+def main(argv: list[str] | None = None):
+    """Main function to fetch and transform vocabulary data."""
+    args = parse_args(argv)
+    profiler = Profiler.from_args("fetch-vocabulary", args)
+    try:
+        with profiler:
+            entries = frequencies = indexed = texts = None
+            if args.watch:
+                # Watch mode parses its sources once and keeps them for every rebuild
+                entries = list(fetch_openscriptures_data(profiler))
+                frequencies = count_frequencies(args, profiler)
+                indexed = None if args.no_articles else index_dictionaries(profiler)
+                texts = {}
+            build(args, profiler, entries, frequencies=frequencies, indexed=indexed, texts=texts)
+        profiler.report()
+        if args.report:
+            profiler.write_report(args.report)
+            print(f"Wrote run report to {args.report}")
 
     except Exception as e:
         print(f"Error: {e}")
         raise
 
+    if args.watch:
+        watch(args, entries, frequencies, indexed, texts)
+
+def watch(
+    args: argparse.Namespace,
+    entries: list[tuple[str, dict]],
+    frequencies: dict[str, int] | None = None,
+    indexed: tuple[dict, dict] | None = None,
+    texts: dict[str, tuple[dict, str]] | None = None,
+    **options,
+) -> None:
+    """
+    Rebuild from the parsed `entries` whenever this script, the classifier
+    tables or a TDOT/Vine dictionary changes; `options` go to build_watch.watch.
+
+    An edited script or classifier is loaded again, so the new FREQUENCY_DATA
+    and keyword tables apply, and the build manifest limits the transform to
+    the words whose inputs changed. The dictionaries (`indexed`, from
+    index_dictionaries) are parsed again only when one of them changes, and
+    the words as last written (`texts`, see write_vocabulary) are kept
+    rather than read back. Rebuilds run serially and skip the outputs not in
+    --watch-outputs.
+    """
+    script = os.path.abspath(__file__)
+    module = sys.modules[__name__]
+    # Every save would otherwise be a new version and push deployed ones out of the patch window
+    rebuild_args = argparse.Namespace(**{**vars(args), "jobs": 1, "no_patches": True})
+    skipped = [name for name in DERIVED_OUTPUTS if name not in args.watch_outputs]
+    for name in skipped:
+        setattr(rebuild_args, "no_" + name.replace('-', '_'), True)
+    if skipped:
+        print(f"\nWatch rebuilds skip {', '.join(skipped)}; a build without --watch writes them")
+    if not args.no_patches:
+        keep_patch_base(args)
+    if indexed is None and not args.no_articles:
+        indexed = index_dictionaries(Profiler("fetch-vocabulary"))
+    if texts is None:
+        texts = {}
+
+    def rebuild(changed: set[str]) -> None:
+        nonlocal module, indexed
+        if build_watch.reload_modules(changed, [classifier]) or script in changed:
+            module = load_script("fetch_vocabulary_watch", script)
+        profiler = Profiler("fetch-vocabulary")
+        if indexed is not None and changed & DICTIONARY_PATHS:
+            indexed = module.index_dictionaries(profiler)
+        module.build(rebuild_args, profiler, entries, changed, frequencies, indexed, texts)
+
+    paths = [script, build_watch.module_path(classifier)]
+    if not args.no_articles:
+        paths += sorted(DICTIONARY_PATHS)
+    build_watch.watch(paths, rebuild, **options)
+
+def patch_base_path(args: argparse.Namespace) -> str:
+    """Where the last versioned vocabulary is kept while a watch rewrites --output."""
+    return os.path.join(os.path.dirname(os.path.abspath(args.manifest)), "vocabulary-patch-base.json")
+
+def keep_patch_base(args: argparse.Namespace) -> None:
+    """Set the vocabulary aside as the base of the next patch, unless an earlier watch already did."""
+    base_path = patch_base_path(args)
+    if os.path.exists(args.output) and not os.path.exists(base_path):
+        os.makedirs(os.path.dirname(base_path), exist_ok=True)
+        shutil.copyfile(args.output, base_path)
+
+def index_dictionaries(profiler: Profiler) -> tuple[dict, dict]:
+    """The TDOT and Vine's entries, and the articles of each Strong's id."""
+    with profiler.stage("articleIndex"):
+        dictionaries = dictionary_articles.load_dictionaries()
+        articles = dictionary_articles.article_sources(
+            dictionary_articles.index_articles(dictionaries), dictionaries,
+        )
+    print(f"Indexed {sum(len(e) for e in dictionaries.values())} dictionary articles for {len(articles)} words")
+    return dictionaries, articles
+
+def count_frequencies(args: argparse.Namespace, profiler: Profiler) -> dict[str, int] | None:
+    """Occurrences per Strong's number in --corpus, or None to use FREQUENCY_DATA."""
+    if not args.corpus:
+        return None
+    with profiler.stage("frequency"):
+        frequencies = corpus_frequency.count_corpus(args.corpus, args.jobs)
+    print(f"Counted {sum(frequencies.values())} words, {len(frequencies)} lemmas in {args.corpus}")
+    return frequencies
+
+def build(
+    args: argparse.Namespace,
+    profiler: Profiler,
+    entries: Iterable[tuple[str, dict]] | None = None,
+    changed: set[str] | None = None,
+    frequencies: dict[str, int] | None = None,
+    indexed: tuple[dict, dict] | None = None,
+    texts: dict[str, tuple[dict, str]] | None = None,
+) -> None:
+    """
+    Run every stage of the vocabulary build.
+
+    `entries` replaces the download from OpenScriptures, `frequencies` the
+    --corpus count and `indexed` the dictionary join; `texts` caches the
+    serialized words between watch rebuilds (see write_vocabulary). With
+    `changed` (the files a watch saw change), outputs whose inputs are the
+    same as last time are not rewritten.
+    """
+    with profiler.stage("load"):
+        # The previous build is the base of the next patch even when every word is rebuilt
+        previous_words = [record for record, _ in texts.values()] if texts else load_previous_words(args.output)
+        manifest = BuildManifest(args.manifest, heuristics_fingerprint(), [] if args.full else previous_words)
+
+    if frequencies is None:
+        frequencies = count_frequencies(args, profiler)
+
+    dictionaries = articles = None
+    if not args.no_articles:
+        dictionaries, articles = indexed or index_dictionaries(profiler)
+
+    # Stream entries from OpenScriptures straight into the transform. Words
+    # stay compact records until they are written out; derivation links are
+    # collected on the way, as records do not keep the derivation; the
+    # relations take relatedRoot from the families too
+    families = None if args.no_families and args.no_relations else root_families.FamilyBuilder()
+    with profiler.stage("transform"):
+        words = transform_records(
+            fetch_openscriptures_data(profiler) if entries is None else entries,
+            args.jobs, args.chunk_size, manifest, profiler, frequencies,
+            {} if articles is None else articles, families,
+        )
+
+    print(f"\nTransformed {len(words)} words")
+    profiler.count("words", len(words))
+    profiler.count("reusedWords", manifest.reused)
+
+    # Count by tier
+    tier_counts = {}
+    for word in words:
+        tier = word['tier']
+        tier_counts[tier] = tier_counts.get(tier, 0) + 1
+
+    print("\nTier distribution:")
+    for tier in sorted(tier_counts.keys()):
+        print(f"  Tier {tier}: {tier_counts[tier]} words")
+
+    # Write output
+    output_path = args.output
+    # A watch rebuild that gives the same words leaves everything built from them alone
+    unchanged = changed is not None and not manifest.changed and len(words) == len(previous_words)
+
+    if not unchanged:
+        with profiler.stage("serialize"):
+            write_vocabulary(words, output_path, texts)
+
+    with profiler.stage("write"):
+        manifest.save()
+
+    if unchanged:
+        print(f"\nVocabulary unchanged; left {output_path} and the outputs built from it as they are")
+    else:
+        print(f"\nWrote vocabulary to {output_path}")
+        print(f"Total words: {len(words)}")
+    manifest.report()
+
+    if not unchanged:
+        write_word_outputs(args, profiler, words, previous_words, families)
+
+    # The article chunks only depend on the dictionaries
+    if dictionaries is not None and (changed is None or changed & DICTIONARY_PATHS):
+        with profiler.stage("articles"):
+            index = dictionary_articles.write_articles(dictionaries, args.articles_dir)
+            size = dictionary_articles.chunk_size(args.articles_dir, index)
+        print(f"Wrote dictionary articles ({size / 1024:.0f} KB in "
+              f"{sum(len(s['chunks']) for s in index['sources'].values())} chunks) to {args.articles_dir}")
+
+def write_word_outputs(
+    args: argparse.Namespace,
+    profiler: Profiler,
+    words: list[Word],
+    previous_words: list[dict],
+    families: root_families.FamilyBuilder | None,
+) -> None:
+    """Write every artifact derived from the words, as the arguments select."""
+    output_path = args.output
+
+    if not args.no_patches:
+        # After a watch the vocabulary on disk is not the version clients have; that one was set aside
+        base_path = patch_base_path(args)
+        with profiler.stage("patches"):
+            base = load_previous_words(base_path) or previous_words
+            versions, patch = vocab_patches.update_patches(base, words, args.patches_dir)
+        if os.path.exists(base_path):
+            os.unlink(base_path)
+        vocab_patches.report(versions, patch, os.path.getsize(output_path), args.patches_dir)
+
+    if not args.no_shards:
+        with profiler.stage("shards"):
+            index = vocab_shards.write_shards(words, args.shards_dir)
+        vocab_shards.report(index, args.shards_dir)
+
+    if not args.no_binary:
+        with profiler.stage("binary"):
+            size = vocab_binary.write_binary(words, args.binary)
+        print(f"Wrote binary vocabulary ({size / 1024:.0f} KB) to {args.binary}")
+
+    family_data = None
+    if families is not None:
+        with profiler.stage("families"):
+            family_data = families.to_dict(words) if args.no_families else families.write(words, args.families)
+        if not args.no_families:
+            root_families.report(family_data, families.links, args.families)
+
+    if not args.no_relations:
+        with profiler.stage("relations"):
+            size = word_relations.write_relations(words, args.relations, families=family_data)
+        print(f"Wrote word relations ({size / 1024:.0f} KB) to {args.relations}")
+
+    if not args.no_search_index:
+        with profiler.stage("search"):
+            size = search_index.write_search_index(words, args.search_index)
+        print(f"Wrote search index ({size / 1024:.0f} KB) to {args.search_index}")
+
+    if not args.no_distractors:
+        with profiler.stage("distractors"):
+            size = distractors.write_distractors(words, args.distractors)
+        print(f"Wrote quiz distractor pools ({size / 1024:.0f} KB) to {args.distractors}")
+
 if __name__ == "__main__":
     main()
@@ -0,0 +1,94 @@
+"""
+Checkpoint journal for resumable chapter fetch runs.
+
+The journal is an NDJSON file: a header naming the source the chapters came
+from, then one line per downloaded chapter:
+
+    {"journal": 1, "source": "https://bolls.life/get-text/WLC"}
+    {"key": "1_1", "verses": {"1": "...", "2": "..."}}
+
+Lines are flushed as each chapter arrives, so when a run is interrupted or
+ends with failed chapters, the next run loads what was already fetched and
+only requests the rest. A run that gets every chapter discards the journal.
+A journal written for another source is ignored and replaced.
+"""
+
+import json
+import os
+import threading
+from typing import IO
+
+JOURNAL_VERSION = 1
+
+class RunJournal:
+    """Append-only record of the chapters a fetch run has completed."""
+
+    def __init__(self, path: str, source: str):
+        self.path = path
+        self.source = source
+        self.file: IO | None = None
+        self.lock = threading.Lock()
+        # Byte offset to append at when continuing an earlier run's journal
+        self.resume_at: int | None = None
+
+    def header(self) -> dict:
+        return {"journal": JOURNAL_VERSION, "source": self.source}
+
+    def load(self) -> dict[str, dict[int, str]]:
+        """Chapters checkpointed by an earlier run of the same source, as `key -> {verse: text}`."""
+        chapters: dict[str, dict[int, str]] = {}
+        end = 0
+        try:
+            with open(self.path, 'rb') as f:
+                if json.loads(f.readline() or b'{}') != self.header():
+                    return {}
+                end = f.tell()
+                for line in f:
+                    try:
+                        entry = json.loads(line)
+                        verses = {int(v): text for v, text in entry["verses"].items()}
+                    except (ValueError, KeyError, AttributeError):
+                        # The last line of an interrupted run may be cut off
+                        break
+                    if not line.endswith(b'\n'):
+                        break
+                    chapters[entry["key"]] = verses
+                    end += len(line)
+        except (OSError, ValueError):
+            return {}
+        self.resume_at = end
+        return chapters
+
+    def record(self, key: str, verses: dict[int, str]) -> None:
+        """Checkpoint one completed chapter."""
+        line = json.dumps({"key": key, "verses": verses}, ensure_ascii=False, separators=(',', ':')) + '\n'
+        with self.lock:
+            if self.file is None:
+                self.file = self.open()
+            self.file.write(line.encode('utf-8'))
+            self.file.flush()
+
+    def open(self) -> IO:
+        """Continue the journal this run resumed from, dropping any torn last line; else start a new one."""
+        os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+        if self.resume_at is not None:
+            f = open(self.path, 'r+b')
+            f.seek(self.resume_at)
+            f.truncate()
+            return f
+        f = open(self.path, 'wb')
+        f.write(json.dumps(self.header()).encode('utf-8') + b'\n')
+        return f
+
+    def close(self) -> None:
+        with self.lock:
+            if self.file is not None:
+                self.file.close()
+                self.file = None
+
+    def discard(self) -> None:
+        """Close and delete the journal, e.g. once every chapter has been fetched."""
+        self.close()
+        if os.path.exists(self.path):
+            os.unlink(self.path)
+        self.resume_at = None
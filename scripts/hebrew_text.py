@@ -0,0 +1,153 @@
+"""
+Python port of the text helpers in src/lib/hebrew.ts.
+
+normalize_hebrew, to_academic_transliteration, to_simple_transliteration and
+syllabify reproduce normalizeHebrew, toAcademicTransliteration,
+toSimpleTransliteration and syllabify character for character, quirks
+included, so a word's precomputed fields are exactly what the app would
+compute when rendering it. tests/test_hebrew_text.py checks them against
+outputs of the TypeScript for the whole word list.
+
+consonants() is the same normalization for matching words rather than
+displaying them: it keeps the punctuation that separates words and folds
+final letters. The verse index and the search index both key on it.
+
+Results are memoized in bounded caches: homographs and repeated syllables
+are worked out once, without the caches growing with the lexicon.
+"""
+
+import re
+import unicodedata
+from functools import lru_cache
+
+# Transliterations from CONSONANTS / VOWELS (academic) and SIMPLE_CONSONANTS /
+# SIMPLE_VOWELS in hebrew.ts. Two-character keys (letter + dagesh, shin/sin
+# dot, vowel + mater) are tried before single characters.
+CONSONANTS = {
+    'א': 'ʾ', 'ב': 'b/v', 'בּ': 'b', 'ג': 'g', 'גּ': 'g', 'ד': 'd', 'דּ': 'd', 'ה': 'h',
+    'ו': 'w/v', 'וּ': 'û', 'וֹ': 'ô', 'ז': 'z', 'ח': 'ḥ', 'ט': 'ṭ', 'י': 'y',
+    'כ': 'k/kh', 'כּ': 'k', 'ך': 'k/kh', 'ךּ': 'k', 'ל': 'l', 'מ': 'm', 'ם': 'm', 'נ': 'n', 'ן': 'n',
+    'ס': 's', 'ע': 'ʿ', 'פ': 'p/f', 'פּ': 'p', 'ף': 'p/f', 'ץ': 'ṣ', 'צ': 'ṣ', 'ק': 'q', 'ר': 'r',
+    'שׁ': 'š', 'שׂ': 'ś', 'ש': 'š/ś', 'ת': 't', 'תּ': 't',
+}
+
+VOWELS = {
+    'ַ': 'a', 'ָ': 'ā/o', 'ֲ': 'ă',
+    'ֶ': 'e', 'ֵ': 'ē', 'ֱ': 'ĕ',
+    'ִ': 'i', 'ִי': 'î',
+    'ֹ': 'ō', 'ָ֫': 'o', 'ֳ': 'ŏ',
+    'ֻ': 'u',
+    'ְ': 'ə',
+}
+
+SIMPLE_CONSONANTS = {
+    'א': "'", 'ב': 'v', 'בּ': 'b', 'ג': 'g', 'גּ': 'g',
+    'ד': 'd', 'דּ': 'd', 'ה': 'h', 'ו': 'v', 'וּ': 'u', 'וֹ': 'o',
+    'ז': 'z', 'ח': 'ch', 'ט': 't', 'י': 'y',
+    'כ': 'kh', 'כּ': 'k', 'ך': 'kh', 'ךּ': 'k',
+    'ל': 'l', 'מ': 'm', 'ם': 'm', 'נ': 'n', 'ן': 'n',
+    'ס': 's', 'ע': "'", 'פ': 'f', 'פּ': 'p', 'ף': 'f',
+    'צ': 'ts', 'ץ': 'ts', 'ק': 'q', 'ר': 'r',
+    'שׁ': 'sh', 'שׂ': 's', 'ש': 'sh', 'ת': 't', 'תּ': 't',
+}
+
+SIMPLE_VOWELS = {
+    'ַ': 'a', 'ָ': 'a', 'ֲ': 'a',
+    'ֶ': 'e', 'ֵ': 'e', 'ֱ': 'e',
+    'ִ': 'i', 'ִי': 'i',
+    'ֹ': 'o', 'ֳ': 'o',
+    'ֻ': 'u',
+    'ְ': '',  # Often silent
+}
+
+# The Hebrew points block: cantillation and vowel points, and the maqaf,
+# paseq, sof pasuq and nun hafukha that separate words
+POINTS = ''.join(chr(c) for c in range(0x0591, 0x05C8))
+PUNCTUATION = '\u05BE\u05C0\u05C3\u05C6'
+POINTS_RE = re.compile(f'[{POINTS}]')
+MARKS_RE = re.compile(f"[{''.join(c for c in POINTS if c not in PUNCTUATION)}]")
+FINAL_FORMS = str.maketrans("ךםןףץ", "כמנפצ")
+
+CACHE_SIZE = 1 << 16
+
+@lru_cache(maxsize=CACHE_SIZE)
+def normalize_hebrew(text: str) -> str:
+    """Remove vowel points and cantillation marks (normalizeHebrew)."""
+    return unicodedata.normalize('NFC', POINTS_RE.sub('', unicodedata.normalize('NFD', text)))
+
+def consonants(text: str) -> str:
+    """
+    Bare consonants with final letters folded, e.g. "אֶרֶץ" -> "ארצ": like
+    normalize_hebrew, but word-separating punctuation is kept. Not cached,
+    as it also runs over whole verses.
+    """
+    return unicodedata.normalize('NFC', MARKS_RE.sub('', unicodedata.normalize('NFD', text))).translate(FINAL_FORMS)
+
+def transliterate(hebrew: str, consonants: dict[str, str], vowels: dict[str, str]) -> str:
+    """The lookup loop shared by both transliterations; unknown characters are dropped."""
+    result = []
+    i = 0
+    while i < len(hebrew):
+        char = hebrew[i]
+        combined = hebrew[i:i + 2]
+        # As in the TypeScript, an empty mapping (silent sheva) counts as no match
+        if len(combined) == 2 and consonants.get(combined):
+            result.append(consonants[combined])
+            i += 1
+        elif consonants.get(char):
+            result.append(consonants[char])
+        elif len(combined) == 2 and vowels.get(combined):
+            result.append(vowels[combined])
+            i += 1
+        elif vowels.get(char):
+            result.append(vowels[char])
+        elif char == ' ':
+            result.append(' ')
+        i += 1
+    return ''.join(result)
+
+@lru_cache(maxsize=CACHE_SIZE)
+def to_academic_transliteration(hebrew: str) -> str:
+    """Scholarly transliteration (toAcademicTransliteration)."""
+    return transliterate(hebrew, CONSONANTS, VOWELS)
+
+@lru_cache(maxsize=CACHE_SIZE)
+def to_simple_transliteration(hebrew: str) -> str:
+    """Pronunciation guide without diacritics (toSimpleTransliteration)."""
+    result = transliterate(hebrew, SIMPLE_CONSONANTS, SIMPLE_VOWELS)
+    # Same clean-up as the TypeScript: only the first doubled apostrophe is
+    # collapsed, and JS `$` is the very end of the string (Python's \Z)
+    result = result.replace("''", "'", 1)
+    result = re.sub(r"'\Z", '', result)
+    return re.sub(r"^'", '', result)
+
+@lru_cache(maxsize=CACHE_SIZE)
+def syllabify(hebrew: str) -> tuple[str, ...]:
+    """Syllables of a word (syllabify): a vowel closes one when a consonant and another vowel follow."""
+    syllables = []
+    current = ''
+    for i, char in enumerate(hebrew):
+        current += char
+        if char in VOWELS:
+            next_char = hebrew[i + 1:i + 2]
+            after_next = hebrew[i + 2:i + 3]
+            if (next_char and normalize_hebrew(next_char) in CONSONANTS
+                    and after_next and (after_next in VOWELS or normalize_hebrew(after_next) in VOWELS)):
+                syllables.append(current)
+                current = ''
+    if current:
+        syllables.append(current)
+    return tuple(syllables) if syllables else (hebrew,)
+
+def pronunciation_fields(hebrew: str) -> dict:
+    """Build-time word fields: the consonantal form and getPronunciationBreakdown() minus `hebrew`."""
+    syllables = syllabify(hebrew)
+    return {
+        "consonantal": normalize_hebrew(hebrew),
+        "pronunciation": {
+            "academic": to_academic_transliteration(hebrew),
+            "simple": to_simple_transliteration(hebrew),
+            "syllables": list(syllables),
+            "syllablePronunciations": [to_simple_transliteration(s) for s in syllables],
+        },
+    }
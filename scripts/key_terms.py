@@ -0,0 +1,131 @@
+#!/usr/bin/env python3
+"""
+Resolve the English key terms of the curated verses to vocabulary entries.
+
+An inverted index maps every (lightly stemmed) English token of each word's
+`gloss` and `definition` to the words that use it; a gloss hit weighs more
+than a definition hit. A key term such as "LORD God" or "be fruitful" is
+scored against the postings of its tokens, and candidates are ranked by:
+
+    score      token weights, plus a bonus when the gloss says exactly the
+               term ("To create" for "create") and a larger one when the
+               lemma occurs in the verse itself (from the word <-> verse index)
+    tie-break  frequency, then the lower Strong's number
+
+so each verse gets a short ranked list of Strong's ids per key term, and the
+app never has to fuzzy-match terms against thousands of glosses.
+
+Output, next to each verse's "keyTerms":
+    "keyTermIds": [["H1254", ...], ...]   # aligned with "keyTerms"
+
+Run standalone to add keyTermIds to an existing verses file in place:
+    python scripts/key_terms.py [vocabulary.json] [ot-verses.json]
+"""
+
+import json
+import re
+import sys
+from typing import Iterable
+
+from build_io import write_atomic
+from verse_index import VERSES_PATH, VOCABULARY_PATH, VerseIndexBuilder, homograph_rank, load_words
+
+GLOSS_WEIGHT = 3
+DEFINITION_WEIGHT = 1
+EXACT_GLOSS_WEIGHT = 1
+# Added for lemmas that occur in the verse being resolved
+IN_VERSE_WEIGHT = 3
+# Ranked ids written out per term
+MAX_IDS = 3
+
+TOKEN_RE = re.compile(r"[a-z]+")
+# Strong's definitions mark KJV renderings with [idiom] / [phrase]
+MARKER_RE = re.compile(r"\[[^\]]*\]")
+STOPWORDS = frozenset(
+    "a an and as at be by for from in into is it of on or out the to up with i am".split()
+)
+SUFFIXES = ("ing", "ed", "es", "s", "e")
+MIN_STEM = 3
+
+def stem(token: str) -> str:
+    """Crude suffix stripping so "created", "creates" and "create" meet at "creat"."""
+    for suffix in SUFFIXES:
+        if token.endswith(suffix) and len(token) - len(suffix) >= MIN_STEM and not token.endswith("ss"):
+            return token[:-len(suffix)]
+    return token
+
+def term_tokens(text: str) -> list[str]:
+    """Stemmed content tokens of an English phrase; stopwords are kept only if there is nothing else."""
+    tokens = [stem(t) for t in TOKEN_RE.findall(MARKER_RE.sub(" ", text.lower()))]
+    content = [t for t in tokens if t not in STOPWORDS]
+    return content or tokens
+
+class GlossIndex:
+    """Inverted index from English tokens to vocabulary positions, weighted by field."""
+
+    def __init__(self, words: list[dict]):
+        self.words = words
+        self.postings: dict[str, dict[int, int]] = {}
+        self.gloss_tokens: list[tuple[str, ...]] = []
+        for pos, word in enumerate(words):
+            gloss = term_tokens(word.get("gloss", ""))
+            self.gloss_tokens.append(tuple(gloss))
+            for token in set(gloss):
+                self.postings.setdefault(token, {})[pos] = GLOSS_WEIGHT
+            for token in set(term_tokens(word.get("definition", ""))):
+                self.postings.setdefault(token, {}).setdefault(pos, DEFINITION_WEIGHT)
+        self.cache: dict[str, list[tuple[int, int]]] = {}
+
+    def candidates(self, term: str) -> list[tuple[int, int]]:
+        """(position, score) for every word matching one term, best first."""
+        if term in self.cache:
+            return self.cache[term]
+        tokens = term_tokens(term)
+        scores: dict[int, int] = {}
+        for token in set(tokens):
+            for pos, weight in self.postings.get(token, {}).items():
+                scores[pos] = scores.get(pos, 0) + weight
+        exact = tuple(tokens)
+        for pos in scores:
+            if self.gloss_tokens[pos] == exact:
+                scores[pos] += EXACT_GLOSS_WEIGHT
+        ranked = sorted(scores.items(), key=lambda c: (-c[1], homograph_rank(self.words[c[0]])))
+        self.cache[term] = ranked
+        return ranked
+
+    def resolve(self, terms: Iterable[str], in_verse: Iterable[int] = ()) -> list[list[str]]:
+        """Ranked Strong's ids for each term, favouring lemmas found in the verse (`in_verse` positions)."""
+        present = set(in_verse)
+        resolved = []
+        for term in terms:
+            ranked = self.candidates(term)
+            # Only the head of the list and the few lemmas in the verse can make the cut
+            pool = ranked[:MAX_IDS] + [c for c in ranked[MAX_IDS:] if c[0] in present]
+            pool.sort(key=lambda c: (-c[1] - (IN_VERSE_WEIGHT if c[0] in present else 0), homograph_rank(self.words[c[0]])))
+            resolved.append([self.words[pos]["id"] for pos, _ in pool[:MAX_IDS]])
+        return resolved
+
+def report(verses: list[dict]) -> None:
+    terms = [ids for v in verses for ids in v.get("keyTermIds", [])]
+    resolved = sum(1 for ids in terms if ids)
+    print(f"Resolved {resolved}/{len(terms)} key terms to Strong's ids")
+
+def main():
+    vocabulary = sys.argv[1] if len(sys.argv) > 1 else VOCABULARY_PATH
+    verses_path = sys.argv[2] if len(sys.argv) > 2 else VERSES_PATH
+    words = load_words(vocabulary)
+    if words is None:
+        sys.exit(f"Cannot read vocabulary from {vocabulary}")
+    with open(verses_path, encoding='utf-8') as f:
+        data = json.load(f)
+
+    index = GlossIndex(words)
+    word_index = VerseIndexBuilder(words)
+    for verse in data["verses"]:
+        found = word_index.add(verse["id"], verse.get("hebrew", ""))
+        verse["keyTermIds"] = index.resolve(verse["keyTerms"], found)
+    write_atomic(verses_path, json.dumps(data, ensure_ascii=False, indent=2).encode('utf-8'))
+    report(data["verses"])
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,192 @@
+"""
+Streaming reader for OSIS XML editions of the Hebrew Bible.
+
+Written for the Open Scriptures Hebrew Bible (morphhb) edition of the
+Westminster Leningrad Codex, one file per book:
+
+    <verse osisID="Gen.1.1">
+      <w lemma="b/7225" morph="HR/Ncfsa">בְּ/רֵאשִׁ֖ית</w>
+      <w lemma="1254 a" morph="HVqp3ms">בָּרָ֣א</w> ...
+      <seg type="x-sof-pasuq">׃</seg>
+    </verse>
+
+Both container verses (as above) and milestone verses
+(`<verse sID="..."/> ... <verse eID="..."/>`) are understood. Words inside
+`<note>` (textual variants) are skipped.
+
+`iter_osis_verses()` parses with `iterparse` and detaches every element once
+it has been read, so memory use does not grow with the size of the corpus.
+
+A file holding several books can be read one book at a time: book_spans()
+finds the byte range of each book `<div>` and iter_osis_span() parses just
+that range, so workers can share a single-file edition.
+"""
+
+import mmap
+import os
+import re
+import xml.etree.ElementTree as ET
+from typing import Iterable, Iterator, NamedTuple
+
+# OSIS book ids in canonical (bolls.life) order
+OSIS_BOOKS = [
+    "Gen", "Exod", "Lev", "Num", "Deut", "Josh", "Judg", "Ruth", "1Sam", "2Sam",
+    "1Kgs", "2Kgs", "1Chr", "2Chr", "Ezra", "Neh", "Esth", "Job", "Ps", "Prov",
+    "Eccl", "Song", "Isa", "Jer", "Lam", "Ezek", "Dan", "Hos", "Joel", "Amos",
+    "Obad", "Jonah", "Mic", "Nah", "Hab", "Zeph", "Hag", "Zech", "Mal",
+]
+BOOK_ORDER = {book: i for i, book in enumerate(OSIS_BOOKS)}
+
+MAQQEF = "־"
+SOF_PASUQ = "׃"
+PASEQ = "׀"
+
+STRONGS_RE = re.compile(r'\d+')
+BOOK_DIV_RE = re.compile(rb'<div\b[^>]*\btype="book"')
+
+READ_BLOCK = 1 << 16
+
+class OsisWord(NamedTuple):
+    text: str    # surface form with morpheme separators removed
+    lemma: str   # raw lemma attribute, e.g. "b/7225" or "1254 a"
+    morph: str
+
+class OsisVerse(NamedTuple):
+    book: str    # app book id, e.g. "gen", "1sam"
+    chapter: int
+    verse: int
+    text: str
+    words: list[OsisWord]
+
+def app_book_id(osis_book: str) -> str:
+    """App book ids are lower-cased OSIS ids ("Gen" -> "gen", "1Sam" -> "1sam")."""
+    return osis_book.lower()
+
+def lemma_strongs(lemma: str) -> list[str]:
+    """Strong's ids in a morphhb lemma attribute: "c/d/1254 a" -> ["H1254"]. Prefix letters are dropped."""
+    return [f"H{int(n)}" for n in STRONGS_RE.findall(lemma)]
+
+def source_files(source: str) -> list[str]:
+    """`source` itself, or the OSIS files in a directory in canonical book order."""
+    if not os.path.isdir(source):
+        return [source]
+    files = [os.path.join(source, name) for name in os.listdir(source) if name.endswith('.xml')]
+    # Book files are named after their OSIS id (Gen.xml); anything else sorts last
+    return sorted(files, key=lambda p: (BOOK_ORDER.get(os.path.basename(p)[:-4], len(OSIS_BOOKS)), p))
+
+def local_name(tag: str) -> str:
+    return tag.rsplit('}', 1)[-1]
+
+def verse_text(tokens: list[str]) -> str:
+    """Join word and punctuation tokens the way the WLC is printed."""
+    out = ""
+    for token in tokens:
+        if token in (MAQQEF, SOF_PASUQ) or out.endswith(MAQQEF) or not out:
+            out += token
+        else:
+            out += " " + token
+    return out
+
+def parse_osis_id(osis_id: str) -> tuple[str, int, int] | None:
+    parts = osis_id.split('.')
+    if len(parts) != 3 or not parts[1].isdigit() or not parts[2].isdigit():
+        return None
+    return parts[0], int(parts[1]), int(parts[2])
+
+def book_spans(path: str) -> list[tuple[int, int]]:
+    """Byte ranges of the book `<div>`s in an OSIS file, each up to the next book's."""
+    if os.path.getsize(path) == 0:
+        return []
+    with open(path, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as data:
+        starts = [m.start() for m in BOOK_DIV_RE.finditer(data)]
+        size = len(data)
+    return list(zip(starts, starts[1:] + [size]))
+
+def span_events(path: str, start: int, end: int) -> Iterator[tuple[str, ET.Element]]:
+    """
+    Parse events for the book `<div>` at byte `start` (see book_spans). The
+    file's opening tags are parsed first so namespaces resolve, and parsing
+    stops once the book's element ends, before whatever closes the file.
+    """
+    parser = ET.XMLPullParser(events=("start", "end"))
+    book = None
+    with open(path, 'rb') as f:
+        head = b""
+        while (match := BOOK_DIV_RE.search(head)) is None and (block := f.read(READ_BLOCK)):
+            head += block
+        parser.feed(head[:match.start()] if match else head)
+        f.seek(start)
+        while start < end:
+            block = f.read(min(READ_BLOCK, end - start))
+            if not block:
+                break
+            start += len(block)
+            parser.feed(block)
+            for event, elem in parser.read_events():
+                if book is None and event == "start":
+                    book = elem
+                yield event, elem
+                if event == "end" and elem is book:
+                    return
+
+def iter_osis_file(path: str) -> Iterator[OsisVerse]:
+    """Yield every verse in one OSIS file, in document order."""
+    return osis_verses(ET.iterparse(path, events=("start", "end")))
+
+def iter_osis_span(path: str, start: int, end: int) -> Iterator[OsisVerse]:
+    """Yield the verses of one book of a multi-book OSIS file, see book_spans."""
+    return osis_verses(span_events(path, start, end))
+
+def osis_verses(events: Iterable[tuple[str, ET.Element]]) -> Iterator[OsisVerse]:
+    """Verses from start/end parse events of an OSIS document."""
+    stack = []
+    current = None  # (osis id, tokens, words)
+    note_depth = 0
+
+    def finish() -> OsisVerse | None:
+        ref = parse_osis_id(current[0])
+        if ref is None:
+            return None
+        book, chapter, verse = ref
+        return OsisVerse(app_book_id(book), chapter, verse, verse_text(current[1]), current[2])
+
+    for event, elem in events:
+        name = local_name(elem.tag)
+        if event == "start":
+            stack.append(elem)
+            if name == "note":
+                note_depth += 1
+            elif name == "verse":
+                if "eID" in elem.attrib:
+                    if current is not None and (verse := finish()):
+                        yield verse
+                    current = None
+                elif "sID" in elem.attrib or "osisID" in elem.attrib:
+                    current = (elem.get("osisID") or elem.get("sID"), [], [])
+            continue
+
+        stack.pop()
+        if name == "note":
+            note_depth -= 1
+        elif current is not None and not note_depth:
+            if name == "w":
+                text = "".join(elem.itertext()).replace("/", "").strip()
+                if text:
+                    current[1].append(text)
+                    current[2].append(OsisWord(text, elem.get("lemma", ""), elem.get("morph", "")))
+            elif name == "seg" and elem.get("type") in ("x-maqqef", "x-sof-pasuq", "x-paseq"):
+                current[1].append("".join(elem.itertext()).strip())
+            elif name == "verse" and not ("sID" in elem.attrib or "eID" in elem.attrib):
+                if verse := finish():
+                    yield verse
+                current = None
+
+        # Everything needed from this element has been read
+        elem.clear()
+        if stack:
+            stack[-1].remove(elem)
+
+def iter_osis_verses(source: str) -> Iterator[OsisVerse]:
+    """Yield every verse from an OSIS file or a directory of per-book files."""
+    for path in source_files(source):
+        yield from iter_osis_file(path)
@@ -0,0 +1,282 @@
+"""
+Stage timing and profiling for the fetch scripts.
+
+A `Profiler` records, per named stage:
+    calls             how many times the stage ran
+    wall, cpu         inclusive wall-clock and process CPU seconds
+    selfWall/selfCpu  the same, minus time spent in nested stages
+    childCpu          CPU of worker processes reaped during the stage
+    peakBytes         peak traced allocation (only with --trace-memory)
+
+Stages nest, so a streamed download can be timed inside the transform that
+consumes it and each reports its own share. Latency histograms collect
+per-request timings (e.g. one per chapter fetch) from any thread.
+
+Scripts add the shared options with `add_arguments()` and build the
+profiler with `Profiler.from_args()`:
+    --report PATH        write the run report as JSON
+    --profile PATH       dump cProfile stats for the whole run (view with `python -m pstats`)
+    --trace-memory       sample peak memory per stage with tracemalloc
+"""
+
+import argparse
+import bisect
+import cProfile
+import json
+import os
+import threading
+import time
+import tracemalloc
+from contextlib import contextmanager
+from typing import IO, Any, Iterable, Iterator
+
+from build_io import write_atomic
+
+REPORT_VERSION = 1
+
+# Upper bounds in milliseconds; the last bucket catches everything slower
+LATENCY_BUCKETS_MS = (5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000, 10000)
+
+def add_arguments(parser: argparse.ArgumentParser) -> None:
+    group = parser.add_argument_group("profiling")
+    group.add_argument("--report", default=None, help="Write a JSON run report with stage timings to this path")
+    group.add_argument("--profile", default=None, help="Dump cProfile stats for the run to this path")
+    group.add_argument("--trace-memory", action="store_true", help="Track peak memory per stage with tracemalloc")
+
+def percentile(sorted_values: list[float], q: float) -> float:
+    """Nearest-rank percentile of already sorted values."""
+    if not sorted_values:
+        return 0.0
+    rank = max(1, -(-len(sorted_values) * q // 100))
+    return sorted_values[int(rank) - 1]
+
+class LatencyHistogram:
+    """Thread-safe latency recorder with fixed millisecond buckets."""
+
+    def __init__(self, bounds_ms: tuple = LATENCY_BUCKETS_MS):
+        self.bounds_ms = bounds_ms
+        self.counts = [0] * (len(bounds_ms) + 1)
+        self.samples: list[float] = []
+        self.lock = threading.Lock()
+
+    def observe(self, seconds: float) -> None:
+        ms = seconds * 1000
+        with self.lock:
+            self.counts[bisect.bisect_left(self.bounds_ms, ms)] += 1
+            self.samples.append(ms)
+
+    def to_dict(self) -> dict:
+        with self.lock:
+            samples = sorted(self.samples)
+            counts = list(self.counts)
+        bounds = [*self.bounds_ms, None]
+        return {
+            "count": len(samples),
+            "minMs": round(samples[0], 3) if samples else 0.0,
+            "maxMs": round(samples[-1], 3) if samples else 0.0,
+            "meanMs": round(sum(samples) / len(samples), 3) if samples else 0.0,
+            "p50Ms": round(percentile(samples, 50), 3),
+            "p90Ms": round(percentile(samples, 90), 3),
+            "p99Ms": round(percentile(samples, 99), 3),
+            "buckets": [{"leMs": le, "count": c} for le, c in zip(bounds, counts)],
+        }
+
+class _Frame:
+    __slots__ = ("name", "wall", "cpu", "child_cpu", "nested_wall", "nested_cpu", "peak")
+
+    def __init__(self, name: str):
+        self.name = name
+        self.wall = time.perf_counter()
+        self.cpu = time.process_time()
+        self.child_cpu = _children_cpu()
+        self.nested_wall = 0.0
+        self.nested_cpu = 0.0
+        self.peak = 0
+
+def _children_cpu() -> float:
+    t = os.times()
+    return t.children_user + t.children_system
+
+class Profiler:
+    """Collects stage timings, latency histograms and counters for one run."""
+
+    def __init__(self, script: str, trace_memory: bool = False, profile_path: str | None = None):
+        self.script = script
+        self.trace_memory = trace_memory
+        self.profile_path = profile_path
+        self.stages: dict[str, dict] = {}
+        self.histograms: dict[str, LatencyHistogram] = {}
+        self.counters: dict[str, Any] = {}
+        self.started_at = time.time()
+        self._stack: list[_Frame] = []
+        self._owner = threading.get_ident()
+        self._hist_lock = threading.Lock()
+        self._cprofile = None
+        self._root = None
+        self.run_wall = 0.0
+        self.run_cpu = 0.0
+        self.peak_bytes = 0
+
+    @classmethod
+    def from_args(cls, script: str, args: argparse.Namespace) -> "Profiler":
+        return cls(script, args.trace_memory, args.profile)
+
+    def start(self) -> None:
+        if self.trace_memory and not tracemalloc.is_tracing():
+            tracemalloc.start()
+        if self.profile_path:
+            self._cprofile = cProfile.Profile()
+            self._cprofile.enable()
+        self._root = _Frame("run")
+        self._stack.append(self._root)
+
+    def stop(self) -> None:
+        if self._cprofile is not None:
+            self._cprofile.disable()
+            os.makedirs(os.path.dirname(os.path.abspath(self.profile_path)), exist_ok=True)
+            self._cprofile.dump_stats(self.profile_path)
+            self._cprofile = None
+        if self._root is not None:
+            self._fold_peak(self._root)
+            self.peak_bytes = self._root.peak
+            self.run_wall = time.perf_counter() - self._root.wall
+            self.run_cpu = time.process_time() - self._root.cpu
+            self._stack.remove(self._root)
+            self._root = None
+        if self.trace_memory and tracemalloc.is_tracing():
+            tracemalloc.stop()
+
+    def __enter__(self) -> "Profiler":
+        self.start()
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.stop()
+
+    def _fold_peak(self, frame: _Frame) -> None:
+        if tracemalloc.is_tracing():
+            frame.peak = max(frame.peak, tracemalloc.get_traced_memory()[1])
+
+    @contextmanager
+    def stage(self, name: str):
+        """Time the enclosed block as stage `name`. Only the creating thread records stages."""
+        if threading.get_ident() != self._owner:
+            yield
+            return
+        if self._stack:
+            self._fold_peak(self._stack[-1])
+        if tracemalloc.is_tracing():
+            tracemalloc.reset_peak()
+        frame = _Frame(name)
+        self._stack.append(frame)
+        try:
+            yield
+        finally:
+            self._stack.pop()
+            wall = time.perf_counter() - frame.wall
+            cpu = time.process_time() - frame.cpu
+            self._fold_peak(frame)
+
+            totals = self.stages.setdefault(name, {
+                "calls": 0, "wall": 0.0, "cpu": 0.0, "selfWall": 0.0, "selfCpu": 0.0, "childCpu": 0.0, "peakBytes": 0,
+            })
+            totals["calls"] += 1
+            totals["wall"] += wall
+            totals["cpu"] += cpu
+            totals["selfWall"] += wall - frame.nested_wall
+            totals["selfCpu"] += cpu - frame.nested_cpu
+            totals["childCpu"] += _children_cpu() - frame.child_cpu
+            totals["peakBytes"] = max(totals["peakBytes"], frame.peak)
+
+            if self._stack:
+                parent = self._stack[-1]
+                parent.nested_wall += wall
+                parent.nested_cpu += cpu
+                parent.peak = max(parent.peak, frame.peak)
+            if tracemalloc.is_tracing():
+                tracemalloc.reset_peak()
+
+    def timed_iter(self, items: Iterable, name: str) -> Iterator:
+        """Yield from `items`, counting the time spent producing each item as stage `name`."""
+        iterator = iter(items)
+        while True:
+            with self.stage(name):
+                try:
+                    item = next(iterator)
+                except StopIteration:
+                    return
+            yield item
+
+    def timed_reader(self, stream: IO, name: str) -> "TimedReader":
+        """Wrap a file-like object so each `read()` counts as stage `name`."""
+        return TimedReader(self, stream, name)
+
+    def histogram(self, name: str) -> LatencyHistogram:
+        with self._hist_lock:
+            if name not in self.histograms:
+                self.histograms[name] = LatencyHistogram()
+            return self.histograms[name]
+
+    def observe(self, name: str, seconds: float) -> None:
+        """Record one latency sample; safe to call from worker threads."""
+        self.histogram(name).observe(seconds)
+
+    def count(self, name: str, value: Any) -> None:
+        self.counters[name] = value
+
+    def to_dict(self) -> dict:
+        stages = {
+            name: {k: round(v, 6) if isinstance(v, float) else v for k, v in totals.items()}
+            for name, totals in self.stages.items()
+        }
+        report = {
+            "version": REPORT_VERSION,
+            "script": self.script,
+            "startedAt": time.strftime('%Y-%m-%dT%H:%M:%SZ', time.gmtime(self.started_at)),
+            "wall": round(self.run_wall, 6),
+            "cpu": round(self.run_cpu, 6),
+            "stages": stages,
+            "histograms": {name: h.to_dict() for name, h in self.histograms.items()},
+            "counters": self.counters,
+        }
+        if self.trace_memory:
+            report["peakBytes"] = self.peak_bytes
+        if self.profile_path:
+            report["profile"] = self.profile_path
+        return report
+
+    def write_report(self, path: str) -> None:
+        write_atomic(path, json.dumps(self.to_dict(), indent=2).encode('utf-8'))
+
+    def report(self) -> None:
+        print(f"\nStage timings ({self.run_wall:.2f}s wall):")
+        for name, totals in self.stages.items():
+            line = f"  {name}: {totals['selfWall']:.3f}s wall, {totals['selfCpu']:.3f}s cpu"
+            if totals["calls"] > 1:
+                line += f" over {totals['calls']} calls"
+            if totals["childCpu"] > 0.0005:
+                line += f", {totals['childCpu']:.3f}s worker cpu"
+            if self.trace_memory:
+                line += f", peak {totals['peakBytes'] / 1024 / 1024:.1f} MB"
+            print(line)
+        for name, histogram in self.histograms.items():
+            h = histogram.to_dict()
+            if h["count"]:
+                print(f"  {name}: {h['count']} requests, p50 {h['p50Ms']:.0f} ms, "
+                      f"p90 {h['p90Ms']:.0f} ms, p99 {h['p99Ms']:.0f} ms, max {h['maxMs']:.0f} ms")
+        if self.trace_memory:
+            print(f"  Peak traced memory: {self.peak_bytes / 1024 / 1024:.1f} MB")
+        if self.profile_path:
+            print(f"  cProfile stats written to {self.profile_path}")
+
+class TimedReader:
+    """File-like wrapper that times every read as a profiler stage."""
+
+    def __init__(self, profiler: Profiler, stream: IO, name: str):
+        self.profiler = profiler
+        self.stream = stream
+        self.name = name
+
+    def read(self, size: int = -1):
+        with self.profiler.stage(self.name):
+            return self.stream.read(size)
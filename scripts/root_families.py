@@ -0,0 +1,130 @@
+#!/usr/bin/env python3
+"""
+Root families: words linked through the `derivation` field of Strong's.
+
+Derivations name the word an entry comes from, e.g. "from H1254",
+"(Aramaic) corresponding to H2706" or "the same as H3", or say it has none
+("a primitive root"). Each link joins two words in a union-find, and every
+connected group of two or more vocabulary words is a family.
+
+Only the first Strong's number of the leading clause counts as the link:
+text after ";" and in parentheses is commentary ("compare H...", "in the
+sense of H..."), and a compound such as "from H1 and H3050" joins only the
+family of H1, so proper names do not bridge unrelated roots.
+
+Output (public/data/root-families.json):
+    {"version": 1, "ids": [...], "family": [f or -1, ...],   # aligned with "ids"
+     "families": [[positions], ...]}
+
+A word's relatives are families[family[pos]]; -1 means it has none. Family
+members and families are in vocabulary order.
+
+Run standalone against a downloaded OpenScriptures dictionary:
+    python scripts/root_families.py strongs-hebrew-dictionary.js [vocabulary.json] [root-families.json]
+"""
+
+import json
+import os
+import re
+import sys
+
+from build_io import PUBLIC_DATA_DIR, VOCABULARY_PATH, write_atomic
+from strongs_stream import iter_strongs_dictionary
+
+FAMILIES_PATH = os.path.join(PUBLIC_DATA_DIR, "root-families.json")
+
+FAMILIES_VERSION = 1
+
+PARENTHESES_RE = re.compile(r'\([^()]*\)')
+STRONGS_RE = re.compile(r'\bH(\d+)\b')
+
+def derivation_link(derivation: str) -> str | None:
+    """The Strong's id a derivation says the word comes from, or None."""
+    clause = PARENTHESES_RE.sub('', derivation.split(';', 1)[0])
+    match = STRONGS_RE.search(clause)
+    return f"H{int(match.group(1))}" if match else None
+
+class UnionFind:
+    """Disjoint sets of string keys, with union by size and path halving."""
+
+    def __init__(self):
+        self.parent: dict[str, str] = {}
+        self.size: dict[str, int] = {}
+
+    def find(self, key: str) -> str:
+        parent = self.parent
+        if key not in parent:
+            parent[key] = key
+            self.size[key] = 1
+            return key
+        while parent[key] != key:
+            parent[key] = parent[parent[key]]
+            key = parent[key]
+        return key
+
+    def union(self, a: str, b: str) -> None:
+        a, b = self.find(a), self.find(b)
+        if a == b:
+            return
+        if self.size[a] < self.size[b]:
+            a, b = b, a
+        self.parent[b] = a
+        self.size[a] += self.size[b]
+
+class FamilyBuilder:
+    """Collects derivation links one entry at a time."""
+
+    def __init__(self):
+        self.sets = UnionFind()
+        self.links = 0
+
+    def add(self, strongs_num: str, entry: dict) -> None:
+        base = derivation_link(entry.get("derivation") or "")
+        if base is not None and base != strongs_num:
+            self.sets.union(strongs_num, base)
+            self.links += 1
+
+    def to_dict(self, words: list) -> dict:
+        members: dict[str, list[int]] = {}
+        for pos, word in enumerate(words):
+            members.setdefault(self.sets.find(word["id"]), []).append(pos)
+        families = [positions for positions in members.values() if len(positions) > 1]
+        families.sort(key=lambda positions: positions[0])
+        family = [-1] * len(words)
+        for f, positions in enumerate(families):
+            for pos in positions:
+                family[pos] = f
+        return {
+            "version": FAMILIES_VERSION,
+            "ids": [w["id"] for w in words],
+            "family": family,
+            "families": families,
+        }
+
+    def write(self, words: list, path: str = FAMILIES_PATH) -> dict:
+        """Write the families of `words`; returns what was written."""
+        data = self.to_dict(words)
+        write_atomic(path, json.dumps(data, separators=(',', ':')).encode('utf-8'))
+        return data
+
+def report(data: dict, links: int, path: str) -> None:
+    in_families = sum(len(f) for f in data["families"])
+    largest = max((len(f) for f in data["families"]), default=0)
+    print(f"Linked {links} derivations: {len(data['families'])} root families covering {in_families} words "
+          f"(largest {largest}) written to {path}")
+
+def main():
+    if len(sys.argv) < 2:
+        sys.exit("usage: root_families.py strongs-hebrew-dictionary.js [vocabulary.json] [root-families.json]")
+    vocabulary = sys.argv[2] if len(sys.argv) > 2 else VOCABULARY_PATH
+    target = sys.argv[3] if len(sys.argv) > 3 else FAMILIES_PATH
+    builder = FamilyBuilder()
+    with open(sys.argv[1], encoding='utf-8') as f:
+        for strongs_num, entry in iter_strongs_dictionary(f):
+            builder.add(strongs_num, entry)
+    with open(vocabulary, encoding='utf-8') as f:
+        words = json.load(f)["words"]
+    report(builder.write(words, target), builder.links, target)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,305 @@
+#!/usr/bin/env python3
+"""
+Prebuilt search index for the vocabulary page.
+
+Words are numbered by rank (most frequent first, then Strong's number), and
+every posting list is sorted by rank, so merging postings yields results in
+frequency order without sorting, and a search can stop after `limit` hits.
+
+    hebrew           sorted consonantal keys (points removed, final letters
+                     normalised; multi-word lemmas also under each word)
+    transliteration  sorted ASCII-folded keys from the transliteration and
+                     the simple pronunciation
+    english          sorted gloss/definition tokens with separate gloss and
+                     definition postings, plus trigram -> token postings
+
+A Hebrew or transliteration query is a prefix: two binary searches give the
+range of matching keys. Each table also stores the first HEAD_SIZE ranks
+under every one-character prefix, which answer the first keystroke. An English query token is matched as a substring of
+the index tokens: its trigrams select the candidate tokens (a prefix range
+for queries shorter than a trigram). Gloss hits rank above definition-only
+hits; within each group results are in frequency order.
+
+Output (public/data/search-index.json):
+    {"version": 1, "ids": [...],
+     "hebrew": {"keys": [...], "postings": [[ranks], ...], "heads": {"א": [ranks], ...}},
+     "transliteration": {"keys": [...], "postings": [[ranks], ...], "heads": {...}},
+     "english": {"tokens": [...], "gloss": [[ranks], ...], "definition": [[ranks], ...],
+                 "grams": {"cre": [token indexes], ...}, "glossHeads": {...}, "definitionHeads": {...}}}
+
+Run standalone for an existing vocabulary, optionally trying some queries:
+    python scripts/search_index.py [vocabulary.json] [search-index.json] [--query TEXT ...]
+"""
+
+import argparse
+import bisect
+import heapq
+import json
+import os
+import re
+import time
+import unicodedata
+from itertools import groupby, islice
+from operator import itemgetter
+from typing import Iterable, Iterator
+
+import hebrew_text
+from build_io import PUBLIC_DATA_DIR, VOCABULARY_PATH, write_atomic
+from hebrew_text import consonants
+from key_terms import MARKER_RE, STOPWORDS
+from verse_index import WORD_RE
+
+SEARCH_INDEX_PATH = os.path.join(PUBLIC_DATA_DIR, "search-index.json")
+
+SEARCH_INDEX_VERSION = 1
+GRAM = 3
+MIN_TOKEN = 2
+DEFAULT_LIMIT = 50
+# One-character prefixes match a large share of the keys, so the first ranks
+# under each are stored rather than merged from hundreds of postings per keystroke
+HEAD_SIZE = DEFAULT_LIMIT
+
+ENGLISH_RE = re.compile(r"[a-z]+")
+LATIN_RE = re.compile(r"[^a-z ]")
+
+def hebrew_keys(hebrew: str) -> set[str]:
+    """The whole consonantal form and each of its words, e.g. "בֵּית לֶחֶם" -> בית, לחמ, ביתלחמ."""
+    parts = WORD_RE.findall(consonants(hebrew))
+    return {"".join(parts), *parts} - {""}
+
+def fold_latin(text: str) -> str:
+    """Lower-case ASCII letters and spaces only: "shâlôwm" -> "shalowm", "ʼĕlôhîym" -> "elohiym"."""
+    decomposed = unicodedata.normalize('NFD', text.lower())
+    return " ".join(LATIN_RE.sub('', decomposed).split())
+
+def transliteration_keys(word: dict) -> set[str]:
+    # Words from before pronunciation fields were added get them computed here
+    pronunciation = word.get("pronunciation") or hebrew_text.pronunciation_fields(word["hebrew"])["pronunciation"]
+    forms = [word.get("transliteration", ""), pronunciation["simple"]]
+    keys = set()
+    for form in map(fold_latin, forms):
+        keys.update([form.replace(" ", ""), *form.split()])
+    return keys - {""}
+
+def english_tokens(text: str) -> set[str]:
+    tokens = ENGLISH_RE.findall(MARKER_RE.sub(" ", text.lower()))
+    return {t for t in tokens if len(t) >= MIN_TOKEN and t not in STOPWORDS}
+
+def grams(token: str) -> set[str]:
+    return {token[i:i + GRAM] for i in range(len(token) - GRAM + 1)}
+
+def rank_order(words: list[dict]) -> list[int]:
+    """Vocabulary positions, most frequent first, then by Strong's number."""
+    def key(pos: int) -> tuple[int, int]:
+        digits = re.sub(r'\D', '', words[pos]["strongs"])
+        return -words[pos]["frequency"], int(digits) if digits else 0
+    return sorted(range(len(words)), key=key)
+
+def merged(postings: Iterable[list[int]]) -> Iterator[int]:
+    """Union of rank-sorted posting lists, in rank order."""
+    for rank, _ in groupby(heapq.merge(*postings)):
+        yield rank
+
+def top_union(postings: Iterable[list[int]], limit: int) -> list[int]:
+    """
+    The `limit` lowest ranks in the union of rank-sorted posting lists.
+
+    Lists are visited in order of their first rank, and each is read only
+    while it can still improve on the current `limit`-th best, so a prefix
+    that matches thousands of keys costs little more than one that matches a few.
+    """
+    lists = sorted((p for p in postings if p), key=itemgetter(0))
+    best: list[int] = []  # negated, so best[0] is minus the worst rank kept
+    kept = set()
+    for ranks in lists:
+        if len(best) == limit and ranks[0] >= -best[0]:
+            break
+        for rank in ranks:
+            if len(best) == limit and rank >= -best[0]:
+                break
+            if rank not in kept:
+                kept.add(rank)
+                heapq.heappush(best, -rank)
+                if len(best) > limit:
+                    kept.discard(-heapq.heappop(best))
+    return sorted(-r for r in best)
+
+def heads(keys: list[str], postings: list[list[int]]) -> dict[str, list[int]]:
+    """First HEAD_SIZE ranks under each one-character prefix."""
+    by_initial: dict[str, list[list[int]]] = {}
+    for key, ranks in zip(keys, postings):
+        by_initial.setdefault(key[0], []).append(ranks)
+    return {c: list(islice(merged(lists), HEAD_SIZE)) for c, lists in sorted(by_initial.items())}
+
+def sorted_postings(postings: dict[str, set[int]]) -> dict:
+    keys = sorted(postings)
+    ranks = [sorted(postings[k]) for k in keys]
+    return {"keys": keys, "postings": ranks, "heads": heads(keys, ranks)}
+
+def build_search_index(words: list[dict]) -> dict:
+    order = rank_order(words)
+    hebrew: dict[str, set[int]] = {}
+    transliteration: dict[str, set[int]] = {}
+    gloss: dict[str, set[int]] = {}
+    definition: dict[str, set[int]] = {}
+
+    for rank, pos in enumerate(order):
+        word = words[pos]
+        for key in hebrew_keys(word["hebrew"]):
+            hebrew.setdefault(key, set()).add(rank)
+        for key in transliteration_keys(word):
+            transliteration.setdefault(key, set()).add(rank)
+        gloss_tokens = english_tokens(word.get("gloss", ""))
+        for token in gloss_tokens:
+            gloss.setdefault(token, set()).add(rank)
+        # Definition postings only list words the token does not already find by gloss
+        for token in english_tokens(word.get("definition", "")) - gloss_tokens:
+            definition.setdefault(token, set()).add(rank)
+
+    tokens = sorted(gloss.keys() | definition.keys())
+    gloss_postings = [sorted(gloss.get(t, ())) for t in tokens]
+    definition_postings = [sorted(definition.get(t, ())) for t in tokens]
+    trigrams: dict[str, list[int]] = {}
+    for i, token in enumerate(tokens):
+        for gram in sorted(grams(token)):
+            trigrams.setdefault(gram, []).append(i)
+
+    return {
+        "version": SEARCH_INDEX_VERSION,
+        "ids": [words[pos]["id"] for pos in order],
+        "hebrew": sorted_postings(hebrew),
+        "transliteration": sorted_postings(transliteration),
+        "english": {
+            "tokens": tokens,
+            "gloss": gloss_postings,
+            "definition": definition_postings,
+            "grams": dict(sorted(trigrams.items())),
+            "glossHeads": heads(tokens, gloss_postings),
+            "definitionHeads": heads(tokens, definition_postings),
+        },
+    }
+
+def write_search_index(words: list[dict], path: str = SEARCH_INDEX_PATH) -> int:
+    """Build and write the search index; returns its size in bytes."""
+    data = json.dumps(build_search_index(words), ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+    write_atomic(path, data)
+    return len(data)
+
+class SearchIndex:
+    """Queries a loaded search index the way the app would."""
+
+    def __init__(self, data: dict):
+        self.ids = data["ids"]
+        self.hebrew = data["hebrew"]
+        self.transliteration = data["transliteration"]
+        english = data["english"]
+        self.tokens = english["tokens"]
+        self.gloss = english["gloss"]
+        self.definition = english["definition"]
+        self.grams = english["grams"]
+        self.gloss_heads = english["glossHeads"]
+        self.definition_heads = english["definitionHeads"]
+
+    @staticmethod
+    def prefix_range(keys: list[str], prefix: str) -> range:
+        lo = bisect.bisect_left(keys, prefix)
+        # Every key starting with `prefix` sorts before prefix + U+FFFF
+        hi = bisect.bisect_left(keys, prefix + "\uffff", lo)
+        return range(lo, hi)
+
+    def prefix_postings(self, table: dict, prefix: str, limit: int) -> list[list[int]]:
+        if len(prefix) == 1 and limit <= HEAD_SIZE:
+            return [table["heads"].get(prefix, [])]
+        return [table["postings"][i] for i in self.prefix_range(table["keys"], prefix)]
+
+    def matching_tokens(self, fragment: str) -> list[int]:
+        """Indexes of the English tokens containing `fragment`."""
+        if len(fragment) < GRAM:
+            return list(self.prefix_range(self.tokens, fragment))
+        candidates = None
+        # Rarest trigram first keeps the intersection small
+        for gram in sorted(grams(fragment), key=lambda g: len(self.grams.get(g, ()))):
+            found = self.grams.get(gram)
+            if not found:
+                return []
+            candidates = set(found) if candidates is None else candidates.intersection(found)
+        return [i for i in sorted(candidates) if fragment in self.tokens[i]]
+
+    def english_matches(self, fragments: list[str], limit: int) -> tuple[Iterator[int], Iterator[int]]:
+        """
+        Lazy rank streams of the words in which every fragment is found: those
+        with every fragment in the gloss, and all of them.
+        """
+        if len(fragments) == 1:
+            # Nothing to intersect: only the first `limit` of each stream can be used
+            if len(fragments[0]) == 1 and limit <= HEAD_SIZE:
+                gloss = [self.gloss_heads.get(fragments[0], [])]
+                definition = [self.definition_heads.get(fragments[0], [])]
+            else:
+                token_ids = self.matching_tokens(fragments[0])
+                gloss = [self.gloss[i] for i in token_ids]
+                definition = [self.definition[i] for i in token_ids]
+            return iter(top_union(gloss, limit)), iter(top_union(gloss + definition, limit))
+        postings = []
+        for fragment in fragments:
+            token_ids = self.matching_tokens(fragment)
+            postings.append(([self.gloss[i] for i in token_ids], [self.definition[i] for i in token_ids]))
+        # Stream the largest fragment; the others become membership sets
+        postings.sort(key=lambda p: sum(map(len, p[0])) + sum(map(len, p[1])), reverse=True)
+        (gloss, definition), rest = postings[0], postings[1:]
+        rest_gloss = [set(merged(g)) for g, _ in rest]
+        rest_any = [in_gloss.union(merged(d)) for in_gloss, (_, d) in zip(rest_gloss, rest)]
+        strong = (r for r in merged(gloss) if all(r in s for s in rest_gloss))
+        matched = (r for r in merged(gloss + definition) if all(r in s for s in rest_any))
+        return strong, matched
+
+    def search(self, query: str, limit: int = DEFAULT_LIMIT) -> list[str]:
+        """Word ids matching `query`, best first."""
+        key = "".join(WORD_RE.findall(consonants(query)))
+        if key:
+            return [self.ids[r] for r in top_union(self.prefix_postings(self.hebrew, key, limit), limit)]
+
+        query = fold_latin(query)
+        if not query:
+            return []
+        fragments = [f for f in query.split() if f not in STOPWORDS] or query.split()
+        strong, matched = self.english_matches(fragments, limit)
+        translit = top_union(self.prefix_postings(self.transliteration, query.replace(" ", ""), limit), limit)
+        # Transliteration and gloss hits first, then definition hits; each in
+        # frequency order. Only as much of each stream as `limit` needs is read.
+        results = []
+        seen = set()
+        for ranks in (merged([translit, strong]), matched):
+            for rank in ranks:
+                if rank not in seen:
+                    seen.add(rank)
+                    results.append(self.ids[rank])
+                    if len(results) == limit:
+                        return results
+        return results
+
+def load_search_index(path: str = SEARCH_INDEX_PATH) -> SearchIndex:
+    with open(path, encoding='utf-8') as f:
+        return SearchIndex(json.load(f))
+
+def main():
+    parser = argparse.ArgumentParser(description="Build the vocabulary search index.")
+    parser.add_argument("vocabulary", nargs="?", default=VOCABULARY_PATH)
+    parser.add_argument("output", nargs="?", default=SEARCH_INDEX_PATH)
+    parser.add_argument("--query", action="append", default=[], help="Search the built index and print the timing")
+    args = parser.parse_args()
+
+    with open(args.vocabulary, encoding='utf-8') as f:
+        words = json.load(f)["words"]
+    size = write_search_index(words, args.output)
+    print(f"Wrote search index for {len(words)} words ({size / 1024:.0f} KB) to {args.output}")
+
+    index = load_search_index(args.output)
+    for query in args.query:
+        start = time.perf_counter()
+        results = index.search(query)
+        elapsed = (time.perf_counter() - start) * 1000
+        print(f"  {query!r}: {len(results)} results in {elapsed:.2f} ms: {', '.join(results[:10])}")
+
+if __name__ == "__main__":
+    main()
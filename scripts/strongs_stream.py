@@ -0,0 +1,124 @@
+"""
+Incremental parser for the OpenScriptures strongs-hebrew-dictionary.js file.
+
+The file is a JavaScript assignment rather than JSON:
+
+    var strongsHebrewDictionary = {"H1":{"lemma":...},"H2":{...}, ... };
+    module.exports = strongsHebrewDictionary;
+
+`iter_strongs_dictionary()` reads it chunk by chunk, finds the object
+literal, and yields one `(strongs_num, entry)` pair at a time. Only the
+current chunk and the entry being decoded are held in memory, so peak usage
+does not grow with the size of the dictionary.
+"""
+
+import codecs
+import json
+import re
+from typing import IO, Iterator
+
+CHUNK_SIZE = 64 * 1024
+
+START_RE = re.compile(r'var\s+strongsHebrewDictionary\s*=\s*\{')
+KEY_RE = re.compile(r'\s*("(?:[^"\\]|\\.)*")\s*:\s*')
+SEPARATOR_RE = re.compile(r'[\s,]*')
+# Strings are matched whole so braces inside them are skipped
+BRACE_RE = re.compile(r'"(?:[^"\\]|\\.)*"|[{}]')
+
+class StreamReader:
+    """Text buffer over a byte or text stream that keeps only unconsumed input."""
+
+    def __init__(self, stream: IO, chunk_size: int = CHUNK_SIZE):
+        self.stream = stream
+        self.chunk_size = chunk_size
+        self.decoder = codecs.getincrementaldecoder('utf-8')()
+        self.buf = ''
+        self.pos = 0
+        self.eof = False
+
+    def fill(self) -> bool:
+        """Append one more chunk; returns False once the stream is exhausted."""
+        if self.eof:
+            return False
+        chunk = self.stream.read(self.chunk_size)
+        if not chunk:
+            self.eof = True
+            self.buf += self.decoder.decode(b'', final=True)
+            return False
+        if isinstance(chunk, bytes):
+            chunk = self.decoder.decode(chunk)
+        if self.pos:
+            self.buf = self.buf[self.pos:]
+            self.pos = 0
+        self.buf += chunk
+        return True
+
+    def match(self, pattern: re.Pattern) -> re.Match | None:
+        """Match `pattern` at the cursor, reading more input if the match might extend further."""
+        while True:
+            m = pattern.match(self.buf, self.pos)
+            if m and (m.end() < len(self.buf) or self.eof):
+                return m
+            if not self.fill():
+                return pattern.match(self.buf, self.pos)
+
+    def search(self, pattern: re.Pattern) -> re.Match | None:
+        while True:
+            m = pattern.search(self.buf, self.pos)
+            if m:
+                return m
+            # Keep a tail in case the pattern straddles the chunk boundary
+            self.pos = max(self.pos, len(self.buf) - 256)
+            if not self.fill():
+                return None
+
+    def object_end(self) -> int:
+        """Index just past the balanced {...} starting at the cursor."""
+        while True:
+            depth = 0
+            last = self.pos
+            for m in BRACE_RE.finditer(self.buf, self.pos):
+                if '"' in self.buf[last:m.start()]:
+                    # A string was cut off by the chunk boundary
+                    break
+                last = m.end()
+                if m.group() == '{':
+                    depth += 1
+                elif m.group() == '}':
+                    depth -= 1
+                    if depth == 0:
+                        return m.end()
+            if not self.fill():
+                raise ValueError("Could not parse OpenScriptures dictionary: unterminated entry")
+
+def parse_entry(text: str) -> dict:
+    """Decode one entry object, tolerating JavaScript trailing commas."""
+    text = re.sub(r',\s*}', '}', text)
+    text = re.sub(r',\s*]', ']', text)
+    return json.loads(text)
+
+def iter_strongs_dictionary(stream: IO, chunk_size: int = CHUNK_SIZE) -> Iterator[tuple[str, dict]]:
+    """Yield `(strongs_num, entry)` pairs from a strongs-hebrew-dictionary.js stream."""
+    reader = StreamReader(stream, chunk_size)
+    start = reader.search(START_RE)
+    if not start:
+        raise ValueError("Could not parse OpenScriptures dictionary")
+    reader.pos = start.end()
+
+    while True:
+        reader.pos = reader.match(SEPARATOR_RE).end()
+        if reader.pos >= len(reader.buf):
+            raise ValueError("Could not parse OpenScriptures dictionary: unexpected end of input")
+        if reader.buf[reader.pos] == '}':
+            return
+
+        key = reader.match(KEY_RE)
+        if not key:
+            raise ValueError(f"Could not parse OpenScriptures dictionary near: {reader.buf[reader.pos:reader.pos + 40]!r}")
+        strongs_num = json.loads(key.group(1))
+        reader.pos = key.end()
+
+        end = reader.object_end()
+        entry = parse_entry(reader.buf[reader.pos:end])
+        reader.pos = end
+        yield strongs_num, entry
@@ -0,0 +1,28 @@
+import os
+import sys
+
+SCRIPTS_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+if SCRIPTS_DIR not in sys.path:
+    sys.path.insert(0, SCRIPTS_DIR)
+
+# Re-exported for the test modules
+from build_io import VERSES_PATH, VOCABULARY_PATH, load_script  # noqa: E402,F401
+
+def synthetic_entries(count: int) -> list[tuple[str, dict]]:
+    """OpenScriptures-style entries: the first FREQUENCY_DATA words plus `count` made-up ones."""
+    vocab = load_script('fetch-vocabulary')
+    strongs_nums = list(vocab.FREQUENCY_DATA)[:50] + [f"H{n}" for n in range(9000, 9000 + count)]
+    entries = []
+    for i, strongs_num in enumerate(strongs_nums):
+        entries.append((strongs_num, {
+            "lemma": "אָב",
+            "xlit": "ʼâb",
+            "derivation": "a primitive root" if i % 3 == 0 else f"from H{i}",
+            "strongs_def": ["to create", "a woman, wife", "upon", "the holy mountain", "father"][i % 5],
+            "kjv_def": f"meaning {i}, (extra) detail",
+        }))
+    # A repeated key replaces the earlier entry
+    entries.append(("H9000", {"strongs_def": "replacement", "kjv_def": ""}))
+    entries.append(("G1", {"strongs_def": "not Hebrew"}))
+    return entries
@@ -0,0 +1,47 @@
+import json
+
+import bench_pipeline
+from strongs_stream import iter_strongs_dictionary
+
+def test_synthetic_dictionary_round_trips(tmp_path):
+    path = str(tmp_path / 'dict.js')
+    bench_pipeline.write_dictionary(path, bench_pipeline.synthetic_entries(500, seed=3))
+    with open(path, 'rb') as f:
+        assert list(iter_strongs_dictionary(f)) == list(bench_pipeline.synthetic_entries(500, seed=3))
+
+def test_sizes_parse():
+    assert [bench_pipeline.parse_size(s) for s in ("10k", "100K", "1M", "250")] == [10_000, 100_000, 1_000_000, 250]
+    assert [bench_pipeline.format_size(n) for n in (10_000, 1_000_000, 250)] == ["10k", "1M", "250"]
+
+def test_run_and_compare_against_baseline(tmp_path, monkeypatch):
+    monkeypatch.setattr(bench_pipeline, 'CORPUS_DIR', str(tmp_path / 'corpus'))
+    results_path = tmp_path / 'results.json'
+    assert bench_pipeline.main(["--sizes", "120", "--repeat", "1", "--save", str(results_path)]) == 0
+
+    results = json.loads(results_path.read_text())
+    stages = results["sizes"]["120"]
+    assert set(stages) == {
+        "parse", "transform", "transformEntry", "extractGloss", "classifier", "classifierRef",
+        "serialize", "searchIndex", "searchQuery", "chapterFetch", "verseBuild",
+    }
+    assert stages["parse"]["items"] == 120
+    assert stages["chapterFetch"]["items"] == 4
+    assert stages["verseBuild"]["items"] == 120
+    assert all(s["throughput"] > 0 and "peakBytes" in s for s in stages.values())
+
+    # A baseline that was 10x faster must be flagged; one 10x slower must not
+    faster = json.loads(results_path.read_text())
+    for s in faster["sizes"]["120"].values():
+        s["throughput"] *= 10
+    assert len(bench_pipeline.compare(results, faster, 0.2)) == len(stages)
+
+    slower = json.loads(results_path.read_text())
+    for s in slower["sizes"]["120"].values():
+        s["throughput"] /= 10
+    assert bench_pipeline.compare(results, slower, 0.2) == []
+
+    # Memory growth beyond the threshold (and the 1 MB floor) is flagged too
+    leaner = json.loads(results_path.read_text())
+    leaner["sizes"]["120"]["serialize"]["peakBytes"] = 0
+    results["sizes"]["120"]["serialize"]["peakBytes"] = 4 * 1024 * 1024
+    assert [r for r in bench_pipeline.compare(results, leaner, 0.2) if "memory" in r] == ["120 serialize: peak memory 0.0 -> 4.0 MB"]
@@ -0,0 +1,139 @@
+import json
+import os
+import shutil
+
+import build_watch
+import dictionary_articles
+from build_watch import SourceWatcher
+from conftest import SCRIPTS_DIR, load_script, synthetic_entries
+
+def copy_script(tmp_path, name: str):
+    """A copy of a script that a test can edit while it is being watched."""
+    path = tmp_path / f"{name}.py"
+    shutil.copy(os.path.join(SCRIPTS_DIR, f"{name}.py"), path)
+    return path, load_script(f"{name}-copy", str(path))
+
+def editor(*edits):
+    """A sleep() stand-in that makes one edit per poll."""
+    pending = list(edits)
+
+    def sleep(_interval):
+        if pending:
+            pending.pop(0)()
+    return sleep
+
+def replace(path, old: str, new: str):
+    def edit():
+        text = path.read_text(encoding='utf-8')
+        assert old in text
+        path.write_text(text.replace(old, new, 1), encoding='utf-8')
+    return edit
+
+def test_only_content_changes_count(tmp_path):
+    a, b = tmp_path / "a.py", tmp_path / "b.py"
+    a.write_text("A = 1\n")
+    b.write_text("B = 1\n")
+    watcher = SourceWatcher([str(a), str(b)])
+    assert watcher.poll() == set()
+
+    a.write_text("A = 2\n")
+    b.write_text("B = 1\n")
+    os.utime(b, ns=(0, 0))
+    assert watcher.poll() == {str(a)}
+    b.unlink()
+    assert watcher.poll() == {str(b)}
+
+def test_failed_rebuilds_do_not_stop_the_watch(tmp_path):
+    path = tmp_path / "config.py"
+    path.write_text("X = 1\n")
+    seen = []
+
+    def rebuild(changed):
+        seen.append(path.read_text())
+        if "oops" in seen[-1]:
+            raise SyntaxError("invalid syntax")
+
+    build_watch.watch([str(path)], rebuild, interval=0, polls=4,
+                      sleep=editor(lambda: path.write_text("X = oops(\n"), lambda: None, lambda: path.write_text("X = 3\n")))
+    assert seen == ["X = oops(\n", "X = 3\n"]
+
+def vocabulary_args(vocab, out, *extra: str):
+    return vocab.parse_args([
+        "--output", str(out / "vocabulary.json"), "--manifest", str(out / "manifest.json"),
+        "--shards-dir", str(out / "shards"), "--binary", str(out / "vocabulary.bin"),
+        "--relations", str(out / "relations.json"), "--search-index", str(out / "search.json"),
+        "--distractors", str(out / "distractors.json"), "--families", str(out / "families.json"),
+        "--articles-dir", str(out / "articles"), "--patches-dir", str(out / "patches"), *extra,
+    ])
+
+def test_vocabulary_watch_rebuilds_only_what_changed(tmp_path, capsys, monkeypatch):
+    parsed = []
+    load_dictionaries = dictionary_articles.load_dictionaries
+    monkeypatch.setattr(dictionary_articles, "load_dictionaries", lambda: parsed.append(1) or load_dictionaries())
+    script, vocab = copy_script(tmp_path, "fetch-vocabulary")
+    out = tmp_path / "out"
+    args = vocabulary_args(vocab, out, "--watch", "--watch-outputs", "distractors")
+    entries = synthetic_entries(30)
+    vocab.build(args, vocab.Profiler("fetch-vocabulary"), entries)
+    capsys.readouterr()
+
+    # Edits that do not change any word leave the word outputs alone
+    (out / "distractors.json").unlink()
+    vocab.build(args, vocab.Profiler("fetch-vocabulary"), entries, changed={str(script)})
+    assert not (out / "distractors.json").exists()
+    assert "Vocabulary unchanged" in capsys.readouterr().out
+
+    parsed.clear()
+    vocab.watch(args, entries, interval=0, polls=1, sleep=editor(replace(script, '"H430": 2602,', '"H430": 26020,')))
+    output = capsys.readouterr().out
+    assert "1 rebuilt" in output and "Rebuilt in" in output
+    assert "skip shards, binary, relations, search-index, families" in output
+    words = json.loads((out / "vocabulary.json").read_text(encoding='utf-8'))["words"]
+    assert next(w for w in words if w["id"] == "H430")["frequency"] == 26020
+    assert (out / "distractors.json").exists()
+    # The dictionaries did not change, so the rebuild used the ones parsed when the watch started
+    assert len(parsed) == 1
+
+def test_only_builds_without_watch_version_the_vocabulary_and_write_everything(tmp_path):
+    script, vocab = copy_script(tmp_path, "fetch-vocabulary")
+    out = tmp_path / "out"
+    entries = synthetic_entries(30)
+    vocab.build(vocabulary_args(vocab, out), vocab.Profiler("fetch-vocabulary"), entries)
+    patches_manifest = lambda: json.loads((out / "patches" / "manifest.json").read_text(encoding='utf-8'))
+    latest = patches_manifest()["latest"]
+    relations = (out / "relations.json").read_bytes()
+
+    args = vocabulary_args(vocab, out, "--watch")
+    edits = replace(script, '"H430": 2602,', '"H430": 26020,'), replace(script, '"H430": 26020,', '"H430": 5,')
+    vocab.watch(args, entries, interval=0, polls=2, sleep=editor(*edits))
+    assert patches_manifest()["latest"] == latest
+    assert not list((out / "patches").glob("patch-*.json"))
+    assert (out / "relations.json").read_bytes() == relations
+    watched = (out / "vocabulary.json").read_bytes()
+
+    # The next normal build patches from the version clients have, not from the last watch rebuild
+    vocab = load_script("fetch-vocabulary-published", str(script))
+    vocab.build(vocabulary_args(vocab, out), vocab.Profiler("fetch-vocabulary"), entries)
+    manifest = patches_manifest()
+    assert manifest["latest"] == latest + 1
+    assert [(p["from"], p["to"], p["changed"]) for p in manifest["patches"]] == [(latest, latest + 1, 1)]
+    assert not (out / "vocabulary-patch-base.json").exists()
+    # Reused texts are byte for byte what a full write gives
+    assert (out / "vocabulary.json").read_bytes() == watched
+    assert (out / "relations.json").read_bytes() != relations
+
+def test_verses_watch_reuses_downloaded_chapters(tmp_path):
+    script, verses_mod = copy_script(tmp_path, "fetch-verses")
+    # Stands in for the first build's downloads: any fetch would fail on the bogus API base
+    for book, chapter, verse, *_ in verses_mod.CURATED_VERSES:
+        verses_mod.CHAPTER_CACHE.setdefault(verses_mod.chapter_key(book, chapter), {})[verse] = "בְּרֵאשִׁית"
+    output = tmp_path / "verses.json"
+    args = verses_mod.parse_args([
+        "--output", str(output), "--no-cache", "--api-base", "http://127.0.0.1:9", "--retries", "0",
+        "--vocabulary", str(tmp_path / "missing.json"), "--journal", str(tmp_path / "journal"), "--watch",
+    ])
+    assert verses_mod.build(args, verses_mod.Profiler("fetch-verses")) == 0
+
+    verses_mod.watch(args, interval=0, polls=1, sleep=editor(replace(script, '"gen": ("Genesis",', '"gen": ("Bereshit",')))
+    verses = json.loads(output.read_text(encoding='utf-8'))["verses"]
+    assert verses[0]["reference"] == "Bereshit 1:1"
@@ -0,0 +1,76 @@
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from chapter_cache import ChapterCache
+
+class ETagServer(BaseHTTPRequestHandler):
+    """Chapter endpoint that honours If-None-Match."""
+
+    hits: list[int] = []
+
+    def do_GET(self):
+        body = json.dumps([{"verse": 1, "text": self.path}]).encode('utf-8')
+        etag = f'"{len(body)}"'
+        if self.headers.get('If-None-Match') == etag:
+            type(self).hits.append(304)
+            self.send_response(304)
+            self.end_headers()
+            return
+        type(self).hits.append(200)
+        self.send_response(200)
+        self.send_header('ETag', etag)
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+@pytest.fixture
+def base_url():
+    ETagServer.hits = []
+    httpd = ThreadingHTTPServer(('127.0.0.1', 0), ETagServer)
+    threading.Thread(target=httpd.serve_forever, daemon=True).start()
+    yield f"http://127.0.0.1:{httpd.server_address[1]}"
+    httpd.shutdown()
+    httpd.server_close()
+
+def test_warm_cache_survives_restart(tmp_path, base_url):
+    url = f"{base_url}/1/1/"
+    cache = ChapterCache(str(tmp_path))
+    assert cache.fetch("1_1", url)[0]["text"] == "/1/1/"
+    cache.save()
+
+    warm = ChapterCache(str(tmp_path))
+    assert warm.fetch("1_1", url)[0]["text"] == "/1/1/"
+    assert warm.stats["hit"] == 1
+    assert ETagServer.hits == [200]
+
+def test_stale_entry_is_revalidated(tmp_path, base_url):
+    url = f"{base_url}/19/23/"
+    cache = ChapterCache(str(tmp_path), max_age=0)
+    cache.fetch("19_23", url)
+
+    assert cache.fetch("19_23", url)[0]["text"] == "/19/23/"
+    assert cache.stats == {**cache.stats, "miss": 1, "revalidated": 1}
+    assert ETagServer.hits == [200, 304]
+
+def test_offline_mode_never_requests(tmp_path):
+    cache = ChapterCache(str(tmp_path), offline=True)
+    with pytest.raises(LookupError):
+        cache.fetch("1_2", "http://127.0.0.1:1/never/")
+    assert cache.stats["offline_miss"] == 1
+
+def test_eviction_by_ttl_and_size(tmp_path):
+    cache = ChapterCache(str(tmp_path), ttl=60, max_bytes=10)
+    cache.store("1_1", b'[{"verse": 1}]', None, None)
+    cache.store("1_2", b'[{"verse": 2}]', None, None)
+    cache.index["1_1"]["usedAt"] = time.time() - 120
+    cache.save()
+
+    assert list(cache.index) == []
+    assert cache.stats["evicted"] == 2
+    assert not [p for p in (tmp_path / 'blobs').rglob('*') if p.is_file()]
@@ -0,0 +1,172 @@
+import json
+import random
+import threading
+import time
+import urllib.error
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from chapter_fetcher import RetryPolicy, TokenBucket, fetch_all, get_json
+from conftest import load_script
+
+class BollsStandIn(BaseHTTPRequestHandler):
+    """Serves /get-text/WLC/<book>/<chapter>/ like bolls.life does."""
+
+    requests: list[str] = []
+    in_flight = 0
+    max_in_flight = 0
+    lock = threading.Lock()
+    delay = 0.05
+
+    def do_GET(self):
+        cls = type(self)
+        with cls.lock:
+            cls.requests.append(self.path)
+            cls.in_flight += 1
+            cls.max_in_flight = max(cls.max_in_flight, cls.in_flight)
+        time.sleep(cls.delay)
+        parts = [p for p in self.path.split('/') if p]
+        book, chapter = int(parts[-2]), int(parts[-1])
+        body = json.dumps([
+            {"verse": v, "text": f"text {book}:{chapter}:{v}"} for v in range(1, 31)
+        ]).encode('utf-8')
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/json')
+        self.end_headers()
+        self.wfile.write(body)
+        with cls.lock:
+            cls.in_flight -= 1
+
+    def log_message(self, *args):
+        pass
+
+@pytest.fixture
+def server():
+    BollsStandIn.requests = []
+    BollsStandIn.in_flight = 0
+    BollsStandIn.max_in_flight = 0
+    httpd = ThreadingHTTPServer(('127.0.0.1', 0), BollsStandIn)
+    thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{httpd.server_address[1]}/get-text/WLC"
+    httpd.shutdown()
+    httpd.server_close()
+
+def test_distinct_chapters_fetched_once(server):
+    verses_mod = load_script('fetch-verses')
+    selections = [
+        ("gen", 1, v, 1, [], "") for v in range(1, 21)
+    ] + [
+        ("ps", 23, v, 1, [], "") for v in range(1, 7)
+    ] + [
+        ("isa", 53, 5, 2, [], ""),
+    ]
+
+    requested = verses_mod.prefetch_chapters(selections, server, workers=8, per_host=4, rate=0)
+
+    assert requested == 3
+    assert sorted(BollsStandIn.requests) == sorted([
+        "/get-text/WLC/1/1/", "/get-text/WLC/19/23/", "/get-text/WLC/23/53/",
+    ])
+    assert verses_mod.CHAPTER_CACHE["19_23"][4] == "text 19:23:4"
+
+    # A second pass is served entirely from the in-memory cache
+    assert verses_mod.prefetch_chapters(selections, server) == 0
+    assert len(BollsStandIn.requests) == 3
+
+def test_per_host_limit_is_respected(server):
+    urls = {str(i): f"{server}/1/{i}/" for i in range(1, 13)}
+
+    results = fetch_all(urls, workers=12, per_host=3, rate=0)
+
+    assert len(results) == 12
+    assert BollsStandIn.max_in_flight <= 3
+
+def test_failed_requests_are_reported(server):
+    errors = []
+    urls = {"ok": f"{server}/1/1/", "bad": "http://127.0.0.1:1/unreachable/"}
+
+    results = fetch_all(urls, rate=0, on_done=lambda k, d, e: e and errors.append(k))
+
+    assert list(results) == ["ok"]
+    assert errors == ["bad"]
+
+def test_token_bucket_paces_requests():
+    bucket = TokenBucket(rate=50, burst=1)
+    start = time.monotonic()
+    for _ in range(6):
+        bucket.acquire()
+    # First token is banked, the other five wait ~20ms each
+    assert time.monotonic() - start >= 0.09
+
+class FlakyError(OSError):
+    pass
+
+def test_retry_policy_backs_off_with_jitter():
+    sleeps = []
+    policy = RetryPolicy(attempts=4, base=0.5, cap=1.5, rng=random.Random(1), sleep=sleeps.append)
+    calls = []
+
+    def fetch(url):
+        calls.append(url)
+        if len(calls) < 4:
+            raise FlakyError("connection reset")
+        return "ok"
+
+    errors = []
+    results = fetch_all({"k": "u"}, rate=0, fetch=fetch, retry=policy, on_done=lambda k, p, e: errors.append(e))
+    assert results == {"k": "ok"}
+    assert errors == [None]
+    assert policy.retries == 3
+    # Each wait is drawn from [0, min(cap, base * 2**n)]
+    assert all(0 <= s <= limit for s, limit in zip(sleeps, [0.5, 1.0, 1.5]))
+    assert len(set(sleeps)) == 3
+
+def test_fetch_all_reports_the_last_error_once_retries_run_out():
+    policy = RetryPolicy(attempts=2, base=0, sleep=lambda s: None)
+    calls = []
+    errors = []
+
+    def fetch(url):
+        calls.append(url)
+        raise FlakyError(f"attempt {len(calls)}")
+
+    results = fetch_all({"k": "u"}, rate=0, fetch=fetch, retry=policy, on_done=lambda k, p, e: errors.append(e))
+    assert results == {}
+    assert len(calls) == 2
+    assert [str(e) for e in errors] == ["attempt 2"]
+
+def test_retry_budget_and_final_errors():
+    policy = RetryPolicy(attempts=3, base=0, budget=2, sleep=lambda s: None)
+    assert policy.should_retry(0, FlakyError())
+    # A 404 or an offline cache miss will not go away by asking again
+    assert not policy.should_retry(0, urllib.error.HTTPError("u", 404, "Not Found", None, None))
+    assert not policy.should_retry(0, LookupError("not cached"))
+    assert not policy.should_retry(2, FlakyError())
+    assert policy.should_retry(1, urllib.error.HTTPError("u", 503, "Unavailable", None, None))
+    # The budget is spent: further failures are final
+    assert not policy.should_retry(0, FlakyError())
+    assert policy.retries == 2
+
+def test_retry_after_is_honoured():
+    policy = RetryPolicy(base=0.001, cap=10, rng=random.Random(0))
+    error = urllib.error.HTTPError("u", 429, "Too Many Requests", {"Retry-After": "3"}, None)
+    assert policy.delay(0, error) == 3
+
+def test_fetch_all_retries_transient_failures(server):
+    failures = {"2": 2}
+
+    def fetch(url):
+        key = url.rstrip('/').rsplit('/', 1)[-1]
+        if failures.get(key):
+            failures[key] -= 1
+            raise FlakyError("timed out")
+        return get_json(url)
+
+    urls = {str(i): f"{server}/1/{i}/" for i in range(1, 4)}
+    retry = RetryPolicy(attempts=3, base=0, sleep=lambda s: None)
+    results = fetch_all(urls, rate=0, fetch=fetch, retry=retry)
+
+    assert sorted(results) == ["1", "2", "3"]
+    assert retry.retries == 2
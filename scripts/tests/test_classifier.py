@@ -0,0 +1,50 @@
+import random
+
+import pytest
+
+from classifier import FEMININE_KEYWORDS, SEMANTIC_CATEGORIES, KeywordClassifier, KeywordMatcher
+from conftest import load_script
+
+vocab = load_script('fetch-vocabulary')
+
+def reference(strongs_def: str, derivation: str, definition: str) -> tuple:
+    gender = "feminine" if any(w in definition.lower() for w in FEMININE_KEYWORDS) else "masculine"
+    return (
+        vocab.determine_pos(strongs_def, derivation),
+        vocab.determine_semantic_category(definition, ""),
+        gender,
+    )
+
+@pytest.mark.parametrize("strongs_def,derivation", [
+    ("to create", "a primitive root"),
+    ("father, chief", "a primitive word"),
+    ("a woman, wife", "from H582"),
+    ("godly, a good man", ""),
+    ("upon, over", "properly, the same as H5920"),
+    ("and, also", ""),
+    ("he, she, it (pronoun)", ""),
+    ("behold! (interjection)", ""),
+    ("slowly, gently (adverb)", ""),
+    ("Seagod-womanly dominion", ""),
+    ("", ""),
+])
+def test_matches_reference(strongs_def, derivation):
+    definition = f"{strongs_def}. kjv".strip('. ')
+    classifier = KeywordClassifier()
+    assert tuple(classifier.classify(strongs_def, derivation, definition)) == reference(strongs_def, derivation, definition)
+
+def test_matcher_reports_overlapping_keywords():
+    matcher = KeywordMatcher(["god", "go", "do", "man", "woman", "many"])
+    assert matcher.find("a godly womanly manner") == {"god", "go", "woman", "man"}
+    assert matcher.find("godo") == {"god", "go", "do"}
+
+def test_random_definitions_match_reference():
+    keywords = [kw for kws in SEMANTIC_CATEGORIES.values() for kw in kws] + FEMININE_KEYWORDS
+    keywords += ["to ", "in", "from", " i ", "adverb", "particle", "conjunction", "to be"]
+    rng = random.Random(7)
+    classifier = KeywordClassifier()
+    for _ in range(2000):
+        pieces = rng.choices(keywords + [" ", ",", "x", "e"], k=rng.randint(0, 8))
+        text = "".join(pieces)
+        definition = text + ". " + "".join(rng.choices(keywords, k=2))
+        assert tuple(classifier.classify(text, "", definition)) == reference(text, "", definition)
@@ -0,0 +1,42 @@
+from collections import Counter
+
+from conftest import load_script
+from corpus_frequency import count_corpus, count_file, count_tasks
+from test_osis_ingest import GEN_1_1, OSIS_FOOTER, OSIS_HEADER, book_xml
+
+vocab = load_script('fetch-vocabulary')
+
+def test_counts_strongs_ids_outside_notes(tmp_path):
+    path = tmp_path / 'Gen.xml'
+    path.write_text(OSIS_HEADER + f'<div type="book" osisID="Gen"><chapter osisID="Gen.1">{GEN_1_1}</chapter></div>' + OSIS_FOOTER,
+                    encoding='utf-8')
+    # The variant reading (H9999) inside <note> is not counted
+    assert count_file(str(path)) == Counter({"H7225": 1, "H1254": 1, "H430": 1, "H853": 1, "H8064": 1})
+
+def test_parallel_counts_match_serial(tmp_path):
+    for book, chapters in (("Gen", 5), ("Exod", 3), ("Ps", 12), ("Mal", 2)):
+        (tmp_path / f'{book}.xml').write_text(OSIS_HEADER + book_xml(book, chapters, 10) + OSIS_FOOTER, encoding='utf-8')
+
+    serial = count_corpus(str(tmp_path), jobs=1)
+    assert count_corpus(str(tmp_path), jobs=3) == serial
+    # book_xml tags every verse with H<chapter> and H<verse>
+    assert serial["H1"] == 4 * 10 + (5 + 3 + 12 + 2)
+    assert sum(serial.values()) == (5 + 3 + 12 + 2) * 10 * 2
+
+def test_single_file_is_counted_per_book(tmp_path):
+    path = tmp_path / 'wlc.xml'
+    books = [book_xml(book, chapters, 10, milestones=book == "Ps")
+             for book, chapters in (("Gen", 5), ("Ps", 12), ("Mal", 2))]
+    path.write_text(OSIS_HEADER + "".join(books) + OSIS_FOOTER, encoding='utf-8')
+
+    assert [span is not None for _, span in count_tasks([str(path)])] == [True, True, True]
+    assert count_corpus(str(path), jobs=3) == count_corpus(str(path), jobs=1)
+    assert sum(count_corpus(str(path), jobs=2).values()) == (5 + 12 + 2) * 10 * 2
+
+def test_frequencies_drive_tiers(tmp_path):
+    entries = [("H1", {"strongs_def": "father"}), ("H2", {"strongs_def": "father"}), ("H3", {"strongs_def": "father"})]
+    words = vocab.transform_to_app_format(iter(entries), frequencies={"H1": 900, "H2": 60})
+    assert [(w["id"], w["frequency"], w["tier"]) for w in words] == [("H1", 900, 1), ("H2", 60, 4), ("H3", 0, 5)]
+
+    parallel = vocab.transform_to_app_format(iter(entries), jobs=2, chunk_size=1, frequencies={"H1": 900, "H2": 60})
+    assert parallel == words
@@ -0,0 +1,68 @@
+import json
+
+from conftest import load_script, synthetic_entries
+from dictionary_articles import article_sources, index_articles, load_dictionaries, write_articles
+from vocab_binary import VocabularyFile, write_binary
+
+vocab = load_script('fetch-vocabulary')
+
+def test_every_article_can_be_read_back_from_its_chunk(tmp_path):
+    dictionaries = load_dictionaries()
+    manifest = write_articles(dictionaries, str(tmp_path), chunk_bytes=16 * 1024)
+
+    for source, entries in dictionaries.items():
+        info = manifest["sources"][source]
+        assert len(info["chunks"]) > 1
+        # A repeated id keeps its first entry, as entries.find() does
+        first = {}
+        for entry in entries:
+            first.setdefault(entry["id"], entry)
+        assert set(info["entries"]) == set(first)
+        for entry_id, entry in first.items():
+            chunk, offset, length = info["entries"][entry_id]
+            data = (tmp_path / info["chunks"][chunk]).read_bytes()
+            assert json.loads(data[offset:offset + length]) == entry
+
+    by_strongs = manifest["byStrongs"]
+    assert by_strongs["H1254"]["tdot"] == ["bara"]
+    assert len(by_strongs["H3117"]["tdot"]) == 2
+    assert set(by_strongs) == {e["strongs"] for entries in dictionaries.values() for e in entries}
+
+def test_stale_chunks_are_removed(tmp_path):
+    dictionaries = load_dictionaries()
+    write_articles(dictionaries, str(tmp_path), chunk_bytes=8 * 1024)
+    manifest = write_articles(dictionaries, str(tmp_path))
+    current = {name for s in manifest["sources"].values() for name in s["chunks"]}
+    assert {p.name for p in tmp_path.glob("*.ndjson")} == current
+
+def test_words_carry_their_article_sources(tmp_path):
+    dictionaries = {
+        "tdot": [{"id": "father", "strongs": "H1"}, {"id": "spirit", "strongs": "H9002"}],
+        "vine": [{"id": "father-av", "strongs": "H1"}, {"id": "none", "strongs": ""}],
+    }
+    articles = article_sources(index_articles(dictionaries), dictionaries)
+    assert articles == {"H1": ("tdot", "vine"), "H9002": ("tdot",)}
+
+    manifest_path = str(tmp_path / 'manifest.json')
+    fingerprint = vocab.heuristics_fingerprint()
+    first = vocab.BuildManifest(manifest_path, fingerprint)
+    words = vocab.transform_to_app_format(iter(synthetic_entries(20)), manifest=first, articles=articles)
+    first.save()
+    by_id = {w["id"]: w for w in words}
+    assert by_id["H1"]["articles"] == ["tdot", "vine"]
+    assert by_id["H9002"]["articles"] == ["tdot"]
+    assert "articles" not in by_id["H9003"]
+
+    # Annotated words are reused as they are, and dropped articles disappear
+    second = vocab.BuildManifest(manifest_path, fingerprint, words)
+    again = vocab.transform_to_app_format(iter(synthetic_entries(20)), manifest=second, articles=articles)
+    assert (again, second.rebuilt) == (words, 0)
+    third = vocab.BuildManifest(manifest_path, fingerprint, words)
+    cleared = vocab.transform_to_app_format(iter(synthetic_entries(20)), manifest=third, articles={})
+    assert not any("articles" in w for w in cleared)
+
+    path = str(tmp_path / "vocabulary.bin")
+    write_binary(words, path)
+    with VocabularyFile(path) as binary:
+        assert [record.to_dict() for record in binary] == words
+        assert binary.get("H9003").articles == []
@@ -0,0 +1,59 @@
+import json
+
+import pytest
+
+from conftest import VOCABULARY_PATH
+from distractors import build_distractors, write_distractors
+from key_terms import term_tokens
+
+@pytest.fixture(scope="module")
+def words():
+    with open(VOCABULARY_PATH, encoding='utf-8') as f:
+        return json.load(f)["words"]
+
+def word(n: int, gloss: str, pos: str = "noun", tier: int = 1, frequency: int = 100) -> dict:
+    return {"id": f"H{n}", "gloss": gloss, "partOfSpeech": pos, "tier": tier, "frequency": frequency}
+
+def test_pools_are_unambiguous(words):
+    data = build_distractors(words)
+    assert data["ids"] == [w["id"] for w in words]
+    for pos, pool in enumerate(data["pools"]):
+        assert len(pool) == data["poolSize"]
+        assert pos not in pool
+        own = set(term_tokens(words[pos]["gloss"]))
+        glosses = [words[p]["gloss"].strip().lower() for p in pool]
+        assert len(set(glosses)) == len(glosses)
+        assert words[pos]["gloss"].strip().lower() not in glosses
+        assert all(not own & set(term_tokens(words[p]["gloss"])) for p in pool)
+
+def test_same_part_of_speech_and_tier_come_first(words):
+    data = build_distractors(words)
+    for pos, pool in enumerate(data["pools"]):
+        ranks = [(words[p]["partOfSpeech"] != words[pos]["partOfSpeech"], abs(words[p]["tier"] - words[pos]["tier"]))
+                 for p in pool]
+        assert ranks == sorted(ranks)
+
+def test_ranking_and_rejections():
+    words = [
+        word(1, "A king", frequency=100),
+        word(2, "The king's house", frequency=99),    # shares "king"
+        word(3, "A city", frequency=10),
+        word(4, "A field", frequency=95),
+        word(5, "a field", frequency=94),             # same gloss as H4
+        word(6, "To go", pos="verb", frequency=100),
+        word(7, "A stone", tier=2, frequency=100),
+        word(8, "", frequency=100),                   # no gloss to offer
+        word(9, "A tent", tier=3, frequency=100),
+    ]
+    pools = build_distractors(words, size=5)["pools"]
+    assert [words[p]["id"] for p in pools[0]] == ["H4", "H3", "H7", "H9", "H6"]
+    # A word without a gloss still gets distractors
+    assert len(pools[7]) == 5
+
+def test_small_vocabularies_give_short_pools(tmp_path):
+    words = [word(1, "A king"), word(2, "A city"), word(3, "Kings")]
+    path = tmp_path / "distractors.json"
+    size = write_distractors(words, str(path))
+    data = json.loads(path.read_text(encoding='utf-8'))
+    assert size == path.stat().st_size
+    assert data["pools"] == [[1], [0, 2], [1]]
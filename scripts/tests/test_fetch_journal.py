@@ -0,0 +1,93 @@
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from conftest import load_script
+from fetch_journal import RunJournal
+
+class UnreliableBolls(BaseHTTPRequestHandler):
+    """Chapter endpoint that answers 503 for the chapters listed in `down`."""
+
+    requests: list[str] = []
+    down: set[str] = set()
+
+    def do_GET(self):
+        type(self).requests.append(self.path)
+        if self.path in type(self).down:
+            self.send_response(503)
+            self.end_headers()
+            return
+        parts = [p for p in self.path.split('/') if p]
+        body = json.dumps([{"verse": v, "text": f"text {parts[-2]}:{parts[-1]}:{v}"} for v in range(1, 4)])
+        self.send_response(200)
+        self.end_headers()
+        self.wfile.write(body.encode('utf-8'))
+
+    def log_message(self, *args):
+        pass
+
+@pytest.fixture
+def server():
+    UnreliableBolls.requests = []
+    UnreliableBolls.down = set()
+    httpd = ThreadingHTTPServer(('127.0.0.1', 0), UnreliableBolls)
+    threading.Thread(target=httpd.serve_forever, daemon=True).start()
+    yield f"http://127.0.0.1:{httpd.server_address[1]}/get-text/WLC"
+    httpd.shutdown()
+    httpd.server_close()
+
+def test_journal_round_trip(tmp_path):
+    path = str(tmp_path / 'journal')
+    journal = RunJournal(path, "src")
+    journal.record("1_1", {1: "בראשית", 2: "והארץ"})
+    journal.record("1_2", {1: "ויכלו"})
+    journal.close()
+
+    assert RunJournal(path, "src").load() == {"1_1": {1: "בראשית", 2: "והארץ"}, "1_2": {1: "ויכלו"}}
+    # Chapters from another source are not reused
+    assert RunJournal(path, "other").load() == {}
+
+def test_torn_last_line_is_dropped_and_overwritten(tmp_path):
+    path = tmp_path / 'journal'
+    journal = RunJournal(str(path), "src")
+    journal.record("1_1", {1: "a"})
+    journal.close()
+    with open(path, 'ab') as f:
+        f.write(b'{"key":"1_2","vers')
+
+    resumed = RunJournal(str(path), "src")
+    assert resumed.load() == {"1_1": {1: "a"}}
+    resumed.record("1_3", {1: "c"})
+    resumed.close()
+    assert RunJournal(str(path), "src").load() == {"1_1": {1: "a"}, "1_3": {1: "c"}}
+
+def test_failed_run_resumes_with_missing_chapters(server, tmp_path, monkeypatch, capsys):
+    verses_mod = load_script('fetch-verses')
+    monkeypatch.setattr(verses_mod, "CURATED_VERSES", [
+        ("gen", 1, 1, 1, [], ""), ("gen", 1, 2, 1, [], ""), ("ps", 23, 1, 1, [], ""), ("isa", 53, 2, 2, [], ""),
+    ])
+    monkeypatch.setattr(verses_mod, "CHAPTER_CACHE", {})
+    monkeypatch.setattr(verses_mod, "FAILED_CHAPTERS", {})
+    output = tmp_path / 'verses.json'
+    journal = tmp_path / 'journal'
+    argv = ["--output", str(output), "--api-base", server, "--rate", "0", "--no-cache", "--no-index",
+            "--vocabulary", str(tmp_path / 'missing.json'), "--journal", str(journal), "--backoff", "0"]
+
+    UnreliableBolls.down = {"/get-text/WLC/19/23/"}
+    assert verses_mod.main(argv) == 1
+    assert not output.exists()
+    # The dead chapter used up its retries; the others were requested once
+    assert UnreliableBolls.requests.count("/get-text/WLC/19/23/") == 4
+    assert len(UnreliableBolls.requests) == 6
+    assert "Psalms 23 (1 verses): HTTP Error 503" in capsys.readouterr().out
+
+    # The next run starts from the journal and only asks for what is missing
+    verses_mod.CHAPTER_CACHE.clear()
+    UnreliableBolls.requests = []
+    UnreliableBolls.down = set()
+    assert verses_mod.main(argv) == 0
+    assert UnreliableBolls.requests == ["/get-text/WLC/19/23/"]
+    assert len(json.loads(output.read_text(encoding='utf-8'))["verses"]) == 4
+    assert not journal.exists()
@@ -0,0 +1,70 @@
+import json
+import os
+
+import pytest
+
+from hebrew_text import (
+    FINAL_FORMS,
+    PUNCTUATION,
+    consonants,
+    normalize_hebrew,
+    pronunciation_fields,
+    syllabify,
+    to_academic_transliteration,
+    to_simple_transliteration,
+)
+
+# What src/lib/hebrew.ts returns for every distinct lemma in the vocabulary;
+# kept in step with the TypeScript by src/__tests__/hebrewGolden.test.ts
+GOLDEN_PATH = os.path.join(os.path.dirname(__file__), 'data', 'hebrew-golden.json')
+
+@pytest.fixture(scope='module')
+def golden():
+    with open(GOLDEN_PATH, encoding='utf-8') as f:
+        return json.load(f)
+
+def test_matches_typescript_on_the_word_list(golden):
+    assert len(golden) > 7000
+    mismatched = [
+        hebrew for hebrew, expected in golden.items()
+        if [normalize_hebrew(hebrew), to_academic_transliteration(hebrew),
+            to_simple_transliteration(hebrew), list(syllabify(hebrew))] != expected
+    ]
+    assert mismatched == []
+
+def test_match_keys_agree_with_the_consonantal_form(golden):
+    # The verse and search indexes key on consonants(); vocabulary words store normalize_hebrew()
+    drop_punctuation = str.maketrans('', '', PUNCTUATION)
+    disagree = [
+        hebrew for hebrew in golden
+        if consonants(hebrew).translate(drop_punctuation) != normalize_hebrew(hebrew).translate(FINAL_FORMS)
+    ]
+    assert disagree == []
+    assert consonants("כָּל־הָאָֽרֶץ׃") == "כל־הארצ׃"
+
+@pytest.mark.parametrize("hebrew,academic,simple,syllables", [
+    ("אֱלֹהִים", "ʾĕlōhîm", "elohim", ["אֱ", "לֹ", "הִים"]),
+    # Marks are matched in the order they are written: a shin dot or dagesh
+    # after the vowel is not combined with its letter
+    ("שָׁלוֹם", "š/śā/olôm", "shalom", ["שָׁלוֹם"]),
+    ("בְּרִית", "b/vərît", "vrit", ["בְּרִית"]),
+    # Leading and trailing apostrophes are dropped from the simple form
+    ("עַע", "ʿaʿ", "a", ["עַע"]),
+    ("", "", "", [""]),
+])
+def test_quirks_are_kept(hebrew, academic, simple, syllables):
+    assert to_academic_transliteration(hebrew) == academic
+    assert to_simple_transliteration(hebrew) == simple
+    assert list(syllabify(hebrew)) == syllables
+
+def test_pronunciation_fields():
+    fields = pronunciation_fields("אֱלֹהִים")
+    assert fields == {
+        "consonantal": "אלהים",
+        "pronunciation": {
+            "academic": "ʾĕlōhîm",
+            "simple": "elohim",
+            "syllables": ["אֱ", "לֹ", "הִים"],
+            "syllablePronunciations": ["e", "lo", "him"],
+        },
+    }
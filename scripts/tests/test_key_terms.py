@@ -0,0 +1,81 @@
+import json
+
+from conftest import load_script
+from key_terms import GlossIndex, stem, term_tokens
+from test_osis_ingest import corpus  # noqa: F401 (fixture)
+from verse_index import VerseIndexBuilder
+
+WORDS = [
+    {"id": "H1254", "strongs": "H1254", "hebrew": "בָּרָא", "frequency": 54,
+     "gloss": "To create", "definition": "(absolutely) to create; choose, create (creator), cut down, make (fat)."},
+    {"id": "H7069", "strongs": "H7069", "hebrew": "קָנָה", "frequency": 85,
+     "gloss": "To erect", "definition": "to erect, i.e. create; by extension, to procure. attain, buy, get."},
+    {"id": "H430", "strongs": "H430", "hebrew": "אֱלֹהִים", "frequency": 2600,
+     "gloss": "Gods in the ordinary sense", "definition": "gods; specifically the supreme God. angels, [idiom] exceeding, God (gods), judges."},
+    {"id": "H426", "strongs": "H426", "hebrew": "אֱלָהּ", "frequency": 95,
+     "gloss": "God", "definition": "God. God, god."},
+    {"id": "H3068", "strongs": "H3068", "hebrew": "יְהוָה", "frequency": 6800,
+     "gloss": "Jehovah", "definition": "Jehovah, Jewish national name of God. Jehovah, the Lord."},
+    {"id": "H136", "strongs": "H136", "hebrew": "אֲדֹנָי", "frequency": 430,
+     "gloss": "The Lord", "definition": "the Lord (used as a proper name of God only). (my) Lord."},
+    {"id": "H7221", "strongs": "H7221", "hebrew": "רִאשָׁה", "frequency": 1,
+     "gloss": "A beginning", "definition": "a beginning. beginning."},
+    {"id": "H7225", "strongs": "H7225", "hebrew": "רֵאשִׁית", "frequency": 51,
+     "gloss": "The first", "definition": "the first, in place, time, order or rank. beginning, chief(-est), first(-fruits)."},
+]
+
+GEN_1_1 = "בְּרֵאשִׁ֖ית בָּרָ֣א אֱלֹהִ֑ים"
+
+def ids(words, positions):
+    return [words[p]["id"] for p in positions]
+
+def test_term_tokens():
+    assert stem("created") == stem("creates") == stem("create") == "creat"
+    assert stem("blessed") == stem("bless") == "bless"
+    assert term_tokens("To create") == ["creat"]
+    assert term_tokens("LORD God") == ["lord", "god"]
+    # Markers are dropped; a term of only stopwords keeps them
+    assert term_tokens("[idiom] at all") == ["all"]
+    assert term_tokens("be") == ["be"]
+
+def test_exact_gloss_ranks_first():
+    index = GlossIndex(WORDS)
+    assert index.resolve(["create", "created"]) == [["H1254", "H7069"], ["H1254", "H7069"]]
+    # Gloss hits on both tokens beat a definition hit on one
+    assert index.resolve(["LORD God"])[0][:2] == ["H136", "H430"]
+    assert index.resolve(["serpent"]) == [[]]
+
+def test_lemmas_in_the_verse_are_preferred():
+    index = GlossIndex(WORDS)
+    assert index.resolve(["beginning"])[0][0] == "H7221"
+    found = VerseIndexBuilder(WORDS).add("gen_1_1", GEN_1_1)
+    assert set(ids(WORDS, found)) == {"H7225", "H1254", "H430"}
+    assert index.resolve(["beginning", "God"], found) == [["H7225", "H7221"], ["H430", "H426", "H3068"]]
+
+def test_fetch_verses_writes_ids_next_to_terms(tmp_path, monkeypatch):
+    verses_mod = load_script("fetch-verses")
+    vocabulary = tmp_path / "vocabulary.json"
+    vocabulary.write_text(json.dumps({"words": WORDS}), encoding='utf-8')
+    monkeypatch.setattr(verses_mod, "CURATED_VERSES", [("gen", 1, 1, 1, ["beginning", "create", "God"], "")])
+    monkeypatch.setattr(verses_mod, "prefetch_chapters", lambda *a, **k: 1)
+    monkeypatch.setitem(verses_mod.CHAPTER_CACHE, verses_mod.chapter_key("gen", 1), {1: GEN_1_1})
+
+    output = tmp_path / "verses.json"
+    verses_mod.main(["--output", str(output), "--no-cache", "--vocabulary", str(vocabulary), "--no-index",
+                    "--no-difficulty", "--journal", str(tmp_path / "journal")])
+    verse = json.loads(output.read_text(encoding='utf-8'))["verses"][0]
+    assert verse["keyTerms"] == ["beginning", "create", "God"]
+    assert [terms[0] for terms in verse["keyTermIds"]] == ["H7225", "H1254", "H430"]
+    assert not (tmp_path / "word-verses.json").exists()
+
+def test_osis_ingest_resolves_curated_terms(tmp_path, corpus):
+    verses_mod = load_script("fetch-verses")
+    out_dir = tmp_path / "out"
+    selections = [("gen", 1, 1, 1, ["God", "beginning"], "")]
+    verses_mod.ingest_osis(str(corpus), str(out_dir), "ndjson", selections, None,
+                           VerseIndexBuilder(WORDS), GlossIndex(WORDS))
+    lines = (out_dir / "verses.ndjson").read_text(encoding='utf-8').splitlines()
+    first, second = json.loads(lines[0]), json.loads(lines[1])
+    assert [terms[0] for terms in first["keyTermIds"]] == ["H430", "H7225"]
+    # Verses without curated terms get no ids
+    assert "keyTermIds" not in second
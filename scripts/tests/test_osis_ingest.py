@@ -0,0 +1,120 @@
+import json
+import tracemalloc
+
+import pytest
+
+from conftest import load_script
+from osis_corpus import iter_osis_verses, lemma_strongs
+
+verses_mod = load_script('fetch-verses')
+
+OSIS_HEADER = '<?xml version="1.0" encoding="UTF-8"?>\n<osis xmlns="http://www.bibletechnologies.net/2003/OSIS/namespace"><osisText>'
+OSIS_FOOTER = '</osisText></osis>\n'
+
+GEN_1_1 = (
+    '<verse osisID="Gen.1.1">'
+    '<w lemma="b/7225" morph="HR/Ncfsa">בְּ/רֵאשִׁ֖ית</w> '
+    '<w lemma="1254 a" morph="HVqp3ms">בָּרָ֣א</w> '
+    '<w lemma="430" morph="HNcmpa">אֱלֹהִ֑ים</w> '
+    '<note type="variant"><rdg><w lemma="9999">שגיאה</w></rdg></note>'
+    '<w lemma="853" morph="HTo">אֵ֥ת</w>'
+    '<seg type="x-maqqef">־</seg>'
+    '<w lemma="d/8064" morph="HTd/Ncmpa">הַ/שָּׁמַ֖יִם</w>'
+    '<seg type="x-sof-pasuq">׃</seg>'
+    '</verse>'
+)
+
+def book_xml(osis_book: str, chapters: int, verses: int, milestones: bool = False) -> str:
+    parts = [f'<div type="book" osisID="{osis_book}">']
+    for c in range(1, chapters + 1):
+        parts.append(f'<chapter osisID="{osis_book}.{c}">')
+        for v in range(1, verses + 1):
+            ref = f"{osis_book}.{c}.{v}"
+            words = f'<w lemma="l/{c}" morph="HR">לְ/דָוִד</w> <w lemma="{v}">מִזְמוֹר</w><seg type="x-sof-pasuq">׃</seg>'
+            if milestones:
+                parts.append(f'<verse sID="{ref}" osisID="{ref}"/>{words}<verse eID="{ref}"/>')
+            else:
+                parts.append(f'<verse osisID="{ref}">{words}</verse>')
+        parts.append('</chapter>')
+    parts.append('</div>')
+    return "".join(parts)
+
+@pytest.fixture
+def corpus(tmp_path):
+    source = tmp_path / 'wlc'
+    source.mkdir()
+    gen = book_xml("Gen", 2, 3).replace(
+        '<verse osisID="Gen.1.1"><w lemma="l/1" morph="HR">לְ/דָוִד</w> <w lemma="1">מִזְמוֹר</w><seg type="x-sof-pasuq">׃</seg></verse>',
+        GEN_1_1,
+    )
+    (source / 'Gen.xml').write_text(OSIS_HEADER + gen + OSIS_FOOTER, encoding='utf-8')
+    (source / 'Ps.xml').write_text(OSIS_HEADER + book_xml("Ps", 23, 6, milestones=True) + OSIS_FOOTER, encoding='utf-8')
+    (source / 'Exod.xml').write_text(OSIS_HEADER + book_xml("Exod", 1, 2) + OSIS_FOOTER, encoding='utf-8')
+    return source
+
+def test_reads_container_and_milestone_verses(corpus):
+    verses = list(iter_osis_verses(str(corpus)))
+    # Canonical order regardless of directory listing
+    assert [v.book for v in verses][:7] == ["gen"] * 6 + ["exod"]
+    assert len(verses) == 6 + 2 + 23 * 6
+
+    first = verses[0]
+    assert (first.book, first.chapter, first.verse) == ("gen", 1, 1)
+    assert first.text == "בְּרֵאשִׁ֖ית בָּרָ֣א אֱלֹהִ֑ים אֵ֥ת־הַשָּׁמַ֖יִם׃"
+    assert [w.lemma for w in first.words] == ["b/7225", "1254 a", "430", "853", "d/8064"]
+    assert lemma_strongs("c/d/1254 a") == ["H1254"]
+
+    ps = [v for v in verses if v.book == "ps"]
+    assert (ps[-1].chapter, ps[-1].verse, ps[-1].text) == (23, 6, "לְדָוִד מִזְמוֹר׃")
+
+@pytest.mark.parametrize("fmt", ["books", "ndjson"])
+def test_ingest_joins_curated_metadata(corpus, tmp_path, fmt):
+    out_dir = tmp_path / 'out'
+    selections = [
+        ("gen", 1, 1, 1, ["beginning", "create"], "Opening verse."),
+        ("ps", 23, 1, 1, ["shepherd"], "Shepherd psalm."),
+        ("mal", 3, 1, 2, [], "Not in this corpus."),
+    ]
+    verses_mod.ingest_osis(str(corpus), str(out_dir), fmt, selections)
+
+    index = json.loads((out_dir / 'index.json').read_text(encoding='utf-8'))
+    assert index["format"] == fmt and index["totalVerses"] == 6 + 2 + 23 * 6
+    assert [(b["id"], b["chapters"], b["verses"]) for b in index["books"]] == [("gen", 2, 6), ("exod", 1, 2), ("ps", 23, 138)]
+
+    if fmt == "books":
+        verses = [v for b in index["books"] for v in json.loads((out_dir / b["file"]).read_text(encoding='utf-8'))]
+    else:
+        verses = [json.loads(line) for line in (out_dir / 'verses.ndjson').read_text(encoding='utf-8').splitlines()]
+    by_id = {v["id"]: v for v in verses}
+    assert by_id["gen_1_1"]["keyTerms"] == ["beginning", "create"]
+    assert by_id["gen_1_1"]["notes"] == "Opening verse."
+    assert by_id["ps_23_1"]["reference"] == "Psalms 23:1"
+    assert by_id["gen_1_2"]["difficulty"] == verses_mod.DEFAULT_DIFFICULTY
+    # Same record shape as the curated verses fetched from the API
+    assert by_id["gen_1_2"]["notes"] == ""
+    assert all(list(v) == list(by_id["gen_1_1"]) for v in verses)
+
+def test_failed_ingest_keeps_previous_output(corpus, tmp_path):
+    out_dir = tmp_path / 'out'
+    verses_mod.ingest_osis(str(corpus), str(out_dir), "books", [])
+    before = {p.name: p.read_bytes() for p in out_dir.iterdir()}
+
+    (corpus / 'Exod.xml').write_text(OSIS_HEADER + '<verse osisID="Exod.1.1"><w>broken', encoding='utf-8')
+    with pytest.raises(Exception):
+        verses_mod.ingest_osis(str(corpus), str(out_dir), "books", [])
+    assert {p.name: p.read_bytes() for p in out_dir.iterdir()} == before
+
+def test_memory_does_not_grow_with_corpus(tmp_path):
+    def peak(chapters: int) -> int:
+        path = tmp_path / f'Ps{chapters}.xml'
+        path.write_text(OSIS_HEADER + book_xml("Ps", chapters, 20) + OSIS_FOOTER, encoding='utf-8')
+        tracemalloc.start()
+        try:
+            for _ in iter_osis_verses(str(path)):
+                pass
+            return tracemalloc.get_traced_memory()[1]
+        finally:
+            tracemalloc.stop()
+
+    small, large = peak(50), peak(1000)
+    assert large < small * 1.5
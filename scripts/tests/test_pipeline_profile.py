@@ -0,0 +1,82 @@
+import json
+import time
+
+from conftest import load_script
+from pipeline_profile import LatencyHistogram, Profiler
+from test_chapter_fetcher import server  # noqa: F401 (fixture)
+from test_strongs_stream import ENTRIES, dictionary_js
+
+def test_nested_stages_report_self_time():
+    profiler = Profiler("test")
+    with profiler:
+        with profiler.stage("outer"):
+            time.sleep(0.02)
+            with profiler.stage("inner"):
+                time.sleep(0.03)
+    outer, inner = profiler.stages["outer"], profiler.stages["inner"]
+    assert outer["wall"] >= 0.05 and inner["wall"] >= 0.03
+    assert abs(outer["selfWall"] - (outer["wall"] - inner["wall"])) < 1e-9
+    assert profiler.run_wall >= outer["wall"]
+
+def test_timed_iter_counts_each_item():
+    profiler = Profiler("test")
+    with profiler:
+        assert list(profiler.timed_iter(range(5), "produce")) == [0, 1, 2, 3, 4]
+    # One call per item plus the final StopIteration
+    assert profiler.stages["produce"]["calls"] == 6
+
+def test_peak_memory_is_attributed_to_stages():
+    profiler = Profiler("test", trace_memory=True)
+    with profiler:
+        with profiler.stage("small"):
+            b"x" * 1024
+        with profiler.stage("large"):
+            data = bytearray(8 * 1024 * 1024)
+            del data
+    assert profiler.stages["large"]["peakBytes"] >= 8 * 1024 * 1024
+    assert profiler.stages["small"]["peakBytes"] < 8 * 1024 * 1024
+    assert profiler.peak_bytes >= profiler.stages["large"]["peakBytes"]
+
+def test_histogram_percentiles_and_buckets():
+    histogram = LatencyHistogram()
+    for ms in range(1, 101):
+        histogram.observe(ms / 1000)
+    h = histogram.to_dict()
+    assert (h["count"], h["p50Ms"], h["p90Ms"], h["p99Ms"], h["maxMs"]) == (100, 50, 90, 99, 100)
+    assert sum(b["count"] for b in h["buckets"]) == 100
+    assert h["buckets"][0] == {"leMs": 5, "count": 5}
+
+def test_vocabulary_stream_is_split_into_fetch_and_parse(tmp_path, monkeypatch):
+    vocab = load_script('fetch-vocabulary')
+    source = tmp_path / 'strongs.js'
+    source.write_text(dictionary_js(ENTRIES), encoding='utf-8')
+    monkeypatch.setattr(vocab, 'OPENSCRIPTURES_URL', source.as_uri())
+
+    profiler = Profiler("fetch-vocabulary")
+    with profiler:
+        with profiler.stage("transform"):
+            words = vocab.transform_to_app_format(vocab.fetch_openscriptures_data(profiler), profiler=profiler)
+    assert len(words) == len(ENTRIES)
+    assert set(profiler.stages) == {"transform", "fetch", "parse", "sort"}
+    assert profiler.stages["parse"]["calls"] == len(ENTRIES) + 1
+
+def test_verses_run_report(server, tmp_path):
+    verses_mod = load_script('fetch-verses')
+    verses_mod.CHAPTER_CACHE.clear()
+    report_path = tmp_path / 'report.json'
+    profile_path = tmp_path / 'run.prof'
+    verses_mod.main([
+        "--output", str(tmp_path / 'verses.json'), "--api-base", server, "--rate", "0", "--no-cache",
+        "--report", str(report_path), "--profile", str(profile_path), "--trace-memory",
+        "--index", str(tmp_path / 'word-verses.json'), "--journal", str(tmp_path / 'journal'),
+        "--difficulty", str(tmp_path / 'verse-difficulty.json'),
+    ])
+
+    report = json.loads(report_path.read_text())
+    chapters = len({(v[0], v[1]) for v in verses_mod.CURATED_VERSES})
+    assert report["script"] == "fetch-verses"
+    assert report["histograms"]["chapterFetch"]["count"] == chapters
+    assert report["counters"]["chaptersRequested"] == chapters
+    assert {"fetch", "transform", "serialize", "write", "index", "difficulty"} <= set(report["stages"])
+    assert report["peakBytes"] > 0
+    assert profile_path.stat().st_size > 0
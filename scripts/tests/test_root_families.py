@@ -0,0 +1,58 @@
+import json
+
+from conftest import load_script, synthetic_entries
+from root_families import FamilyBuilder, UnionFind, derivation_link
+
+vocab = load_script('fetch-vocabulary')
+
+def test_derivation_links():
+    assert derivation_link("from H1254") == "H1254"
+    assert derivation_link("(Aramaic) corresponding to H2706") == "H2706"
+    assert derivation_link("the same as H0003") == "H3"
+    assert derivation_link("from H1 and H3050") == "H1"
+    assert derivation_link("from an unused root (compare H7200)") is None
+    assert derivation_link("a primitive root; compare H1254") is None
+    assert derivation_link("a primitive root") is None
+    assert derivation_link("") is None
+
+def test_union_find():
+    sets = UnionFind()
+    for a, b in [("a", "b"), ("c", "d"), ("b", "d"), ("e", "e")]:
+        sets.union(a, b)
+    assert len({sets.find(k) for k in "abcd"}) == 1
+    assert sets.find("e") != sets.find("a")
+    assert sets.size[sets.find("a")] == 4
+
+def test_families_group_linked_words(tmp_path):
+    words = [{"id": f"H{n}"} for n in (1, 2, 3, 4, 5, 6)]
+    builder = FamilyBuilder()
+    builder.add("H2", {"derivation": "from H1"})
+    builder.add("H3", {"derivation": "(Aramaic) corresponding to H2"})
+    builder.add("H4", {"derivation": "a primitive root"})
+    # Linked through a word that is not in the vocabulary
+    builder.add("H5", {"derivation": "from H900"})
+    builder.add("H6", {"derivation": "from H900 and H1"})
+
+    path = tmp_path / "root-families.json"
+    data = builder.write(words, str(path))
+    assert json.loads(path.read_text(encoding='utf-8')) == data
+    assert data["families"] == [[0, 1, 2], [4, 5]]
+    assert data["family"] == [0, 0, 0, -1, 1, 1]
+    assert builder.links == 4
+
+def test_transform_collects_links_from_reused_entries_too(tmp_path):
+    entries = synthetic_entries(40)[:-1]
+    manifest_path = str(tmp_path / 'manifest.json')
+    fingerprint = vocab.heuristics_fingerprint()
+
+    first = vocab.BuildManifest(manifest_path, fingerprint)
+    cold = FamilyBuilder()
+    words = vocab.transform_records(iter(entries), manifest=first, families=cold)
+    first.save()
+
+    second = vocab.BuildManifest(manifest_path, fingerprint, [w.to_dict() for w in words])
+    warm = FamilyBuilder()
+    again = vocab.transform_records(iter(entries), manifest=second, families=warm)
+    assert second.rebuilt == 0
+    assert warm.to_dict(again) == cold.to_dict(words)
+    assert cold.to_dict(words)["families"]
@@ -0,0 +1,114 @@
+import json
+import random
+
+import pytest
+
+from conftest import VOCABULARY_PATH
+from hebrew_text import consonants
+from key_terms import STOPWORDS
+from search_index import (
+    GRAM,
+    HEAD_SIZE,
+    SearchIndex,
+    build_search_index,
+    english_tokens,
+    fold_latin,
+    hebrew_keys,
+    top_union,
+    transliteration_keys,
+    write_search_index,
+)
+from verse_index import WORD_RE
+
+WORDS = [
+    {"id": "H7965", "strongs": "H7965", "hebrew": "שָׁלוֹם", "transliteration": "shâlôwm", "frequency": 237,
+     "gloss": "Safe", "definition": "safe, i.e. well, happy, friendly; abstractly, welfare, i.e. health, peace"},
+    {"id": "H7999", "strongs": "H7999", "hebrew": "שָׁלַם", "transliteration": "shâlam", "frequency": 116,
+     "gloss": "To be safe", "definition": "to be safe (in mind, body or estate); to make amends, finish, repay"},
+    {"id": "H1254", "strongs": "H1254", "hebrew": "בָּרָא", "transliteration": "bârâʼ", "frequency": 54,
+     "gloss": "To create", "definition": "to create; choose, make (fat)"},
+    {"id": "H1035", "strongs": "H1035", "hebrew": "בֵּית לֶחֶם", "transliteration": "Bêyth Lechem", "frequency": 41,
+     "gloss": "Beth-Lechem", "definition": "house of bread; a place in Palestine"},
+    {"id": "H1004", "strongs": "H1004", "hebrew": "בַּיִת", "transliteration": "bayith", "frequency": 2000,
+     "gloss": "A house", "definition": "a house (in the greatest variation of applications, especially family, etc.)"},
+    {"id": "H3899", "strongs": "H3899", "hebrew": "לֶחֶם", "transliteration": "lechem", "frequency": 297,
+     "gloss": "Food", "definition": "food (for man or beast), especially bread, or grain"},
+]
+
+def test_keys():
+    assert hebrew_keys("בֵּית לֶחֶם") == {"בית", "לחמ", "ביתלחמ"}
+    assert fold_latin("ʼĕlôhîym  Yâh") == "elohiym yah"
+    assert transliteration_keys(WORDS[3]) >= {"beythlechem", "beyth", "lechem"}
+    assert english_tokens("[idiom] to be safe (in mind)") == {"safe", "mind"}
+
+def test_top_union():
+    postings = [[5, 9], [1, 7, 30], [], [2, 3, 4, 40]]
+    assert top_union(postings, 4) == [1, 2, 3, 4]
+    assert top_union(postings, 100) == [1, 2, 3, 4, 5, 7, 9, 30, 40]
+
+@pytest.mark.parametrize("query,expected", [
+    # Hebrew prefixes, with or without points and final letters
+    ("שָׁל", ["H7965", "H7999"]),
+    ("שלם", ["H7999"]),
+    ("שלום", ["H7965"]),
+    ("לחם", ["H3899", "H1035"]),
+    ("בית ל", ["H1035"]),
+    # Transliteration prefixes, then gloss hits, in frequency order
+    ("shal", ["H7965", "H7999"]),
+    ("lech", ["H3899", "H1035"]),
+    # English substrings: gloss hits first, then definition-only hits
+    ("safe", ["H7965", "H7999"]),
+    ("house", ["H1004", "H1035"]),
+    ("bread", ["H3899", "H1035"]),
+    ("rea", ["H1254", "H1004", "H3899", "H1035"]),
+    ("house bread", ["H1035"]),
+    # Short fragments match the start of a token; stopwords are not indexed
+    ("sa", ["H7965", "H7999"]),
+    ("to", []),
+    ("zzz", []),
+])
+def test_search(query, expected):
+    assert SearchIndex(build_search_index(WORDS)).search(query) == expected
+
+def naive_search(words: list[dict], query: str, limit: int) -> list[str]:
+    """A linear scan with the same matching rules, for checking the index."""
+    ranked = sorted(words, key=lambda w: (-w["frequency"], int(w["strongs"][1:])))
+    key = "".join(WORD_RE.findall(consonants(query)))
+    if key:
+        hits = [w for w in ranked if any(k.startswith(key) for k in hebrew_keys(w["hebrew"]))]
+        return [w["id"] for w in hits[:limit]]
+    query = fold_latin(query)
+    fragments = [f for f in query.split() if f not in STOPWORDS] or query.split()
+
+    def found(fragment: str, tokens: set[str]) -> bool:
+        # Fragments shorter than a trigram only match the start of a token
+        return any(t.startswith(fragment) if len(fragment) < GRAM else fragment in t for t in tokens)
+
+    first, second = [], []
+    for w in ranked:
+        gloss, definition = english_tokens(w["gloss"]), english_tokens(w["definition"])
+        if (any(k.startswith(query.replace(" ", "")) for k in transliteration_keys(w))
+                or all(found(f, gloss) for f in fragments)):
+            first.append(w["id"])
+        elif all(found(f, gloss | definition) for f in fragments):
+            second.append(w["id"])
+    return (first + second)[:limit]
+
+def test_matches_a_linear_scan_on_the_vocabulary(tmp_path):
+    with open(VOCABULARY_PATH, encoding='utf-8') as f:
+        words = json.load(f)["words"]
+    path = tmp_path / 'search-index.json'
+    write_search_index(words, str(path))
+    index = SearchIndex(json.loads(path.read_text(encoding='utf-8')))
+
+    rng = random.Random(0)
+    queries = ["a", "ש", "s", "sh", "son of", "lord god", "בית"]
+    for word in rng.sample(words, 40):
+        queries.append(word["hebrew"][:rng.randint(1, 4)])
+        queries.append(fold_latin(word["transliteration"])[:rng.randint(1, 5)])
+        queries.append(word["gloss"].lower()[:rng.randint(1, 6)])
+    for query in queries:
+        expected = naive_search(words, query, HEAD_SIZE)
+        assert index.search(query) == expected, query
+        # Past the stored heads, the postings themselves are merged
+        assert index.search(query, HEAD_SIZE + 10)[:HEAD_SIZE] == expected, query
@@ -0,0 +1,55 @@
+import io
+import json
+import re
+
+import pytest
+
+from strongs_stream import iter_strongs_dictionary
+
+def legacy_parse(content: str) -> dict:
+    """The whole-file regex + json.loads parse the streaming parser replaced."""
+    match = re.search(r'var\s+strongsHebrewDictionary\s*=\s*(\{.*?\});\s*(?:module\.exports|$)', content, re.DOTALL)
+    json_str = re.sub(r',\s*}', '}', match.group(1))
+    json_str = re.sub(r',\s*]', ']', json_str)
+    return json.loads(json_str)
+
+ENTRIES = {
+    "H1": {"lemma": "אָב", "xlit": "ʼâb", "strongs_def": "father, in a literal {and} immediate sense", "kjv_def": "chief, (fore-) father(-less)"},
+    "H2": {"lemma": "אַב", "xlit": "ʼab", "derivation": "(Aramaic) corresponding to {H1}", "strongs_def": "a \"quoted\" } brace"},
+    "H1254": {"lemma": "בָּרָא", "derivation": "a primitive root;", "strongs_def": "to create", "kjv_def": "choose, create (creator)"},
+}
+
+def dictionary_js(entries: dict, trailing_commas: bool = False) -> str:
+    lines = []
+    for key, entry in entries.items():
+        body = json.dumps(entry, ensure_ascii=False)
+        if trailing_commas:
+            body = body[:-1] + ',}'
+        lines.append(f'"{key}":{body}')
+    tail = ',' if trailing_commas else ''
+    return (
+        "/**\n * Strong's Hebrew Dictionary\n */\n"
+        "var strongsHebrewDictionary = {" + ",\n".join(lines) + tail + "};\n"
+        "module.exports = strongsHebrewDictionary;\n"
+    )
+
+@pytest.mark.parametrize("chunk_size", [1, 7, 64, 65536])
+@pytest.mark.parametrize("trailing_commas", [False, True])
+def test_matches_legacy_parse(chunk_size, trailing_commas):
+    content = dictionary_js(ENTRIES, trailing_commas)
+    stream = io.BytesIO(content.encode('utf-8'))
+
+    streamed = list(iter_strongs_dictionary(stream, chunk_size))
+
+    assert dict(streamed) == legacy_parse(content)
+    assert [k for k, _ in streamed] == list(ENTRIES)
+
+def test_accepts_text_streams():
+    content = dictionary_js(ENTRIES)
+    assert dict(iter_strongs_dictionary(io.StringIO(content), 5)) == ENTRIES
+
+def test_rejects_unrecognised_input():
+    with pytest.raises(ValueError):
+        list(iter_strongs_dictionary(io.BytesIO(b"module.exports = {};")))
+    with pytest.raises(ValueError):
+        list(iter_strongs_dictionary(io.BytesIO(b'var strongsHebrewDictionary = {"H1":{"lemma":"x"')))
@@ -0,0 +1,73 @@
+import json
+
+from conftest import load_script, synthetic_entries
+
+vocab = load_script('fetch-vocabulary')
+
+def test_parallel_output_is_byte_identical():
+    entries = synthetic_entries(1200)
+
+    serial = vocab.transform_to_app_format(iter(entries))
+    parallel = vocab.transform_to_app_format(iter(entries), jobs=3, chunk_size=97)
+
+    dump = lambda words: json.dumps({"words": words}, ensure_ascii=False, indent=2)
+    assert dump(parallel) == dump(serial)
+    assert next(w for w in serial if w["id"] == "H9000")["definition"] == "replacement"
+    assert all(w["id"].startswith("H") for w in serial)
+
+def test_dict_input_matches_stream_input():
+    entries = synthetic_entries(20)[:-2]
+    assert vocab.transform_to_app_format(dict(entries)) == vocab.transform_to_app_format(iter(entries))
+
+def test_incremental_rebuild_reuses_unchanged_words(tmp_path, monkeypatch):
+    entries = synthetic_entries(300)[:-2]
+    manifest_path = str(tmp_path / 'manifest.json')
+    fingerprint = vocab.heuristics_fingerprint()
+
+    first = vocab.BuildManifest(manifest_path, fingerprint)
+    previous = vocab.transform_to_app_format(iter(entries), manifest=first)
+    first.save()
+    assert (first.reused, first.rebuilt) == (0, len(previous))
+
+    monkeypatch.setitem(vocab.FREQUENCY_DATA, "H9001", 777)
+    second = vocab.BuildManifest(manifest_path, fingerprint, previous)
+    incremental = vocab.transform_to_app_format(iter(entries), jobs=2, chunk_size=16, manifest=second)
+
+    assert (second.reused, second.rebuilt) == (len(previous) - 1, 1)
+    assert incremental == vocab.transform_to_app_format(iter(entries))
+    assert next(w for w in incremental if w["id"] == "H9001")["tier"] == 1
+    assert second.changed == {"H9001"}
+    second.save()
+    # Reused words keep their recorded hashes
+    with open(manifest_path, encoding='utf-8') as f:
+        recorded = json.load(f)["entries"]
+    assert all(recorded[w["id"]]["word"] == vocab.digest(w) for w in incremental)
+
+def test_heuristics_change_forces_full_rebuild(tmp_path):
+    entries = synthetic_entries(10)[:-2]
+    manifest_path = str(tmp_path / 'manifest.json')
+    first = vocab.BuildManifest(manifest_path, "old")
+    previous = vocab.transform_to_app_format(iter(entries), manifest=first)
+    first.save()
+
+    second = vocab.BuildManifest(manifest_path, "new", previous)
+    vocab.transform_to_app_format(iter(entries), manifest=second)
+    assert second.reused == 0
+
+def test_shards_cover_every_word(tmp_path):
+    import vocab_shards
+
+    words = vocab.transform_to_app_format(iter(synthetic_entries(40)))
+    (tmp_path / "tier-9.core.json").write_text("[]")
+    index = vocab_shards.write_shards(words, str(tmp_path))
+
+    rebuilt = []
+    for shard in index["tiers"]:
+        core = json.loads((tmp_path / shard["core"]["file"]).read_text(encoding='utf-8'))
+        details = json.loads((tmp_path / shard["details"]["file"]).read_text(encoding='utf-8'))
+        rebuilt += [{**c, **details[c["id"]]} for c in core]
+
+    canonical = lambda ws: sorted(json.dumps(w, sort_keys=True) for w in ws)
+    assert canonical(rebuilt) == canonical(words)
+    assert index["totalWords"] == len(words)
+    assert not (tmp_path / "tier-9.core.json").exists()
@@ -0,0 +1,92 @@
+import json
+import math
+
+import pytest
+
+from conftest import VERSES_PATH, VOCABULARY_PATH
+import verse_difficulty
+from verse_difficulty import DifficultyBuilder
+from verse_index import load_words
+
+WORDS = [
+    {"id": "H430", "hebrew": "אֱלֹהִים", "strongs": "H430", "frequency": 2600, "tier": 1},
+    {"id": "H1254", "hebrew": "בָּרָא", "strongs": "H1254", "frequency": 54, "tier": 4},
+    {"id": "H7225", "hebrew": "רֵאשִׁית", "strongs": "H7225", "frequency": 51, "tier": 4},
+    {"id": "H8414", "hebrew": "תֹּהוּ", "strongs": "H8414", "frequency": 20, "tier": 5},
+    {"id": "H922", "hebrew": "בֹּהוּ", "strongs": "H922", "frequency": 1, "tier": 5},
+]
+
+def test_features_of_a_small_corpus():
+    builder = DifficultyBuilder(WORDS)
+    builder.add("gen_1_1", "בְּרֵאשִׁ֖ית בָּרָ֣א אֱלֹהִ֑ים")
+    builder.add("gen_1_2", "תֹ֙הוּ֙ וָבֹ֔הוּ שָׁלוֹם")
+    builder.add("empty", "")
+    data = builder.to_dict()
+
+    assert data["tiers"] == [1, 4, 5]
+    assert data["tokens"] == [3, 3, 0]
+    # Unknown tokens (שלום) are rare and never known
+    assert data["rareRatio"] == [0.0, 1.0, 0.0]
+    # Not a whole corpus: the hapax column is left out of the scores
+    assert data["hapax"] is None
+    assert data["knownAtTier"] == [[33, 100, 100], [0, 0, 67], [0, 0, 0]]
+    expected = (math.log1p(20) + math.log1p(1)) / 3
+    assert data["meanLogFrequency"][1] == round(expected, 3)
+    assert data["score"][0] < data["score"][1]
+    assert data["score"][2] == 0.0
+    assert data["level"] == [verse_difficulty.level(s) for s in data["score"]]
+
+def test_hapaxes_are_counted_over_a_whole_corpus():
+    verses = {"gen_1_1": "בְּרֵאשִׁ֖ית בָּרָ֣א אֱלֹהִ֑ים", "gen_1_2": "תֹ֙הוּ֙ וָבֹ֔הוּ שָׁלוֹם", "gen_1_3": "אֱלֹהִים"}
+    corpus, selection = DifficultyBuilder(WORDS, corpus=True), DifficultyBuilder(WORDS)
+    for verse_id, hebrew in verses.items():
+        corpus.add(verse_id, hebrew)
+        selection.add(verse_id, hebrew)
+    data = corpus.to_dict()
+
+    # אלהים occurs twice and שלום is unknown; every other lemma occurs once
+    assert data["hapax"] == [2, 2, 0]
+    scores = selection.to_dict()["score"]
+    assert data["score"][0] > scores[0] and data["score"][1] > scores[1]
+    assert data["score"][2] == scores[2]
+
+@pytest.mark.parametrize("corpus", [False, True])
+def test_numpy_matches_the_plain_loop(corpus, monkeypatch):
+    pytest.importorskip("numpy")
+    words = load_words(VOCABULARY_PATH)
+    with open(VERSES_PATH, encoding='utf-8') as f:
+        verses = json.load(f)["verses"]
+    builder = DifficultyBuilder(words, corpus=corpus)
+    for verse in verses:
+        builder.add(verse["id"], verse["hebrew"])
+    # Verses with no tokens, or only unknown ones
+    builder.add("empty", "")
+    builder.add("unknown", "קקקק קקקק")
+    with_numpy = builder.features()
+    monkeypatch.setattr(verse_difficulty, "np", None)
+    assert builder.features() == with_numpy
+
+def test_nothing_to_score(monkeypatch):
+    pytest.importorskip("numpy")
+    builder = DifficultyBuilder(WORDS, corpus=True)
+    with_numpy = builder.features()
+    monkeypatch.setattr(verse_difficulty, "np", None)
+    assert builder.features() == with_numpy
+    assert with_numpy["score"] == [] and with_numpy["hapax"] == []
+
+def test_curated_verses_get_consistent_scores(tmp_path):
+    words = load_words(VOCABULARY_PATH)
+    with open(VERSES_PATH, encoding='utf-8') as f:
+        verses = json.load(f)["verses"]
+    builder = DifficultyBuilder(words)
+    for verse in verses:
+        builder.add(verse["id"], verse["hebrew"])
+    path = tmp_path / "verse-difficulty.json"
+    data = builder.write(str(path))
+
+    assert json.loads(path.read_text(encoding='utf-8')) == data
+    assert data["verses"] == [v["id"] for v in verses]
+    assert all(0 <= s <= 1 for s in data["score"])
+    # A learner who knows more tiers knows at least as many words
+    assert all(shares == sorted(shares) for shares in data["knownAtTier"])
+    assert all(len(shares) == len(data["tiers"]) for shares in data["knownAtTier"])
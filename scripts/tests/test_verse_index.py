@@ -0,0 +1,60 @@
+import json
+
+import pytest
+
+from hebrew_text import consonants
+from verse_index import LemmaMatcher, VerseIndexBuilder, tokenize
+
+WORDS = [
+    {"id": "H1004", "strongs": "H1004", "hebrew": "בַּיִת", "frequency": 2000},
+    {"id": "H430", "strongs": "H430", "hebrew": "אֱלֹהִים", "frequency": 2600},
+    {"id": "H776", "strongs": "H776", "hebrew": "אֶרֶץ", "frequency": 2500},
+    {"id": "H8064", "strongs": "H8064", "hebrew": "שָׁמַיִם", "frequency": 420},
+    {"id": "H1254", "strongs": "H1254", "hebrew": "בָּרָא", "frequency": 54},
+    {"id": "H7225", "strongs": "H7225", "hebrew": "רֵאשִׁית", "frequency": 51},
+    {"id": "H853", "strongs": "H853", "hebrew": "אֵת", "frequency": 11000},
+    {"id": "H854", "strongs": "H854", "hebrew": "אֵת", "frequency": 890},
+    {"id": "H6440", "strongs": "H6440", "hebrew": "פָּנִים", "frequency": 2100},
+    {"id": "H6434", "strongs": "H6434", "hebrew": "פֵּן", "frequency": 1},
+    {"id": "H1035", "strongs": "H1035", "hebrew": "בֵּית לֶחֶם", "frequency": 41},
+]
+
+def test_strips_points_and_cantillation():
+    assert consonants("הָאָֽרֶץ׃") == "הארצ׃"
+    assert tokenize("בְּרֵאשִׁ֖ית בָּרָ֣א אֱלֹהִ֑ים אֵ֥ת־הַשָּׁמַ֖יִם׃") == ["בראשית", "ברא", "אלהימ", "את", "השמימ"]
+
+@pytest.mark.parametrize("token,expected", [
+    ("בראשית", "H7225"),   # not ב + ראשית + nothing else; exact match wins
+    ("השמימ", "H8064"),    # article
+    ("והארצ", "H776"),     # conjunction + article
+    ("ובבית", "H1004"),    # conjunction + preposition
+    ("ביתו", "H1004"),     # pronominal suffix
+    ("ואת", "H853"),       # homographs resolve to the most frequent
+    ("פני", None),         # no suffix on a two-letter stem (פן + י)
+    ("לחמ", None),         # multi-word lemmas are not indexed
+])
+def test_matcher(token, expected):
+    matcher = LemmaMatcher(WORDS)
+    pos = matcher.match(consonants(token))
+    assert (WORDS[pos]["id"] if pos is not None else None) == expected
+
+def test_postings_in_both_directions(tmp_path):
+    builder = VerseIndexBuilder(WORDS)
+    builder.add("gen_1_1", "בְּרֵאשִׁ֖ית בָּרָ֣א אֱלֹהִ֑ים אֵ֥ת הַשָּׁמַ֖יִם וְאֵ֥ת הָאָֽרֶץ׃")
+    builder.add("gen_1_2", "וְהָאָ֗רֶץ הָיְתָ֥ה תֹ֙הוּ֙")
+    builder.add("ps_23_6", "וְשַׁבְתִּ֥י בְּבֵית־יְ֝הוָ֗ה")
+    path = tmp_path / 'index.json'
+    builder.write(str(path))
+    index = json.loads(path.read_text(encoding='utf-8'))
+
+    words, verses = index["words"], index["verses"]
+    assert verses == ["gen_1_1", "gen_1_2", "ps_23_6"]
+    word_verses = {words[i]: [verses[v] for v in vs] for i, vs in enumerate(index["wordVerses"])}
+    assert word_verses["H776"] == ["gen_1_1", "gen_1_2"]
+    assert word_verses["H1004"] == ["ps_23_6"]
+    assert "H6434" not in word_verses
+    # The reverse postings agree with the forward ones
+    for v, word_positions in enumerate(index["verseWords"]):
+        for w in word_positions:
+            assert v in index["wordVerses"][w]
+    assert sum(map(len, index["verseWords"])) == sum(map(len, index["wordVerses"]))
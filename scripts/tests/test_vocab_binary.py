@@ -0,0 +1,76 @@
+import json
+import os
+
+import pytest
+
+from conftest import VOCABULARY_PATH, load_script, synthetic_entries
+from hebrew_text import pronunciation_fields
+from vocab_binary import FLAG_PRONUNCIATION, FORMAT_VERSION, VocabularyFile, WordRecord, write_binary
+
+@pytest.fixture(scope="module")
+def words():
+    with open(VOCABULARY_PATH, encoding='utf-8') as f:
+        return json.load(f)["words"]
+
+def test_round_trip_matches_vocabulary_json(tmp_path, words):
+    path = str(tmp_path / "vocabulary.bin")
+    size = write_binary(words, path)
+
+    with VocabularyFile(path) as vocab:
+        assert len(vocab) == len(words)
+        decoded = [record.to_dict() for record in vocab]
+
+    assert json.dumps(decoded, ensure_ascii=False, indent=2) == json.dumps(words, ensure_ascii=False, indent=2)
+    assert size < os.path.getsize(VOCABULARY_PATH)
+
+def test_single_record_lookup(tmp_path, words):
+    path = str(tmp_path / "vocabulary.bin")
+    write_binary(words, path)
+
+    with VocabularyFile(path) as vocab:
+        record = vocab.get("H430")
+        assert isinstance(record, WordRecord)
+        assert record.gloss == next(w["gloss"] for w in words if w["id"] == "H430")
+        assert record.strongsNum == 430
+        assert vocab.get("H999999") is None
+        with pytest.raises(AttributeError):
+            record.unknown_field
+        with pytest.raises(AttributeError):
+            record.extra = 1
+
+def test_writes_what_the_build_transforms(tmp_path):
+    vocab = load_script('fetch-vocabulary')
+    built = vocab.transform_to_app_format(iter(synthetic_entries(60)))
+    path = str(tmp_path / "vocabulary.bin")
+    write_binary(built, path)
+
+    with VocabularyFile(path) as decoded:
+        assert decoded.flags & FLAG_PRONUNCIATION
+        assert [record.to_dict() for record in decoded] == built
+
+def test_rejects_other_format_versions(tmp_path, words):
+    path = tmp_path / "vocabulary.bin"
+    write_binary(words[:10], str(path))
+    data = bytearray(path.read_bytes())
+    data[4:6] = (FORMAT_VERSION - 1).to_bytes(2, 'little')
+    path.write_bytes(bytes(data))
+    with pytest.raises(ValueError):
+        VocabularyFile(str(path))
+
+def test_rejects_unsupported_fields(tmp_path, words):
+    with pytest.raises(ValueError):
+        write_binary([{**words[0], "surprise": 1}], str(tmp_path / "x.bin"))
+
+def test_pronunciation_fields_are_derived_on_read(tmp_path, words):
+    enriched = [{**w, **pronunciation_fields(w["hebrew"])} for w in words[:300]]
+    path = str(tmp_path / "vocabulary.bin")
+    plain_size = write_binary(words[:300], path)
+    assert write_binary(enriched, path) == plain_size
+
+    with VocabularyFile(path) as vocab:
+        assert [record.to_dict() for record in vocab] == enriched
+        assert vocab[0].pronunciation == enriched[0]["pronunciation"]
+
+    stale = [{**enriched[0], "consonantal": "x"}] + enriched[1:]
+    with pytest.raises(ValueError):
+        write_binary(stale, path)
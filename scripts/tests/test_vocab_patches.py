@@ -0,0 +1,64 @@
+import json
+
+from vocab_patches import content_hash, update_patches
+
+def word(n: int, gloss: str = "word") -> dict:
+    return {"id": f"H{n}", "hebrew": "אָב", "gloss": f"{gloss} {n}", "tier": 1 + n % 3, "frequency": 1000 - n}
+
+def apply_patches(client: dict[str, dict], version: int, manifest: dict, out_dir) -> int:
+    """What a PWA client does: check each patch's base, apply it, move on."""
+    for entry in manifest["patches"]:
+        if entry["from"] < version:
+            continue
+        assert entry["from"] == version
+        patch = json.loads((out_dir / entry["file"]).read_text(encoding='utf-8'))
+        assert patch["baseHash"] == content_hash(list(client.values()))
+        for removed in patch["removed"]:
+            del client[removed]
+        for record in patch["added"] + patch["changed"]:
+            client[record["id"]] = record
+        assert content_hash(list(client.values())) == patch["targetHash"]
+        version = patch["to"]
+    return version
+
+def test_clients_catch_up_through_patches(tmp_path):
+    v1 = [word(n) for n in range(1, 200)]
+    manifest, patch = update_patches([], v1, str(tmp_path))
+    assert (manifest["latest"], patch) == (1, None)
+
+    v2 = [w if w["id"] != "H5" else word(5, "changed") for w in v1 if w["id"] != "H7"] + [word(500)]
+    manifest, patch = update_patches(v1, v2, str(tmp_path))
+    assert (patch["added"], patch["removed"], patch["changed"]) == (1, 1, 1)
+
+    v3 = v2[:-1] + [word(501)]
+    manifest, _ = update_patches(v2, v3, str(tmp_path))
+    assert manifest["latest"] == 3
+
+    client = {w["id"]: w for w in v1}
+    assert apply_patches(client, 1, manifest, tmp_path) == 3
+    assert content_hash(list(client.values())) == manifest["sha256"] == content_hash(v3)
+
+    # Rebuilding the same words does not make a new version
+    assert update_patches(v3, list(reversed(v3)), str(tmp_path)) == (manifest, None)
+
+def test_first_versioned_build_patches_from_the_previous_output(tmp_path):
+    v1 = [word(n) for n in range(10)]
+    manifest, patch = update_patches(v1, v1 + [word(10)], str(tmp_path))
+    assert (manifest["latest"], patch["from"], patch["added"]) == (2, 1, 1)
+
+def test_only_recent_patches_are_kept(tmp_path):
+    builds = [[word(n) for n in range(i + 1)] for i in range(6)]
+    update_patches([], builds[0], str(tmp_path), keep=3)
+    for previous, words in zip(builds, builds[1:]):
+        manifest, _ = update_patches(previous, words, str(tmp_path), keep=3)
+    assert [p["to"] for p in manifest["patches"]] == [4, 5, 6]
+    assert sorted(p.name for p in tmp_path.glob("patch-*.json")) == ["patch-4.json", "patch-5.json", "patch-6.json"]
+
+def test_chain_restarts_when_the_previous_build_is_not_the_latest_version(tmp_path):
+    update_patches([], [word(1)], str(tmp_path))
+    update_patches([word(1)], [word(1), word(2)], str(tmp_path))
+
+    # e.g. vocabulary.json was checked out from an older commit before this build
+    manifest, patch = update_patches([word(1)], [word(3)], str(tmp_path))
+    assert (manifest["latest"], manifest["patches"], patch) == (3, [], None)
+    assert list(tmp_path.glob("patch-*.json")) == []
@@ -0,0 +1,44 @@
+import json
+import pickle
+
+import pytest
+
+from conftest import load_script, synthetic_entries
+from word_model import Word, as_dict
+
+vocab = load_script('fetch-vocabulary')
+
+def test_records_read_like_dicts():
+    records = vocab.transform_records(iter(synthetic_entries(60)))
+    words = [w.to_dict() for w in records]
+    assert all(isinstance(w, Word) for w in records)
+    for record, word in zip(records, words):
+        assert list(record) == list(word)
+        assert dict(record.items()) == word == record
+        assert record["morphology"] == word["morphology"]
+        assert Word.from_dict(word).to_dict() == word
+    nouns = [w for w in records if w["partOfSpeech"] == "noun"]
+    assert nouns and all(w["morphology"]["gender"] in ("masculine", "feminine") for w in nouns)
+    with pytest.raises(KeyError):
+        records[0]["surprise"]
+    with pytest.raises(AttributeError):
+        records[0].surprise = 1
+
+def test_records_survive_pickling_across_processes():
+    record = vocab.transform_records(iter(synthetic_entries(5)))[0]
+    assert pickle.loads(pickle.dumps(record)).to_dict() == record.to_dict()
+
+def test_from_dict_rejects_words_it_cannot_reproduce():
+    word = vocab.transform_entry("H1", {"lemma": "אָב", "strongs_def": "father"}, 5)
+    with pytest.raises(ValueError):
+        Word.from_dict({**word, "extra": 1})
+    with pytest.raises(ValueError):
+        Word.from_dict({k: v for k, v in word.items() if k != "tier"})
+
+def test_streamed_output_matches_json_dumps(tmp_path):
+    records = vocab.transform_records(iter(synthetic_entries(30)))
+    for words in (records, []):
+        path = tmp_path / 'vocabulary.json'
+        vocab.write_vocabulary(words, str(path))
+        expected = json.dumps({"words": [as_dict(w) for w in words]}, ensure_ascii=False, indent=2)
+        assert path.read_text(encoding='utf-8') == expected
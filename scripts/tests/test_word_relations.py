@@ -0,0 +1,99 @@
+import json
+import random
+import re
+
+import pytest
+
+from conftest import VOCABULARY_PATH
+from root_families import FamilyBuilder
+from word_relations import build_relations
+
+@pytest.fixture(scope="module")
+def words():
+    with open(VOCABULARY_PATH, encoding='utf-8') as f:
+        return json.load(f)["words"]
+
+# Direct ports of src/lib/wordRelations.ts (Python's sort is stable, like Array.prototype.sort)
+
+def split(gloss):
+    return re.split(r'[,;\s]+', gloss.lower())
+
+def find_similar_meaning(all_words, word, limit=5):
+    gloss_words = [w for w in split(word["gloss"]) if len(w) > 2]
+    scored = []
+    for w in all_words:
+        if w["id"] == word["id"]:
+            continue
+        w_words = split(w["gloss"])
+        score = len([gw for gw in gloss_words if any(wgw in gw or gw in wgw for wgw in w_words)])
+        if score > 0:
+            scored.append((w, score))
+    scored.sort(key=lambda item: -item[1])
+    return [w["id"] for w, _ in scored[:limit]]
+
+def find_same_category(all_words, word, limit=5):
+    matches = [w for w in all_words if w["id"] != word["id"] and w["partOfSpeech"] == word["partOfSpeech"]
+               and abs(w["tier"] - word["tier"]) <= 1]
+    matches.sort(key=lambda w: -w["frequency"])
+    return [w["id"] for w in matches[:limit]]
+
+def num(w):
+    return int(re.sub(r'\D', '', w["strongs"]))
+
+def find_related_root(all_words, word, limit=5):
+    n = num(word)
+    matches = [w for w in all_words if w["id"] != word["id"] and w["strongs"][0] == word["strongs"][0]
+               and 0 < abs(num(w) - n) <= 50]
+    matches.sort(key=lambda w: abs(num(w) - n))
+    return [w["id"] for w in matches[:limit]]
+
+def find_similar_frequency(all_words, word, limit=5):
+    matches = [w for w in all_words if w["id"] != word["id"]]
+    matches.sort(key=lambda w: abs(w["frequency"] - word["frequency"]))
+    return [w["id"] for w in matches[:limit]]
+
+def test_matches_runtime_rules(words):
+    relations = build_relations(words)
+    ids = relations["ids"]
+    sample = random.Random(3).sample(range(len(words)), 25) + [0, len(words) - 1]
+
+    for pos in sample:
+        word = words[pos]
+        assert [ids[p] for p in relations["similarMeaning"][pos]] == find_similar_meaning(words, word)
+        assert [ids[p] for p in relations["sameCategory"][pos]] == find_same_category(words, word)
+        assert [ids[p] for p in relations["relatedRoot"][pos]] == find_related_root(words, word)
+        assert [ids[p] for p in relations["similarFrequency"][pos]] == find_similar_frequency(words, word)
+
+def test_short_and_empty_tokens_match_like_includes():
+    words = [
+        {"id": "H1", "gloss": "Father", "partOfSpeech": "noun", "tier": 1, "frequency": 10, "strongs": "H1"},
+        {"id": "H2", "gloss": "", "partOfSpeech": "noun", "tier": 1, "frequency": 9, "strongs": "H2"},
+        {"id": "H3", "gloss": "A brother", "partOfSpeech": "noun", "tier": 1, "frequency": 9, "strongs": "H3"},
+        {"id": "H4", "gloss": "Fatherly, father", "partOfSpeech": "verb", "tier": 3, "frequency": 1, "strongs": "H400"},
+    ]
+    relations = build_relations(words, k=3)
+    for pos, word in enumerate(words):
+        assert [words[p]["id"] for p in relations["similarMeaning"][pos]] == find_similar_meaning(words, word, 3)
+
+def test_related_root_comes_from_root_families():
+    words = [
+        {"id": f"H{n}", "gloss": "", "partOfSpeech": "noun", "tier": 1, "frequency": 1, "strongs": f"H{n}"}
+        for n in (1, 2, 3, 200, 201)
+    ]
+    builder = FamilyBuilder()
+    builder.add("H3", {"derivation": "from H1"})
+    builder.add("H200", {"derivation": "from H1"})
+    families = builder.to_dict(words)
+    relations = build_relations(words, families=families)
+
+    related = [[words[p]["id"] for p in positions] for positions in relations["relatedRoot"]]
+    # Family members only, nearest Strong's number first, however far apart
+    assert related[0] == ["H3", "H200"]
+    assert related[3] == ["H3", "H1"]
+    # In no family: Strong's numbers within +/-50
+    assert related[1] == ["H1", "H3"]
+    assert related[4] == ["H200"]
+    assert build_relations(words)["relatedRoot"][0] == [1, 2]
+
+    with pytest.raises(ValueError):
+        build_relations(words[:-1], families=families)
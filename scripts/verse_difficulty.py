@@ -0,0 +1,206 @@
+#!/usr/bin/env python3
+"""
+Difficulty scores for verses, from the frequency and tier of their lemmas.
+
+Every token of a verse is matched to a vocabulary lemma (see
+verse_index.LemmaMatcher); tokens that match nothing count as unknown. Per
+verse, over its tokens:
+
+    tokens            token count
+    rareRatio         share of tokens that are unknown or rarer than
+                      RARE_FREQUENCY occurrences
+    meanLogFrequency  mean of log(1 + frequency), 0 for unknown tokens
+    hapax             tokens whose lemma occurs only once in the corpus
+    knownAtTier       percent of tokens known to a learner who has studied
+                      tiers 1..N, for each tier N
+
+The features combine into a `score` from 0 (easy) to 1 (hard), see WEIGHTS,
+and a `level` on the 1-3 scale of the curated difficulties (LEVELS).
+
+Hapaxes are counted from the tokens themselves, so only when the verses
+scored are a whole corpus (fetch-verses.py --osis). The vocabulary's
+`frequency` cannot stand in: the curated counts default to 5 for every
+lemma not listed. For a selection of verses `hapax` is null and scores
+carry no hapax term.
+
+Tokens are collected as a flat array of lemma positions while the verses
+stream past; the features are computed for the whole corpus at once at the
+end, with NumPy when it is installed (see requirements-dev.txt) and a plain
+loop otherwise; tests/test_verse_difficulty.py checks the two agree.
+
+Output (public/data/verse-difficulty.json), columns aligned with "verses":
+    {"version": 2, "tiers": [1, ..., 5], "verses": [ids...], "score": [...],
+     "level": [...], "tokens": [...], "rareRatio": [...],
+     "meanLogFrequency": [...], "hapax": [...] | null, "knownAtTier": [[...], ...]}
+
+Run standalone for an existing vocabulary and verses file:
+    python scripts/verse_difficulty.py [vocabulary.json] [ot-verses.json] [verse-difficulty.json]
+"""
+
+import json
+import math
+import os
+import sys
+from array import array
+from collections import Counter
+
+from build_io import PUBLIC_DATA_DIR, VERSES_PATH, VOCABULARY_PATH, write_atomic
+from verse_index import LemmaMatcher, load_words, tokenize
+
+try:
+    import numpy as np
+except ImportError:  # optional: the plain loop gives the same results
+    np = None
+
+DIFFICULTY_PATH = os.path.join(PUBLIC_DATA_DIR, "verse-difficulty.json")
+
+# 2: hapax is null unless the verses scored are a whole corpus
+DIFFICULTY_VERSION = 2
+# Below the tier 4 threshold of fetch-vocabulary.calculate_tier
+RARE_FREQUENCY = 50
+# Verses this long or longer get the whole length weight
+LONG_VERSE = 24
+# Hapax count that gets the whole hapax weight
+MANY_HAPAX = 3
+WEIGHTS = {"rare": 0.45, "frequency": 0.3, "length": 0.15, "hapax": 0.1}
+# Upper score bounds of levels 1 and 2; anything above is level 3
+LEVELS = (0.5, 0.7)
+
+def level(score: float) -> int:
+    return 1 + sum(score >= bound for bound in LEVELS)
+
+class DifficultyBuilder:
+    """Collects the lemma of every token one verse at a time, then scores all verses together."""
+
+    def __init__(self, words: list[dict], matcher: LemmaMatcher | None = None, corpus: bool = False):
+        self.matcher = matcher or LemmaMatcher(words)
+        # Whether the verses added are a whole corpus, so that hapaxes can be counted
+        self.corpus = corpus
+        self.frequency = [w["frequency"] for w in words]
+        self.tier = [w["tier"] for w in words]
+        self.tiers = sorted(set(self.tier))
+        self.verse_ids: list[str] = []
+        # Vocabulary position per token, -1 for unknown; verse n is lemmas[ends[n - 1]:ends[n]]
+        self.lemmas = array('i')
+        self.ends = array('q')
+
+    def add(self, verse_id: str, hebrew: str) -> None:
+        for token in tokenize(hebrew):
+            pos = self.matcher.match(token)
+            self.lemmas.append(-1 if pos is None else pos)
+        self.verse_ids.append(verse_id)
+        self.ends.append(len(self.lemmas))
+
+    def features(self) -> dict[str, list]:
+        """Feature columns for every verse added so far."""
+        return self._features_numpy() if np is not None else self._features_loop()
+
+    def _features_numpy(self) -> dict[str, list]:
+        n = len(self.verse_ids)
+        lemmas = np.frombuffer(self.lemmas, dtype=np.int32) if self.lemmas else np.zeros(0, dtype=np.int32)
+        ends = np.frombuffer(self.ends, dtype=np.int64) if self.ends else np.zeros(0, dtype=np.int64)
+        counts = np.diff(ends, prepend=0)
+        verse = np.repeat(np.arange(n), counts)
+
+        # Index -1 (unknown) picks the sentinel at the end of each table
+        frequency = np.append(np.asarray(self.frequency, dtype=np.float64), 0.0)[lemmas]
+        tier = np.append(np.asarray(self.tier, dtype=np.int64), self.tiers[-1] + 1 if self.tiers else 1)[lemmas]
+
+        def per_verse(weights) -> "np.ndarray":
+            return np.bincount(verse, weights=weights, minlength=n)
+
+        rare = per_verse(frequency < RARE_FREQUENCY)
+        log_frequency = per_verse(np.log1p(frequency))
+        hapax = None
+        if self.corpus:
+            occurrences = np.append(np.bincount(lemmas[lemmas >= 0], minlength=len(self.frequency)), 0)
+            hapax = per_verse(occurrences[lemmas] == 1).astype(np.int64).tolist()
+        known = np.stack([per_verse(tier <= t) for t in self.tiers], axis=1) if self.tiers else np.zeros((n, 0))
+
+        safe = np.maximum(counts, 1)
+        return self._columns(
+            counts.tolist(), (rare / safe).tolist(), (log_frequency / safe).tolist(),
+            hapax, (known / safe[:, None]).tolist(),
+        )
+
+    def _features_loop(self) -> dict[str, list]:
+        counts, rare_ratio, mean_log, hapax, known = [], [], [], [], []
+        occurrences = Counter(self.lemmas) if self.corpus else None
+        start = 0
+        for end in self.ends:
+            frequencies = [self.frequency[p] if p >= 0 else 0 for p in self.lemmas[start:end]]
+            tiers = [self.tier[p] for p in self.lemmas[start:end] if p >= 0]
+            safe = max(end - start, 1)
+            counts.append(end - start)
+            rare_ratio.append(sum(f < RARE_FREQUENCY for f in frequencies) / safe)
+            mean_log.append(sum(math.log1p(f) for f in frequencies) / safe)
+            if occurrences is not None:
+                hapax.append(sum(p >= 0 and occurrences[p] == 1 for p in self.lemmas[start:end]))
+            known.append([sum(tier <= t for tier in tiers) / safe for t in self.tiers])
+            start = end
+        return self._columns(counts, rare_ratio, mean_log, hapax if occurrences is not None else None, known)
+
+    def _columns(self, counts, rare_ratio, mean_log, hapax, known) -> dict[str, list]:
+        max_log = math.log1p(max(self.frequency, default=0)) or 1.0
+        scores = []
+        for tokens, rare, log_frequency, hapax_count in zip(counts, rare_ratio, mean_log, hapax or [0] * len(counts)):
+            score = 0.0
+            if tokens:
+                score = (WEIGHTS["rare"] * rare
+                         + WEIGHTS["frequency"] * (1 - log_frequency / max_log)
+                         + WEIGHTS["length"] * min(tokens / LONG_VERSE, 1)
+                         + WEIGHTS["hapax"] * min(hapax_count / MANY_HAPAX, 1))
+            scores.append(round(score, 3))
+        return {
+            "score": scores,
+            "level": [level(s) for s in scores],
+            "tokens": counts,
+            "rareRatio": [round(r, 3) for r in rare_ratio],
+            "meanLogFrequency": [round(m, 3) for m in mean_log],
+            "hapax": hapax,
+            "knownAtTier": [[round(100 * share) for share in shares] for shares in known],
+        }
+
+    def to_dict(self) -> dict:
+        return {"version": DIFFICULTY_VERSION, "tiers": self.tiers, "verses": self.verse_ids, **self.features()}
+
+    def write(self, path: str = DIFFICULTY_PATH) -> dict:
+        """Write the scores; returns what was written."""
+        data = self.to_dict()
+        write_atomic(path, json.dumps(data, separators=(',', ':')).encode('utf-8'))
+        return data
+
+def report(data: dict, path: str, curated: dict[str, int] | None = None) -> None:
+    """Level distribution, and how often the computed level agrees with the curated one."""
+    counts = {}
+    for lvl in data["level"]:
+        counts[lvl] = counts.get(lvl, 0) + 1
+    levels = ", ".join(f"level {lvl}: {counts[lvl]}" for lvl in sorted(counts))
+    print(f"\nScored {len(data['verses'])} verses ({levels})")
+    if data["hapax"] is None:
+        print("  Hapaxes not counted: the verses are not a whole corpus (see --osis)")
+    if curated:
+        pairs = [(curated[v], lvl) for v, lvl in zip(data["verses"], data["level"]) if v in curated]
+        if pairs:
+            agree = sum(a == b for a, b in pairs)
+            print(f"  Computed level matches {agree}/{len(pairs)} curated difficulties")
+    print(f"Wrote verse difficulty to {path}")
+
+def main():
+    vocabulary = sys.argv[1] if len(sys.argv) > 1 else VOCABULARY_PATH
+    verses_path = sys.argv[2] if len(sys.argv) > 2 else VERSES_PATH
+    target = sys.argv[3] if len(sys.argv) > 3 else DIFFICULTY_PATH
+    words = load_words(vocabulary)
+    if words is None:
+        sys.exit(f"Cannot read vocabulary from {vocabulary}")
+    with open(verses_path, encoding='utf-8') as f:
+        verses = json.load(f)["verses"]
+
+    builder = DifficultyBuilder(words)
+    for verse in verses:
+        builder.add(verse["id"], verse.get("hebrew", ""))
+    data = builder.write(target)
+    report(data, target, {v["id"]: v["difficulty"] for v in verses})
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,187 @@
+#!/usr/bin/env python3
+"""
+Lemma-to-verse inverted index linking vocabulary.json and the verse data.
+
+Every verse's Hebrew text is reduced to bare consonants (cantillation and
+niqqud removed, final letters normalised; see hebrew_text.consonants) and
+split into words. Each word is matched against the consonantal forms of the
+vocabulary lemmas through a trie, allowing for:
+    prefixes   ו (and), ש (that), ב כ ל מ (prepositions), ה (article),
+               in that order, e.g. וּבַבַּיִת -> ו + ב + בית
+    suffixes   a short list of pronominal / plural endings, e.g. בֵּיתוֹ -> בית + ו
+
+The reading with the fewest prefix and suffix letters wins; a suffix is only
+stripped from stems of three or more letters, since two-letter stems match
+too many inflected forms by accident. Lemmas that share a consonantal form
+are resolved to the most frequent one (then the lowest Strong's number).
+
+Output (public/data/word-verses.json):
+    {"version": 1, "words": [ids...], "verses": [ids...],
+     "wordVerses": [[verse positions], ...],   # aligned with "words"
+     "verseWords": [[word positions], ...]}    # aligned with "verses"
+
+Run standalone for an existing vocabulary and verses file:
+    python scripts/verse_index.py [vocabulary.json] [ot-verses.json] [word-verses.json]
+"""
+
+import json
+import os
+import re
+import sys
+from typing import Iterable
+
+from build_io import PUBLIC_DATA_DIR, VERSES_PATH, VOCABULARY_PATH, write_atomic
+from hebrew_text import FINAL_FORMS, consonants
+
+INDEX_PATH = os.path.join(PUBLIC_DATA_DIR, "word-verses.json")
+
+INDEX_VERSION = 1
+
+WORD_RE = re.compile('[\u05D0-\u05EA]+')
+
+PREFIX_RE = re.compile('^ו?ש?[בכלמ]?ה?$')
+MAX_PREFIX = 4
+SUFFIXES = frozenset(
+    s.translate(FINAL_FORMS) for s in
+    ["", "ו", "ה", "ך", "ם", "ן", "י", "ת", "ים", "ות", "נו", "כם", "כן", "הם", "הן", "יו", "יה", "יך",
+     "ינו", "יכם", "יהם", "יהן", "תי", "תם", "מו"]
+)
+MIN_STEM = 2
+MIN_SUFFIXED_STEM = 3
+
+def tokenize(text: str) -> list[str]:
+    """Consonantal words of a pointed verse."""
+    return WORD_RE.findall(consonants(text))
+
+def homograph_rank(word: dict) -> tuple[int, int]:
+    digits = re.sub(r'\D', '', word["strongs"])
+    return -word["frequency"], int(digits) if digits else 0
+
+class LemmaMatcher:
+    """Matches consonantal tokens to vocabulary positions through a trie of lemma forms."""
+
+    TERMINAL = ""
+
+    def __init__(self, words: list[dict]):
+        self.trie: dict = {}
+        best: dict[str, int] = {}
+        for pos, word in enumerate(words):
+            form = consonants(word["hebrew"])
+            if len(form) < MIN_STEM or not WORD_RE.fullmatch(form):
+                # Multi-word names and stray punctuation are not matched
+                continue
+            current = best.get(form)
+            if current is None or homograph_rank(word) < homograph_rank(words[current]):
+                best[form] = pos
+        for form, pos in best.items():
+            node = self.trie
+            for ch in form:
+                node = node.setdefault(ch, {})
+            node[self.TERMINAL] = pos
+        self.cache: dict[str, int | None] = {}
+
+    def stems(self, text: str) -> Iterable[tuple[int, int]]:
+        """(lemma position, letters left over) for every lemma form that starts `text`."""
+        node = self.trie
+        for i, ch in enumerate(text):
+            node = node.get(ch)
+            if node is None:
+                return
+            if self.TERMINAL in node:
+                yield node[self.TERMINAL], len(text) - i - 1
+
+    def match(self, token: str) -> int | None:
+        """Vocabulary position for a consonantal token, or None."""
+        if token in self.cache:
+            return self.cache[token]
+        best = None
+        for cut in range(min(MAX_PREFIX, len(token) - MIN_STEM) + 1):
+            if cut and not PREFIX_RE.match(token[:cut]):
+                continue
+            for pos, left in self.stems(token[cut:]):
+                if left == 0 or (len(token) - cut - left >= MIN_SUFFIXED_STEM and token[len(token) - left:] in SUFFIXES):
+                    cost = (cut + left, cut)
+                    if best is None or cost < best[0]:
+                        best = (cost, pos)
+        result = best[1] if best else None
+        self.cache[token] = result
+        return result
+
+class VerseIndexBuilder:
+    """Accumulates word <-> verse postings one verse at a time."""
+
+    def __init__(self, words: list[dict]):
+        self.words = words
+        self.matcher = LemmaMatcher(words)
+        self.verse_ids: list[str] = []
+        self.verse_words: list[list[int]] = []
+        self.tokens = 0
+        self.matched = 0
+
+    def add(self, verse_id: str, hebrew: str) -> list[int]:
+        """Index one verse; returns the vocabulary positions of the lemmas found in it."""
+        found = []
+        for token in tokenize(hebrew):
+            self.tokens += 1
+            pos = self.matcher.match(token)
+            if pos is not None:
+                self.matched += 1
+                found.append(pos)
+        self.verse_ids.append(verse_id)
+        positions = sorted(set(found))
+        self.verse_words.append(positions)
+        return positions
+
+    def to_dict(self) -> dict:
+        postings: dict[int, list[int]] = {}
+        for verse_pos, word_positions in enumerate(self.verse_words):
+            for word_pos in word_positions:
+                postings.setdefault(word_pos, []).append(verse_pos)
+        # Only words that occur somewhere, in vocabulary order
+        used = sorted(postings)
+        renumber = {word_pos: i for i, word_pos in enumerate(used)}
+        return {
+            "version": INDEX_VERSION,
+            "words": [self.words[p]["id"] for p in used],
+            "verses": self.verse_ids,
+            "wordVerses": [postings[p] for p in used],
+            "verseWords": [[renumber[p] for p in positions] for positions in self.verse_words],
+        }
+
+    def write(self, path: str = INDEX_PATH) -> int:
+        """Write the index; returns its size in bytes."""
+        data = json.dumps(self.to_dict(), ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+        write_atomic(path, data)
+        return len(data)
+
+    def report(self, path: str) -> None:
+        rate = self.matched / self.tokens if self.tokens else 0.0
+        print(f"\nIndexed {len(self.verse_ids)} verses: {self.matched}/{self.tokens} words matched to lemmas ({rate:.0%})")
+        print(f"Wrote word/verse index to {path}")
+
+def load_words(path: str = VOCABULARY_PATH) -> list[dict] | None:
+    """Vocabulary words, or None if the vocabulary has not been built."""
+    try:
+        with open(path, encoding='utf-8') as f:
+            return json.load(f)["words"]
+    except (OSError, ValueError, KeyError):
+        return None
+
+def main():
+    vocabulary = sys.argv[1] if len(sys.argv) > 1 else VOCABULARY_PATH
+    verses_path = sys.argv[2] if len(sys.argv) > 2 else VERSES_PATH
+    target = sys.argv[3] if len(sys.argv) > 3 else INDEX_PATH
+    words = load_words(vocabulary)
+    if words is None:
+        sys.exit(f"Cannot read vocabulary from {vocabulary}")
+    with open(verses_path, encoding='utf-8') as f:
+        verses = json.load(f)["verses"]
+
+    builder = VerseIndexBuilder(words)
+    for verse in verses:
+        builder.add(verse["id"], verse.get("hebrew", ""))
+    builder.write(target)
+    builder.report(target)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,304 @@
+#!/usr/bin/env python3
+"""
+Columnar binary vocabulary format (.bin) with a memory-mapped reader.
+
+Layout, all little-endian:
+
+    header      magic "HVCB", version u16, flags u16, record count u32, section count u32
+    directory   per section: name (16 bytes, NUL padded), type code (1 byte), 7 pad bytes,
+                byte offset u64, item count u64
+    sections    8-byte aligned arrays, one per directory entry
+
+Fixed-width columns hold the Strong's number, frequency, tier and enum codes
+for part of speech, semantic category and gender. Text columns hold u32 ids
+into a shared, deduplicated string table (`strOffsets` + `strData`). The
+`byStrongs` section lists record indices sorted by Strong's number, so a
+single word can be found by binary search without reading the rest.
+
+The optional `articles` list is a u8 bitmask column over `articleNames`.
+The consonantal form and pronunciation breakdown are not stored: they are
+derived from `hebrew` (see hebrew_text.py), and the FLAG_PRONUNCIATION
+header flag tells the reader to add them back.
+
+Run standalone to convert an existing vocabulary.json:
+    python scripts/vocab_binary.py [vocabulary.json] [vocabulary.bin]
+"""
+
+import json
+import mmap
+import os
+import struct
+import sys
+from array import array
+
+from build_io import DATA_DIR, VOCABULARY_PATH, strongs_number, write_atomic
+from hebrew_text import pronunciation_fields
+
+BINARY_PATH = os.path.join(DATA_DIR, "vocabulary.bin")
+
+MAGIC = b"HVCB"
+# 2: the header flags say which fields are derived on read
+FORMAT_VERSION = 2
+HEADER = struct.Struct('<4sHHII')
+DIRECTORY_ENTRY = struct.Struct('<16sc7xQQ')
+
+# Word fields in output order, with how each is stored
+STRING_FIELDS = ("id", "hebrew", "transliteration", "gloss", "definition", "strongs")
+ENUM_FIELDS = {"partOfSpeech": "pos", "semanticCategory": "category"}
+WORD_FIELDS = (
+    "id", "hebrew", "transliteration", "gloss", "definition", "partOfSpeech",
+    "frequency", "tier", "strongs", "semanticCategory", "morphology",
+)
+# Only present on words with dictionary articles
+OPTIONAL_FIELDS = ("articles",)
+# Computed from `hebrew` on read when the header has FLAG_PRONUNCIATION
+DERIVED_FIELDS = ("consonantal", "pronunciation")
+FLAG_PRONUNCIATION = 1
+
+NATIVE_LITTLE = sys.byteorder == 'little'
+
+class StringTable:
+    """Deduplicated UTF-8 strings addressed by id."""
+
+    def __init__(self):
+        self.ids: dict[str, int] = {}
+        self.offsets = array('I', [0])
+        self.data = bytearray()
+
+    def add(self, text: str) -> int:
+        if text not in self.ids:
+            self.ids[text] = len(self.ids)
+            self.data += text.encode('utf-8')
+            self.offsets.append(len(self.data))
+        return self.ids[text]
+
+def encode(words: list[dict]) -> bytes:
+    """Serialise words to the columnar binary format."""
+    strings = StringTable()
+    enum_names = {"pos": [], "category": [], "gender": []}
+    enum_codes = {name: {} for name in enum_names}
+
+    def code(kind: str, value: str) -> int:
+        codes = enum_codes[kind]
+        if value not in codes:
+            codes[value] = len(codes)
+            enum_names[kind].append(value)
+        return codes[value]
+
+    columns = {
+        "strongsNum": array('I'),
+        "frequency": array('I'),
+        "tier": array('B'),
+        "pos": array('B'),
+        "category": array('B'),
+        # 0 = no gender recorded, n = gender name n-1
+        "gender": array('B'),
+        # Bit n = article source n
+        "articles": array('B'),
+    }
+    article_names: list[str] = []
+    for field in STRING_FIELDS:
+        columns[field] = array('I')
+
+    flags = FLAG_PRONUNCIATION if words and "pronunciation" in words[0] else 0
+    for word in words:
+        unknown = set(word) - set(WORD_FIELDS) - set(OPTIONAL_FIELDS) - set(DERIVED_FIELDS)
+        if unknown or set(word.get("morphology", {})) - {"gender"}:
+            raise ValueError(f"{word.get('id')}: fields not supported by the binary format: {sorted(unknown) or word['morphology']}")
+        derived = {field: word[field] for field in DERIVED_FIELDS if field in word}
+        if derived != (pronunciation_fields(word["hebrew"]) if flags else {}):
+            raise ValueError(f"{word.get('id')}: consonantal and pronunciation fields do not match the hebrew")
+        columns["strongsNum"].append(strongs_number(word["strongs"]))
+        columns["frequency"].append(word["frequency"])
+        columns["tier"].append(word["tier"])
+        for field, kind in ENUM_FIELDS.items():
+            columns[kind].append(code(kind, word[field]))
+        gender = word.get("morphology", {}).get("gender")
+        columns["gender"].append(code("gender", gender) + 1 if gender else 0)
+        for field in STRING_FIELDS:
+            columns[field].append(strings.add(word[field]))
+        bits = 0
+        for source in word.get("articles", ()):
+            if source not in article_names:
+                article_names.append(source)
+            bits |= 1 << article_names.index(source)
+        columns["articles"].append(bits)
+
+    for kind, names in enum_names.items():
+        if len(names) > 255:
+            raise ValueError(f"too many {kind} values for a u8 column")
+        columns[f"{kind}Names"] = array('I', [strings.add(n) for n in names])
+    if len(article_names) > 8:
+        raise ValueError("too many article sources for a u8 column")
+    columns["articleNames"] = array('I', [strings.add(n) for n in article_names])
+
+    columns["byStrongs"] = array('I', sorted(range(len(words)), key=lambda i: columns["strongsNum"][i]))
+    columns["strOffsets"] = strings.offsets
+    columns["strData"] = array('B', bytes(strings.data))
+
+    sections = list(columns.items())
+    offset = HEADER.size + DIRECTORY_ENTRY.size * len(sections)
+    directory = []
+    payload = []
+    for name, values in sections:
+        offset += -offset % 8
+        data = values.tobytes() if NATIVE_LITTLE else _swapped(values)
+        directory.append(DIRECTORY_ENTRY.pack(name.encode('ascii'), values.typecode.encode('ascii'), offset, len(values)))
+        payload.append((offset, data))
+        offset += len(data)
+
+    out = bytearray(HEADER.pack(MAGIC, FORMAT_VERSION, flags, len(words), len(sections)))
+    out += b''.join(directory)
+    for start, data in payload:
+        out += b'\0' * (start - len(out))
+        out += data
+    return bytes(out)
+
+def _swapped(values: array) -> bytes:
+    values = array(values.typecode, values)
+    values.byteswap()
+    return values.tobytes()
+
+def write_binary(words: list[dict], path: str = BINARY_PATH) -> int:
+    """Write the binary vocabulary; returns its size in bytes."""
+    data = encode(words)
+    write_atomic(path, data)
+    return len(data)
+
+class WordRecord:
+    """Lazy view of one record; fields are decoded on access."""
+
+    __slots__ = ("_file", "_index")
+
+    def __init__(self, file: "VocabularyFile", index: int):
+        self._file = file
+        self._index = index
+
+    def __getattr__(self, name: str):
+        # Only reached for names not in __slots__, i.e. word fields
+        return self._file.field(self._index, name)
+
+    def to_dict(self) -> dict:
+        """The record in vocabulary.json shape."""
+        f, i = self._file, self._index
+        word = {field: f.field(i, field) for field in WORD_FIELDS}
+        if f.flags & FLAG_PRONUNCIATION:
+            word.update(pronunciation_fields(word["hebrew"]))
+        articles = f.field(i, "articles")
+        if articles:
+            word["articles"] = articles
+        return word
+
+    def __repr__(self) -> str:
+        return f"WordRecord({self.id!r})"
+
+class VocabularyFile:
+    """Memory-mapped reader for the binary vocabulary format."""
+
+    def __init__(self, path: str = BINARY_PATH):
+        self._fh = open(path, 'rb')
+        self._mm = mmap.mmap(self._fh.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, version, self.flags, self.count, section_count = HEADER.unpack_from(self._mm, 0)
+        if magic != MAGIC or version != FORMAT_VERSION:
+            self._mm.close()
+            self._fh.close()
+            raise ValueError(f"{path}: not a version {FORMAT_VERSION} binary vocabulary")
+
+        self.sections = {}
+        for n in range(section_count):
+            raw_name, typecode, offset, count = DIRECTORY_ENTRY.unpack_from(self._mm, HEADER.size + n * DIRECTORY_ENTRY.size)
+            self.sections[raw_name.rstrip(b'\0').decode('ascii')] = self._column(typecode.decode('ascii'), offset, count)
+
+        self._enum_cache = {kind: [self.string(s) for s in self.sections[f"{kind}Names"]] for kind in ("pos", "category", "gender")}
+        self._article_names = [self.string(s) for s in self.sections.get("articleNames", ())]
+
+    def _column(self, typecode: str, offset: int, count: int):
+        size = array(typecode).itemsize
+        view = memoryview(self._mm)[offset:offset + size * count]
+        if typecode == 'B':
+            return view
+        if NATIVE_LITTLE:
+            return view.cast(typecode)
+        values = array(typecode, view.tobytes())
+        values.byteswap()
+        return values
+
+    def string(self, string_id: int) -> str:
+        offsets = self.sections["strOffsets"]
+        return bytes(self.sections["strData"][offsets[string_id]:offsets[string_id + 1]]).decode('utf-8')
+
+    def field(self, index: int, name: str):
+        s = self.sections
+        if name in STRING_FIELDS:
+            return self.string(s[name][index])
+        if name in ENUM_FIELDS:
+            kind = ENUM_FIELDS[name]
+            return self._enum_cache[kind][s[kind][index]]
+        if name in ("frequency", "tier", "strongsNum"):
+            return s[name][index]
+        if name == "morphology":
+            gender = s["gender"][index]
+            return {"gender": self._enum_cache["gender"][gender - 1]} if gender else {}
+        if name == "articles":
+            # Files written before the column existed have no articles
+            bits = s["articles"][index] if "articles" in s else 0
+            return [source for n, source in enumerate(self._article_names) if bits >> n & 1]
+        if name in DERIVED_FIELDS and self.flags & FLAG_PRONUNCIATION:
+            return pronunciation_fields(self.field(index, "hebrew"))[name]
+        raise AttributeError(name)
+
+    def __len__(self) -> int:
+        return self.count
+
+    def __getitem__(self, index: int) -> WordRecord:
+        if not 0 <= index < self.count:
+            raise IndexError(index)
+        return WordRecord(self, index)
+
+    def __iter__(self):
+        for index in range(self.count):
+            yield WordRecord(self, index)
+
+    def get(self, strongs: str) -> WordRecord | None:
+        """Look up a word by Strong's id (e.g. "H430") with a binary search."""
+        target = strongs_number(strongs)
+        order, numbers = self.sections["byStrongs"], self.sections["strongsNum"]
+        lo, hi = 0, len(order)
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if numbers[order[mid]] < target:
+                lo = mid + 1
+            else:
+                hi = mid
+        while lo < len(order) and numbers[order[lo]] == target:
+            record = WordRecord(self, order[lo])
+            if record.strongs == strongs:
+                return record
+            lo += 1
+        return None
+
+    def close(self) -> None:
+        # Views into the map must be released before it can be closed
+        for section in self.sections.values():
+            if isinstance(section, memoryview):
+                section.release()
+        self.sections = {}
+        self._mm.close()
+        self._fh.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+def main():
+    source = sys.argv[1] if len(sys.argv) > 1 else VOCABULARY_PATH
+    target = sys.argv[2] if len(sys.argv) > 2 else BINARY_PATH
+    with open(source, encoding='utf-8') as f:
+        words = json.load(f)["words"]
+    size = write_binary(words, target)
+    print(f"Wrote {len(words)} words ({size / 1024:.0f} KB) to {target}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,146 @@
+#!/usr/bin/env python3
+"""
+Versioned delta patches between vocabulary builds, for installed PWA clients.
+
+Every build that changes the vocabulary gets the next version number, and
+the words of the previous build are diffed against the new ones by `id`:
+
+    patch-N.json     {from, to, baseHash, targetHash, added: [word, ...],
+                      removed: [id, ...], changed: [word, ...]}
+    manifest.json    {version, latest, sha256, words, patches: [
+                      {from, to, file, bytes, sha256, added, removed, changed}, ...]}
+
+The hashes are content hashes of a whole vocabulary (see content_hash), so
+a client on version N checks that it holds what the next patch was made
+against, applies the patches up to `latest` in order, and can verify the
+result against the manifest's `sha256`. Only the last KEEP_PATCHES patches
+are kept. A client older than the first of them downloads vocabulary.json
+in full, and so does every client when the previous build on disk is not
+the version the manifest describes: the chain then restarts at a new
+version with no patches.
+
+Run standalone to diff two vocabulary files:
+    python scripts/vocab_patches.py previous.json current.json [output dir]
+"""
+
+import hashlib
+import json
+import os
+import sys
+
+from build_io import PUBLIC_DATA_DIR, write_atomic
+from word_model import as_dict
+
+PATCHES_DIR = os.path.join(PUBLIC_DATA_DIR, "vocabulary-patches")
+
+PATCHES_VERSION = 1
+KEEP_PATCHES = 30
+
+def minified(value) -> bytes:
+    return json.dumps(value, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+
+def content_hash(words: list[dict]) -> str:
+    """
+    SHA-256 of the words in `id` order, one minified record per line.
+
+    Records are serialized the way JSON.stringify() does it (keys in their
+    stored order, no spaces, non-ASCII kept), so a client can recompute the
+    hash from the words it holds.
+    """
+    h = hashlib.sha256()
+    for word in sorted(words, key=lambda w: w["id"]):
+        h.update(minified(as_dict(word)))
+        h.update(b'\n')
+    return h.hexdigest()
+
+def diff_words(previous: list[dict], words: list[dict]) -> tuple[list[dict], list[str], list[dict]]:
+    """Records added and changed in `words`, and ids removed from `previous`."""
+    before = {w["id"]: w for w in previous}
+    current_ids = {w["id"] for w in words}
+    added = [as_dict(w) for w in words if w["id"] not in before]
+    changed = [as_dict(w) for w in words if w["id"] in before and before[w["id"]] != as_dict(w)]
+    removed = [w["id"] for w in previous if w["id"] not in current_ids]
+    return added, removed, changed
+
+def load_manifest(out_dir: str) -> dict | None:
+    try:
+        with open(os.path.join(out_dir, "manifest.json"), encoding='utf-8') as f:
+            manifest = json.load(f)
+    except (OSError, ValueError):
+        return None
+    return manifest if manifest.get("version") == PATCHES_VERSION else None
+
+def update_patches(
+    previous: list[dict],
+    words: list[dict],
+    out_dir: str = PATCHES_DIR,
+    keep: int = KEEP_PATCHES,
+) -> tuple[dict, dict | None]:
+    """
+    Version `words` against the previous build and update the manifest.
+
+    Returns the manifest and the entry of the patch written, which is None
+    when nothing changed or the chain had to restart.
+    """
+    manifest = load_manifest(out_dir)
+    target = content_hash(words)
+    if manifest is not None and manifest["sha256"] == target:
+        return manifest, None
+    if manifest is None:
+        # First versioned build: the previous build, if any, is version 1
+        base = content_hash(previous) if previous else None
+        if base == target:
+            base = None
+        manifest = {"latest": 0 if base is None else 1, "sha256": base, "patches": []}
+
+    version = manifest["latest"] + 1
+    patches: list[dict] = []
+    patch = None
+    if previous and content_hash(previous) == manifest["sha256"]:
+        added, removed, changed = diff_words(previous, words)
+        name = f"patch-{version}.json"
+        data = minified({
+            "from": version - 1, "to": version, "baseHash": manifest["sha256"], "targetHash": target,
+            "added": added, "removed": removed, "changed": changed,
+        })
+        write_atomic(os.path.join(out_dir, name), data)
+        patch = {
+            "from": version - 1, "to": version, "file": name, "bytes": len(data),
+            "sha256": hashlib.sha256(data).hexdigest(),
+            "added": len(added), "removed": len(removed), "changed": len(changed),
+        }
+        patches = (manifest["patches"] + [patch])[-keep:] if keep > 0 else []
+    # Otherwise the previous build is not the version clients were told
+    # about, so no patch can take them here and the chain restarts
+
+    manifest = {"version": PATCHES_VERSION, "latest": version, "sha256": target, "words": len(words),
+                "patches": patches}
+    write_atomic(os.path.join(out_dir, "manifest.json"), minified(manifest))
+
+    # Drop patches that fell out of the window
+    current = {p["file"] for p in manifest["patches"]}
+    for name in os.listdir(out_dir):
+        if name.startswith("patch-") and name.endswith(".json") and name not in current:
+            os.unlink(os.path.join(out_dir, name))
+
+    return manifest, patch
+
+def report(manifest: dict, patch: dict | None, full_bytes: int, out_dir: str) -> None:
+    print(f"\nVocabulary version {manifest['latest']} ({len(manifest['patches'])} patches kept in {out_dir})")
+    if patch is not None:
+        print(f"  Patch {patch['from']} -> {patch['to']}: {patch['added']} added, {patch['removed']} removed, "
+              f"{patch['changed']} changed ({patch['bytes'] / 1024:.1f} KB vs {full_bytes / 1024:.0f} KB in full)")
+
+def main():
+    if len(sys.argv) < 3:
+        sys.exit("usage: vocab_patches.py previous.json current.json [output dir]")
+    out_dir = sys.argv[3] if len(sys.argv) > 3 else PATCHES_DIR
+    with open(sys.argv[1], encoding='utf-8') as f:
+        previous = json.load(f)["words"]
+    with open(sys.argv[2], encoding='utf-8') as f:
+        words = json.load(f)["words"]
+    manifest, patch = update_patches(previous, words, out_dir)
+    report(manifest, patch, os.path.getsize(sys.argv[2]), out_dir)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,80 @@
+#!/usr/bin/env python3
+"""
+Split the vocabulary into minified per-tier shards for lazy loading.
+
+For each tier two files are written:
+    tier-N.core.json      [{id, hebrew, gloss, tier, frequency}, ...]
+    tier-N.details.json   {id: {transliteration, definition, partOfSpeech, ...}}
+
+plus index.json listing every shard with its word count, byte size and
+content hash. A session can load the core shards for the tiers it studies
+and fetch details only when a word is opened.
+
+Run standalone to shard an existing vocabulary.json:
+    python scripts/vocab_shards.py [vocabulary.json] [output dir]
+"""
+
+import hashlib
+import json
+import os
+import sys
+
+from build_io import PUBLIC_DATA_DIR, VOCABULARY_PATH, write_atomic
+
+SHARDS_DIR = os.path.join(PUBLIC_DATA_DIR, "vocabulary")
+
+SHARDS_VERSION = 1
+CORE_FIELDS = ("id", "hebrew", "gloss", "tier", "frequency")
+
+def minified(value) -> bytes:
+    return json.dumps(value, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+
+def write_shard(out_dir: str, name: str, value, count: int) -> dict:
+    data = minified(value)
+    write_atomic(os.path.join(out_dir, name), data)
+    return {"file": name, "count": count, "bytes": len(data), "sha256": hashlib.sha256(data).hexdigest()}
+
+def write_shards(words: list[dict], out_dir: str = SHARDS_DIR) -> dict:
+    """Write per-tier core/detail shards and index.json; returns the index."""
+    by_tier: dict[int, list[dict]] = {}
+    for word in words:
+        by_tier.setdefault(word["tier"], []).append(word)
+
+    tiers = []
+    for tier in sorted(by_tier):
+        tier_words = by_tier[tier]
+        core = [{field: w[field] for field in CORE_FIELDS} for w in tier_words]
+        details = {w["id"]: {k: v for k, v in w.items() if k not in CORE_FIELDS} for w in tier_words}
+        tiers.append({
+            "tier": tier,
+            "core": write_shard(out_dir, f"tier-{tier}.core.json", core, len(core)),
+            "details": write_shard(out_dir, f"tier-{tier}.details.json", details, len(details)),
+        })
+
+    index = {"version": SHARDS_VERSION, "totalWords": len(words), "tiers": tiers}
+    write_atomic(os.path.join(out_dir, "index.json"), minified(index))
+
+    # Drop shards for tiers that no longer exist
+    current = {s[kind]["file"] for s in tiers for kind in ("core", "details")}
+    for name in os.listdir(out_dir):
+        if name.startswith("tier-") and name.endswith(".json") and name not in current:
+            os.unlink(os.path.join(out_dir, name))
+
+    return index
+
+def report(index: dict, out_dir: str) -> None:
+    print(f"\nWrote vocabulary shards to {out_dir}")
+    for shard in index["tiers"]:
+        core, details = shard["core"], shard["details"]
+        print(f"  Tier {shard['tier']}: {core['count']} words, "
+              f"core {core['bytes'] / 1024:.0f} KB, details {details['bytes'] / 1024:.0f} KB")
+
+def main():
+    source = sys.argv[1] if len(sys.argv) > 1 else VOCABULARY_PATH
+    out_dir = sys.argv[2] if len(sys.argv) > 2 else SHARDS_DIR
+    with open(source, encoding='utf-8') as f:
+        words = json.load(f)["words"]
+    report(write_shards(words, out_dir), out_dir)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,164 @@
+"""
+Compact in-memory word records for the vocabulary build.
+
+A vocabulary word in its JSON shape is a dict of 13 keys with a nested
+`morphology` dict and a nested `pronunciation` dict of strings and lists.
+`Word` keeps only what cannot be derived: the text fields, frequency and
+tier, and small integer codes for part of speech, semantic category and
+gender, interned in module-level `EnumTable`s. The consonantal form and
+pronunciation breakdown are computed from `hebrew` (see hebrew_text.py)
+when the record is read.
+
+Words with TDOT or Vine's articles carry an `articles` list of their
+sources (see dictionary_articles.py), kept as a shared tuple; the key is
+left out for the rest.
+
+Records are read-only Mappings in the JSON key order, so code that reads
+`word["gloss"]` or iterates `word.items()` takes either shape; `to_dict()`
+gives the JSON form for serialization. bench_word_model.py measures the
+memory saved.
+"""
+
+from collections.abc import Mapping
+from typing import Iterator
+
+import hebrew_text
+
+# Keys of the JSON shape, in output order; "articles" follows when a word has any
+FIELDS = (
+    "id", "hebrew", "transliteration", "gloss", "definition", "partOfSpeech", "frequency",
+    "tier", "strongs", "semanticCategory", "morphology", "consonantal", "pronunciation",
+)
+
+class EnumTable:
+    """Interns a small set of strings as integer codes, in first-seen order."""
+
+    def __init__(self, *names: str | None):
+        self.names: list[str | None] = list(names)
+        self.codes: dict[str | None, int] = {name: code for code, name in enumerate(self.names)}
+
+    def code(self, name: str | None) -> int:
+        code = self.codes.get(name)
+        if code is None:
+            code = self.codes[name] = len(self.names)
+            self.names.append(name)
+        return code
+
+    def name(self, code: int) -> str | None:
+        return self.names[code]
+
+POS = EnumTable()
+CATEGORY = EnumTable()
+# Code 0: no gender recorded
+GENDER = EnumTable(None)
+
+class Word(Mapping):
+    """One vocabulary word, stored as slots and enum codes."""
+
+    __slots__ = (
+        "strongs", "hebrew", "transliteration", "gloss", "definition",
+        "frequency", "tier", "pos", "category", "gender", "articles",
+    )
+
+    def __init__(
+        self,
+        strongs: str,
+        hebrew: str,
+        transliteration: str,
+        gloss: str,
+        definition: str,
+        part_of_speech: str,
+        frequency: int,
+        tier: int,
+        semantic_category: str,
+        gender: str | None = None,
+        articles: tuple[str, ...] = (),
+    ):
+        self.strongs = strongs
+        self.hebrew = hebrew
+        self.transliteration = transliteration
+        self.gloss = gloss
+        self.definition = definition
+        self.frequency = frequency
+        self.tier = tier
+        self.pos = POS.code(part_of_speech)
+        self.category = CATEGORY.code(semantic_category)
+        self.gender = GENDER.code(gender)
+        self.articles = articles
+
+    @classmethod
+    def from_dict(cls, word: dict) -> "Word":
+        """Record for a word in JSON shape; raises ValueError if the shape cannot be kept exactly."""
+        try:
+            record = cls(
+                word["strongs"], word["hebrew"], word["transliteration"], word["gloss"], word["definition"],
+                word["partOfSpeech"], word["frequency"], word["tier"], word["semanticCategory"],
+                word["morphology"].get("gender"), tuple(word.get("articles", ())),
+            )
+        except (KeyError, AttributeError) as e:
+            raise ValueError(f"{word.get('id')}: word does not fit the compact model") from e
+        if record.to_dict() != word:
+            raise ValueError(f"{word.get('id')}: word does not fit the compact model")
+        return record
+
+    def to_dict(self) -> dict:
+        """The word in vocabulary.json shape."""
+        word = {
+            "id": self.strongs,
+            "hebrew": self.hebrew,
+            "transliteration": self.transliteration,
+            "gloss": self.gloss,
+            "definition": self.definition,
+            "partOfSpeech": POS.name(self.pos),
+            "frequency": self.frequency,
+            "tier": self.tier,
+            "strongs": self.strongs,
+            "semanticCategory": CATEGORY.name(self.category),
+            "morphology": self["morphology"],
+            **hebrew_text.pronunciation_fields(self.hebrew),
+        }
+        if self.articles:
+            word["articles"] = list(self.articles)
+        return word
+
+    def __getitem__(self, key: str):
+        if key in ("id", "strongs"):
+            return self.strongs
+        if key in ("hebrew", "transliteration", "gloss", "definition", "frequency", "tier"):
+            return getattr(self, key)
+        if key == "partOfSpeech":
+            return POS.name(self.pos)
+        if key == "semanticCategory":
+            return CATEGORY.name(self.category)
+        if key == "morphology":
+            gender = GENDER.name(self.gender)
+            return {"gender": gender} if gender is not None else {}
+        if key in ("consonantal", "pronunciation"):
+            return hebrew_text.pronunciation_fields(self.hebrew)[key]
+        if key == "articles" and self.articles:
+            return list(self.articles)
+        raise KeyError(key)
+
+    def __iter__(self) -> Iterator[str]:
+        yield from FIELDS
+        if self.articles:
+            yield "articles"
+
+    def __len__(self) -> int:
+        return len(FIELDS) + bool(self.articles)
+
+    def __reduce__(self):
+        # Codes are only meaningful within one process; pickle the names so
+        # records from pool workers are re-interned in the parent
+        return Word, (
+            self.strongs, self.hebrew, self.transliteration, self.gloss, self.definition,
+            POS.name(self.pos), self.frequency, self.tier, CATEGORY.name(self.category), GENDER.name(self.gender),
+            self.articles,
+        )
+
+    def __repr__(self) -> str:
+        return f"Word({self.strongs!r})"
+
+def as_dict(word: Mapping) -> dict:
+    """A word in JSON shape, whether it is a record or already a dict."""
+    return word.to_dict() if isinstance(word, Word) else word
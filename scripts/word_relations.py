@@ -0,0 +1,241 @@
+#!/usr/bin/env python3
+"""
+Precompute word relations for the word detail screen.
+
+Reproduces the rules of src/lib/wordRelations.ts offline, for every word:
+    similarMeaning    gloss tokens that contain, or are contained in, this word's tokens
+    sameCategory      same part of speech within one tier, most frequent first
+    relatedRoot       the word's root family (see root_families.py), nearest
+                      Strong's numbers first; for words in no family, the
+                      nearest Strong's numbers within +/-50
+    similarFrequency  closest frequency
+
+Ties are broken by position in vocabulary.json, like the stable sorts in
+the TypeScript version. Gloss matching uses an inverted index from tokens
+and their substrings to word positions, rather than comparing every pair
+of words. src/lib/wordRelations.ts still picks relatedRoot by Strong's
+numbers alone, so the two agree only for words without a family.
+
+The artifact stores an `ids` array and, per relation, a list of neighbour
+positions into it for each word:
+    {"version": 2, "k": 5, "ids": [...], "similarMeaning": [[3, 17, ...], ...], ...}
+
+Run standalone to build relations for an existing vocabulary.json and the
+root-families.json built with it:
+    python scripts/word_relations.py [vocabulary.json] [relations.json] [root-families.json]
+"""
+
+import bisect
+import heapq
+import json
+import os
+import re
+import sys
+from collections import Counter, defaultdict
+from itertools import chain
+
+from build_io import PUBLIC_DATA_DIR, VOCABULARY_PATH, strongs_number, write_atomic
+from root_families import FAMILIES_PATH
+
+RELATIONS_PATH = os.path.join(PUBLIC_DATA_DIR, "relations.json")
+
+# 2: relatedRoot comes from root families where a word has one
+RELATIONS_VERSION = 2
+DEFAULT_K = 5
+ROOT_RANGE = 50
+
+TOKEN_SPLIT_RE = re.compile(r'[,;\s]+')
+
+def gloss_tokens(gloss: str) -> list[str]:
+    """Same as `gloss.toLowerCase().split(/[,;\\s]+/)`."""
+    return TOKEN_SPLIT_RE.split(gloss.lower())
+
+def substrings(text: str, min_length: int = 0) -> set[str]:
+    return {text[i:j] for i in range(len(text) + 1) for j in range(i + max(min_length, 0), len(text) + 1)}
+
+def to_mask(positions: set[int]) -> int:
+    """Bitmask with bit `p` set for every position."""
+    bits = bytearray(max(positions, default=0) // 8 + 1)
+    for p in positions:
+        bits[p >> 3] |= 1 << (p & 7)
+    return int.from_bytes(bits, 'little')
+
+def lowest_bits(mask: int, count: int) -> list[int]:
+    """Positions of the `count` lowest set bits."""
+    out = []
+    while mask and len(out) < count:
+        low = mask & -mask
+        out.append(low.bit_length() - 1)
+        mask ^= low
+    return out
+
+def similar_meaning(words: list[dict], k: int) -> list[list[int]]:
+    tokens = [gloss_tokens(w["gloss"]) for w in words]
+
+    # Exact token -> positions, for "gloss word contains their token"
+    exact = defaultdict(set)
+    # Substring (3+ chars) -> positions, for "their token contains gloss word"
+    containing = defaultdict(set)
+    for pos, word_tokens in enumerate(tokens):
+        for token in word_tokens:
+            exact[token].add(pos)
+            for sub in substrings(token, 3):
+                containing[sub].add(pos)
+
+    exact_masks: dict[str, int] = {}
+    matches_cache: dict[str, int] = {}
+
+    def matching(gloss_word: str) -> int:
+        """Bitmask of words with a token containing, or contained in, `gloss_word`."""
+        if gloss_word not in matches_cache:
+            found = to_mask(containing.get(gloss_word, set()))
+            for sub in substrings(gloss_word):
+                if sub in exact:
+                    if sub not in exact_masks:
+                        exact_masks[sub] = to_mask(exact[sub])
+                    found |= exact_masks[sub]
+            matches_cache[gloss_word] = found
+        return matches_cache[gloss_word]
+
+    result = []
+    for pos, word_tokens in enumerate(tokens):
+        # Score = number of this word's gloss words (3+ chars, repeats counted) a candidate matches.
+        # Candidates are bucketed by score with bitmask set operations.
+        levels: dict[int, int] = {}
+        seen = 0
+        for gloss_word, weight in Counter(t for t in word_tokens if len(t) > 2).items():
+            matched = matching(gloss_word)
+            refined: dict[int, int] = {}
+            for score, cell in levels.items():
+                if cell & matched:
+                    refined[score + weight] = refined.get(score + weight, 0) | (cell & matched)
+                if cell & ~matched:
+                    refined[score] = refined.get(score, 0) | (cell & ~matched)
+            if matched & ~seen:
+                refined[weight] = refined.get(weight, 0) | (matched & ~seen)
+            seen |= matched
+            levels = refined
+
+        # Highest score first, earliest position first among ties
+        neighbours = []
+        for score in sorted(levels, reverse=True):
+            neighbours += lowest_bits(levels[score] & ~(1 << pos), k - len(neighbours))
+            if len(neighbours) >= k:
+                break
+        result.append(neighbours)
+    return result
+
+def same_category(words: list[dict], k: int) -> list[list[int]]:
+    by_group = defaultdict(list)
+    for pos, word in enumerate(words):
+        by_group[(word["partOfSpeech"], word["tier"])].append(pos)
+
+    window_cache = {}
+    result = []
+    for pos, word in enumerate(words):
+        key = (word["partOfSpeech"], word["tier"])
+        if key not in window_cache:
+            candidates = chain.from_iterable(by_group.get((key[0], t), ()) for t in (key[1] - 1, key[1], key[1] + 1))
+            # One spare in case the word itself is among the best
+            window_cache[key] = heapq.nsmallest(k + 1, ((-words[p]["frequency"], p) for p in candidates))
+        result.append([p for _, p in window_cache[key] if p != pos][:k])
+    return result
+
+def related_root(words: list[dict], k: int, families: dict | None = None) -> list[list[int]]:
+    """Each word's root family, nearest Strong's numbers first; Strong's neighbours if it has none."""
+    family = families["family"] if families is not None else [-1] * len(words)
+    by_prefix = defaultdict(list)
+    for pos, word in enumerate(words):
+        by_prefix[word["strongs"][:1]].append((strongs_number(word["strongs"]), pos))
+    for entries in by_prefix.values():
+        entries.sort()
+
+    result = []
+    for pos, word in enumerate(words):
+        entries = by_prefix[word["strongs"][:1]]
+        number = strongs_number(word["strongs"])
+        if family[pos] >= 0:
+            relatives = families["families"][family[pos]]
+            candidates = [(abs(strongs_number(words[p]["strongs"]) - number), p) for p in relatives if p != pos]
+        else:
+            lo = bisect.bisect_left(entries, (number - ROOT_RANGE, -1))
+            hi = bisect.bisect_right(entries, (number + ROOT_RANGE, len(words)))
+            candidates = [(abs(n - number), p) for n, p in entries[lo:hi] if n != number]
+        result.append([p for _, p in heapq.nsmallest(k, candidates)])
+    return result
+
+def similar_frequency(words: list[dict], k: int) -> list[list[int]]:
+    by_frequency = defaultdict(list)
+    for pos, word in enumerate(words):
+        by_frequency[word["frequency"]].append(pos)
+    frequencies = sorted(by_frequency)
+    index_of = {f: i for i, f in enumerate(frequencies)}
+
+    cache = {}
+    result = []
+    for pos, word in enumerate(words):
+        frequency = word["frequency"]
+        if frequency not in cache:
+            # Walk outwards over distinct frequencies until k+1 words are collected
+            picked = []
+            lo = hi = index_of[frequency]
+            picked.extend((0, p) for p in by_frequency[frequency][:k + 1])
+            while len(picked) < k + 1 and (lo > 0 or hi < len(frequencies) - 1):
+                down = frequency - frequencies[lo - 1] if lo > 0 else None
+                up = frequencies[hi + 1] - frequency if hi < len(frequencies) - 1 else None
+                diff = min(d for d in (down, up) if d is not None)
+                group = []
+                if down == diff:
+                    lo -= 1
+                    group += by_frequency[frequencies[lo]]
+                if up == diff:
+                    hi += 1
+                    group += by_frequency[frequencies[hi]]
+                picked.extend((diff, p) for p in sorted(group)[:k + 1])
+            cache[frequency] = sorted(picked)[:k + 1]
+        result.append([p for _, p in cache[frequency] if p != pos][:k])
+    return result
+
+def build_relations(words: list[dict], k: int = DEFAULT_K, families: dict | None = None) -> dict:
+    """All four relations; `families` is the root families of the same `words`, if built."""
+    ids = [w["id"] for w in words]
+    if families is not None and families["ids"] != ids:
+        raise ValueError("root families were built for a different word list")
+    return {
+        "version": RELATIONS_VERSION,
+        "k": k,
+        "ids": ids,
+        "similarMeaning": similar_meaning(words, k),
+        "sameCategory": same_category(words, k),
+        "relatedRoot": related_root(words, k, families),
+        "similarFrequency": similar_frequency(words, k),
+    }
+
+def write_relations(
+    words: list[dict],
+    path: str = RELATIONS_PATH,
+    k: int = DEFAULT_K,
+    families: dict | None = None,
+) -> int:
+    """Build and write the relations artifact; returns its size in bytes."""
+    data = json.dumps(build_relations(words, k, families), separators=(',', ':')).encode('utf-8')
+    write_atomic(path, data)
+    return len(data)
+
+def main():
+    source = sys.argv[1] if len(sys.argv) > 1 else VOCABULARY_PATH
+    target = sys.argv[2] if len(sys.argv) > 2 else RELATIONS_PATH
+    families_path = sys.argv[3] if len(sys.argv) > 3 else FAMILIES_PATH
+    with open(source, encoding='utf-8') as f:
+        words = json.load(f)["words"]
+    families = None
+    if os.path.exists(families_path):
+        with open(families_path, encoding='utf-8') as f:
+            families = json.load(f)
+    else:
+        print(f"  Warning: No root families at {families_path}; relatedRoot falls back to Strong's numbers")
+    size = write_relations(words, target, families=families)
+    print(f"Wrote relations for {len(words)} words ({size / 1024:.0f} KB) to {target}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,83 @@
+/**
+ * Tests for the Hebrew text helpers against their build-time counterparts
+ *
+ * The vocabulary build precomputes normalizeHebrew, toAcademicTransliteration,
+ * toSimpleTransliteration and syllabify in Python (scripts/hebrew_text.py).
+ * scripts/tests/data/hebrew-golden.json records what the functions below
+ * return for every distinct lemma, and the Python tests check the port
+ * against it. Regenerate it after changing hebrew.ts with:
+ *
+ *   UPDATE_HEBREW_GOLDEN=1 npx jest hebrewGolden
+ */
+
+import fs from 'fs';
+import path from 'path';
+
+import {
+  normalizeHebrew,
+  toAcademicTransliteration,
+  toSimpleTransliteration,
+  syllabify,
+  getPronunciationBreakdown,
+} from '@/lib/hebrew';
+import vocabularyData from '@/data/vocabulary.json';
+
+type GoldenEntry = [string, string, string, string[]];
+
+const GOLDEN_PATH = path.join(__dirname, '..', '..', 'scripts', 'tests', 'data', 'hebrew-golden.json');
+
+interface PrecomputedWord {
+  hebrew: string;
+  consonantal?: string;
+  pronunciation?: {
+    academic: string;
+    simple: string;
+    syllables: string[];
+    syllablePronunciations: string[];
+  };
+}
+
+const words = (vocabularyData as { words: PrecomputedWord[] }).words;
+
+function compute(hebrew: string): GoldenEntry {
+  return [
+    normalizeHebrew(hebrew),
+    toAcademicTransliteration(hebrew),
+    toSimpleTransliteration(hebrew),
+    syllabify(hebrew),
+  ];
+}
+
+describe('Hebrew golden outputs', () => {
+  if (process.env.UPDATE_HEBREW_GOLDEN) {
+    it('should regenerate the golden file', () => {
+      const forms = [...new Set(words.map((w) => w.hebrew))].sort();
+      const lines = forms.map((form) => `${JSON.stringify(form)}:${JSON.stringify(compute(form))}`);
+      fs.writeFileSync(GOLDEN_PATH, `{${lines.join(',\n')}}\n`, 'utf-8');
+    });
+    return;
+  }
+
+  const golden: Record<string, GoldenEntry> = JSON.parse(fs.readFileSync(GOLDEN_PATH, 'utf-8'));
+
+  it('should match every recorded lemma', () => {
+    const mismatched = Object.entries(golden)
+      .filter(([hebrew, expected]) => JSON.stringify(compute(hebrew)) !== JSON.stringify(expected))
+      .map(([hebrew]) => hebrew);
+
+    expect(mismatched).toEqual([]);
+  });
+
+  it('should match the fields precomputed by the vocabulary build', () => {
+    const mismatched = words
+      .filter((w) => w.pronunciation !== undefined)
+      .filter((w) => {
+        const { hebrew, ...breakdown } = getPronunciationBreakdown(w.hebrew);
+        return w.consonantal !== normalizeHebrew(hebrew) ||
+          JSON.stringify(w.pronunciation) !== JSON.stringify(breakdown);
+      })
+      .map((w) => w.hebrew);
+
+    expect(mismatched).toEqual([]);
+  });
+});
@@ -47,6 +47,17 @@ export interface VocabularyWord {
   morphology?: WordMorphology;
   semanticCategory?: SemanticCategory;
   categories?: SemanticCategory[]; // Allow multiple categories
+  consonantal?: string;               // normalizeHebrew(hebrew), precomputed at build time
+  pronunciation?: WordPronunciation;  // getPronunciationBreakdown(hebrew), precomputed at build time
+  articles?: ('tdot' | 'vine')[];      // dictionaries with an article on this word (public/data/articles)
+}
+
+// Pronunciation fields the vocabulary build precomputes (see src/lib/hebrew.ts)
+export interface WordPronunciation {
+  academic: string;
+  simple: string;
+  syllables: string[];
+  syllablePronunciations: string[];
 }
 
 // Morphology Types for Hebrew Words
@@ -128,6 +139,7 @@ export interface BibleVerse {
   transliteration: string;
   referenceTranslation: string;
   keyTerms: string[];
+  keyTermIds?: string[][];  // Ranked Strong's ids per key term, resolved at build time
   difficulty: 1 | 2 | 3;
   notes?: string;
   tier?: number;    // Optional tier for filtering